@@ -0,0 +1,154 @@
+"""
+Benchmarks for building TradingCalendars.
+
+Every calendar in ``_default_calendar_factories`` is constructed over spans of
+several lengths ending at the default end date, with the on-disk schedule
+cache disabled so that the rules are evaluated each time.
+
+The holiday dates and rule sets computed for a calendar class are cached for
+the life of the process, so only the first calendar built in a process pays
+for evaluating its rules. ``Construction`` clears those caches before every
+sample and times that first, cold construction; ``WarmConstruction`` times
+building further calendars of a class that has already been built.
+"""
+from itertools import chain
+
+import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar
+
+from trading_calendars import get_schedule_cache, set_schedule_cache
+from trading_calendars.calendar_utils import _default_calendar_factories
+from trading_calendars.holiday_cache import clear_holiday_cache
+from trading_calendars.trading_calendar import end_default
+from trading_calendars.utils.memoize import classlazyval
+
+
+def clear_rule_caches(cls):
+    """
+    Forget every holiday date and rule set computed for the calendar class
+    ``cls``, so that the next calendar built evaluates its rules again.
+    """
+    clear_holiday_cache()
+
+    # Drop the holidays memoized by each HolidayCalendar of the class, which
+    # may be module-level objects shared with other classes.
+    calendar = cls.__new__(cls)
+    holiday_calendars = [calendar.regular_holidays]
+    for _, holiday_calendar in chain(
+        calendar.special_opens,
+        calendar.special_closes,
+    ):
+        holiday_calendars.append(holiday_calendar)
+    for holiday_calendar in holiday_calendars:
+        if isinstance(holiday_calendar, AbstractHolidayCalendar):
+            holiday_calendar._cache = None
+
+    for klass in cls.__mro__:
+        for attr in vars(klass).values():
+            if isinstance(attr, classlazyval) and cls in attr:
+                del attr[cls]
+
+
+class Construction(object):
+    """
+    Time the first ``TradingCalendar.__init__`` of each default calendar in a
+    process.
+    """
+    params = (sorted(_default_calendar_factories), [1, 10, 30])
+    param_names = ['calendar', 'years']
+    timeout = 120
+
+    # The rule caches are cleared before each sample, so each sample must
+    # build exactly one calendar.
+    number = 1
+    repeat = 10
+    warmup_time = 0
+
+    def setup(self, name, years):
+        self.factory = _default_calendar_factories[name]
+        self.start = (end_default - pd.DateOffset(years=years)).normalize()
+        self.end = end_default
+
+        self._cache = get_schedule_cache()
+        set_schedule_cache(None)
+
+        clear_rule_caches(self.factory)
+
+    def teardown(self, name, years):
+        set_schedule_cache(self._cache)
+
+    def time_construct(self, name, years):
+        self.factory(start=self.start, end=self.end)
+
+
+class WarmConstruction(Construction):
+    """
+    Time ``TradingCalendar.__init__`` for each default calendar once a
+    calendar of the same class has been built.
+    """
+    number = 0
+    repeat = 0
+    warmup_time = -1
+
+    def setup(self, name, years):
+        super(WarmConstruction, self).setup(name, years)
+        self.factory(start=self.start, end=self.end)
+
+
+class AllMinutes(object):
+    """
+    Time materializing ``all_minutes`` on a freshly built calendar.
+    """
+    params = (['XNYS', 'XCME', '24/7'], [1, 10, 30])
+    param_names = ['calendar', 'years']
+    timeout = 120
+
+    # all_minutes is computed once per instance, so each sample needs a new
+    # calendar and there must be no warm-up call.
+    number = 1
+    repeat = 10
+    warmup_time = 0
+
+    def setup(self, name, years):
+        factory = _default_calendar_factories[name]
+        self.calendar = factory(
+            start=(end_default - pd.DateOffset(years=years)).normalize(),
+            end=end_default,
+        )
+
+    def time_all_minutes(self, name, years):
+        self.calendar.all_minutes
+
+
+class HolidayRules(object):
+    """
+    Time deriving the holidays of each default calendar from its rule sets,
+    as the first construction of the calendar in a process does.
+    """
+    params = sorted(_default_calendar_factories)
+    param_names = ['calendar']
+
+    # The rule caches are cleared before each sample, so each sample must
+    # evaluate the rules exactly once.
+    number = 1
+    repeat = 10
+    warmup_time = 0
+
+    start = (end_default - pd.DateOffset(years=30)).normalize()
+    end = end_default
+
+    def setup(self, name):
+        factory = _default_calendar_factories[name]
+        self.calendar = factory(start=self.start, end=self.end)
+        clear_rule_caches(factory)
+
+        # Build the rule sets outside of the timed region.
+        self.regular_holidays = self.calendar.regular_holidays
+        self.calendar.special_closes
+
+    def time_regular_holidays(self, name):
+        if self.regular_holidays is not None:
+            self.regular_holidays.holidays(self.start, self.end)
+
+    def time_special_closes(self, name):
+        self.calendar._calculate_special_closes(self.start, self.end)
@@ -0,0 +1,172 @@
+"""
+Benchmarks for TradingCalendar lookups.
+
+These follow the airspeed velocity (asv) conventions: each ``time_*`` method
+is timed after ``setup`` has run for the given parameters.
+"""
+import numpy as np
+import pandas as pd
+
+from trading_calendars import get_calendar
+
+
+class BoxedVersusNanosLookups(object):
+    """
+    Compare the Timestamp lookups with their nanosecond-native counterparts.
+    """
+    params = ['XNYS', '24/7']
+    param_names = ['calendar']
+
+    def setup(self, name):
+        self.calendar = calendar = get_calendar(name)
+
+        session = calendar.all_sessions[len(calendar.all_sessions) // 2]
+        self.dt = calendar.minutes_for_session(session)[30]
+        self.dt_ns = self.dt.value
+
+    def time_next_open(self, name):
+        self.calendar.next_open(self.dt)
+
+    def time_next_open_ns(self, name):
+        self.calendar.next_open_ns(self.dt_ns)
+
+    def time_next_close(self, name):
+        self.calendar.next_close(self.dt)
+
+    def time_next_close_ns(self, name):
+        self.calendar.next_close_ns(self.dt_ns)
+
+    def time_previous_open(self, name):
+        self.calendar.previous_open(self.dt)
+
+    def time_previous_open_ns(self, name):
+        self.calendar.previous_open_ns(self.dt_ns)
+
+    def time_previous_close(self, name):
+        self.calendar.previous_close(self.dt)
+
+    def time_previous_close_ns(self, name):
+        self.calendar.previous_close_ns(self.dt_ns)
+
+    def time_next_minute(self, name):
+        self.calendar.next_minute(self.dt)
+
+    def time_next_minute_ns(self, name):
+        self.calendar.next_minute_ns(self.dt_ns)
+
+    def time_previous_minute(self, name):
+        self.calendar.previous_minute(self.dt)
+
+    def time_previous_minute_ns(self, name):
+        self.calendar.previous_minute_ns(self.dt_ns)
+
+
+class ScalarLookups(object):
+    """
+    Time the scalar lookups that are called once per bar.
+    """
+    params = ['XNYS', 'XCME', '24/7']
+    param_names = ['calendar']
+
+    def setup(self, name):
+        self.calendar = calendar = get_calendar(name)
+
+        sessions = calendar.all_sessions
+        self.session = session = sessions[len(sessions) // 2]
+        self.start_session = sessions[len(sessions) // 2 - 250]
+        self.minutes = calendar.minutes_for_session(session)
+        self.dt = self.minutes[30]
+
+    def time_minute_to_session_label(self, name):
+        # Repeated lookups within one session hit the label cache.
+        self.calendar.minute_to_session_label(self.dt)
+
+    def time_minute_to_session_label_distinct(self, name):
+        minute_to_session_label = self.calendar.minute_to_session_label
+        for dt in self.minutes:
+            minute_to_session_label(dt)
+
+    def time_is_open_on_minute(self, name):
+        self.calendar.is_open_on_minute(self.dt)
+
+    def time_sessions_in_range(self, name):
+        self.calendar.sessions_in_range(self.start_session, self.session)
+
+    def time_minutes_in_range(self, name):
+        self.calendar.minutes_in_range(self.minutes[0], self.minutes[-1])
+
+    def time_minutes_for_session(self, name):
+        self.calendar.minutes_for_session(self.session)
+
+    def time_minutes_window_forward(self, name):
+        self.calendar.minutes_window(self.dt, 390 * 20)
+
+    def time_minutes_window_backward(self, name):
+        self.calendar.minutes_window(self.dt, -390 * 20)
+
+    def time_session_distance(self, name):
+        self.calendar.session_distance(self.start_session, self.session)
+
+    def time_is_session(self, name):
+        self.calendar.is_session(self.session)
+
+    def time_minutes_count_for_sessions_in_range(self, name):
+        self.calendar.minutes_count_for_sessions_in_range(
+            self.start_session,
+            self.session,
+        )
+
+
+class BatchLookups(object):
+    """
+    Time the vectorized lookups over a large array of timestamps.
+    """
+    params = (['XNYS', '24/7'], [10000, 1000000])
+    param_names = ['calendar', 'size']
+
+    def setup(self, name, size):
+        self.calendar = calendar = get_calendar(name)
+
+        # Stay clear of the first and last sessions so that every dt has a
+        # next open and a previous close.
+        first = calendar.market_opens_nanos[1]
+        last = calendar.market_closes_nanos[-2]
+        rand = np.random.RandomState(1)
+        self.dts = pd.DatetimeIndex(
+            np.sort(rand.randint(first, last, size)),
+            tz='UTC',
+        )
+        self.minutes = calendar.all_minutes[
+            np.sort(rand.randint(0, len(calendar.all_minutes), size))
+        ]
+        self.days = self.dts.normalize()
+
+    def time_is_open_on_minutes(self, name, size):
+        self.calendar.is_open_on_minutes(self.dts)
+
+    def time_next_opens(self, name, size):
+        self.calendar.next_opens(self.dts)
+
+    def time_previous_closes(self, name, size):
+        self.calendar.previous_closes(self.dts)
+
+    def time_minutes_to_session_labels(self, name, size):
+        self.calendar.minutes_to_session_labels(self.minutes, direction='none')
+
+    def time_minutes_to_session_labels_previous(self, name, size):
+        self.calendar.minutes_to_session_labels(self.dts, direction='previous')
+
+    def time_minute_index_to_session_labels(self, name, size):
+        self.calendar.minute_index_to_session_labels(self.minutes)
+
+    def time_are_sessions(self, name, size):
+        self.calendar.are_sessions(self.days)
+
+    def time_session_distances(self, name, size):
+        self.calendar.session_distances(self.days, self.days[::-1])
+
+    def time_minutes_counts_for_sessions_in_range(self, name, size):
+        self.calendar.minutes_counts_for_sessions_in_range(
+            self.days,
+            self.days[::-1],
+        )
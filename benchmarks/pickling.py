@@ -0,0 +1,44 @@
+"""
+Benchmarks for pickling TradingCalendars.
+
+``TradingCalendar.__reduce__`` pickles only the packed schedule arrays. The
+``*_schedule`` benchmarks pickle the ``schedule`` DataFrame instead, which is
+what pickling a calendar's instance dictionary used to carry, for comparison.
+"""
+import pickle
+
+from trading_calendars import get_calendar
+
+
+class Pickling(object):
+    params = ['XNYS', 'XCME', '24/7']
+    param_names = ['calendar']
+
+    def setup(self, name):
+        self.calendar = calendar = get_calendar(name)
+        self.pickled = pickle.dumps(calendar, pickle.HIGHEST_PROTOCOL)
+        self.pickled_schedule = pickle.dumps(
+            calendar.schedule,
+            pickle.HIGHEST_PROTOCOL,
+        )
+
+    def time_dumps(self, name):
+        pickle.dumps(self.calendar, pickle.HIGHEST_PROTOCOL)
+
+    def time_loads(self, name):
+        pickle.loads(self.pickled)
+
+    def time_dumps_schedule(self, name):
+        pickle.dumps(self.calendar.schedule, pickle.HIGHEST_PROTOCOL)
+
+    def time_loads_schedule(self, name):
+        pickle.loads(self.pickled_schedule)
+
+    def track_pickled_size(self, name):
+        return len(self.pickled)
+
+    def track_pickled_schedule_size(self, name):
+        return len(self.pickled_schedule)
+
+    track_pickled_size.unit = 'bytes'
+    track_pickled_schedule_size.unit = 'bytes'
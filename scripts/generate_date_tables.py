@@ -0,0 +1,121 @@
+"""
+Regenerate trading_calendars/extensions/date_tables.py.
+
+The lunar festivals come from ``lunardate`` and the equinoxes and solstices
+from ``ephem``; both are only needed to run this script. Run it from the
+repository root:
+
+    python scripts/generate_date_tables.py \
+        [--first-year 1900] [--last-year 2099]
+
+``lunardate`` covers the years 1900 through 2099.
+"""
+from __future__ import print_function
+
+import argparse
+from datetime import datetime
+import os
+
+import ephem
+from lunardate import LunarDate
+
+OUTPUT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'trading_calendars',
+    'extensions',
+    'date_tables.py',
+)
+
+
+def _lunar(month, day):
+    def solar_date(year):
+        return LunarDate(year, month, day).toSolarDate()
+    return solar_date
+
+
+def _ephem(next_event):
+    def solar_date(year):
+        # The UTC date of the first such event in the year.
+        return next_event(datetime(year, 1, 1)).datetime().date()
+    return solar_date
+
+
+TABLES = [
+    ('LUNAR_NEW_YEAR', 'Lunar New Year, the 1st day of the 1st lunar month.',
+     _lunar(1, 1)),
+    ('BUDDHA_BIRTHDAY', "Buddha's Birthday, the 8th day of the 4th lunar "
+     "month.", _lunar(4, 8)),
+    ('DRAGON_BOAT_FESTIVAL', 'The Dragon Boat Festival, the 5th day of the '
+     '5th lunar month.', _lunar(5, 5)),
+    ('MID_AUTUMN_FESTIVAL', 'The Mid-Autumn Festival, the 15th day of the '
+     '8th lunar month.', _lunar(8, 15)),
+    ('DOUBLE_NINE_FESTIVAL', 'The Double Nine Festival, the 9th day of the '
+     '9th lunar month.', _lunar(9, 9)),
+    ('VERNAL_EQUINOX', 'The March equinox.',
+     _ephem(ephem.next_vernal_equinox)),
+    ('SUMMER_SOLSTICE', 'The June solstice.',
+     _ephem(ephem.next_summer_solstice)),
+]
+
+HEADER = '''\
+# -*- coding: utf-8 -*-
+"""
+Dates of the lunar festivals, equinoxes and solstices for the years
+FIRST_YEAR through LAST_YEAR, used by offset_extensions.
+
+Each table holds ``month * 100 + day`` for every year, starting at
+FIRST_YEAR. The equinoxes and solstices are UTC dates.
+
+Generated by scripts/generate_date_tables.py. Do not edit by hand.
+"""
+import numpy as np
+
+FIRST_YEAR = {first_year}
+LAST_YEAR = {last_year}
+'''
+
+PER_LINE = 10
+
+
+def render(first_year, last_year):
+    lines = [HEADER.format(first_year=first_year, last_year=last_year)]
+    years = range(first_year, last_year + 1)
+    for name, doc, solar_date in TABLES:
+        values = []
+        for year in years:
+            dt = solar_date(year)
+            if dt.year != year:
+                raise ValueError(
+                    '%s falls outside of %d: %s' % (name, year, dt),
+                )
+            values.append(dt.month * 100 + dt.day)
+
+        lines.append('')
+        lines.append('# ' + doc)
+        lines.append('%s = np.array([' % name)
+        for start in range(0, len(values), PER_LINE):
+            chunk = values[start:start + PER_LINE]
+            lines.append(
+                '    %s,  # %d' % (
+                    ', '.join('%4d' % v for v in chunk),
+                    first_year + start,
+                ),
+            )
+        lines.append('], dtype=np.int16)')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--first-year', type=int, default=1900)
+    parser.add_argument('--last-year', type=int, default=2099)
+    parser.add_argument('--output', default=OUTPUT)
+    args = parser.parse_args()
+
+    with open(args.output, 'w') as f:
+        f.write(render(args.first_year, args.last_year))
+    print('Wrote %s' % args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, skipIf
+
+import numpy as np
+
+from trading_calendars import get_calendar
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+else:
+    from trading_calendars.arrow import (
+        from_arrow,
+        read_parquet,
+        to_arrow,
+        write_parquet,
+    )
+
+
+@skipIf(pyarrow is None, 'requires pyarrow')
+class ArrowTestCase(TestCase):
+
+    names = ['XNYS', 'XJPX', 'IFEU']
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendars = [get_calendar(name) for name in cls.names]
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def assert_calendars_equal(self, result):
+        self.assertEqual(sorted(result), sorted(self.names))
+        for expected in self.calendars:
+            calendar = result[expected.name]
+            self.assertIs(type(calendar), type(expected))
+            self.assertTrue(calendar.schedule.equals(expected.schedule))
+            self.assertTrue(calendar.all_minutes.equals(expected.all_minutes))
+            self.assertTrue(
+                calendar.early_closes.equals(expected.early_closes),
+            )
+            np.testing.assert_array_equal(
+                calendar.break_starts_nanos,
+                expected.break_starts_nanos,
+            )
+            np.testing.assert_array_equal(
+                calendar.break_ends_nanos,
+                expected.break_ends_nanos,
+            )
+
+    def test_arrow_round_trip(self):
+        self.assert_calendars_equal(from_arrow(to_arrow(self.calendars)))
+
+    def test_parquet_round_trip(self):
+        path = os.path.join(self.root, 'calendars.parquet')
+        write_parquet(self.calendars, path)
+        self.assert_calendars_equal(read_parquet(path))
+
+    def test_parquet_microseconds(self):
+        # Older Parquet format versions store microseconds.
+        path = os.path.join(self.root, 'calendars.parquet')
+        write_parquet(self.calendars, path, version='2.4')
+        self.assertEqual(
+            pyarrow.parquet.read_schema(path).field('session').type,
+            pyarrow.timestamp('us', tz='UTC'),
+        )
+        self.assert_calendars_equal(read_parquet(path))
+
+    def test_breaks_are_null(self):
+        table = to_arrow(self.calendars)
+        expected = np.concatenate([
+            calendar.break_starts_nanos == np.iinfo(np.int64).min
+            for calendar in self.calendars
+        ])
+        self.assertTrue(expected.any())
+        self.assertFalse(expected.all())
+        for name in ('break_start', 'break_end'):
+            np.testing.assert_array_equal(
+                np.asarray(table.column(name).is_null()),
+                expected,
+            )
@@ -0,0 +1,179 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from trading_calendars.calendar_combinations import (
+    CalendarCombination,
+    CalendarIntersection,
+    CalendarUnion,
+)
+from trading_calendars.exchange_calendar_xjpx import XJPXExchangeCalendar
+from trading_calendars.exchange_calendar_xnym import XNYMExchangeCalendar
+from trading_calendars.exchange_calendar_xnys import XNYSExchangeCalendar
+from trading_calendars.exchange_calendar_xtse import XTSEExchangeCalendar
+
+NANOS_IN_MINUTE = 60 * 10 ** 9
+
+
+class CalendarCombinationTestCase(TestCase):
+    """
+    Checks combinations against brute force over the calendars' minutes.
+    """
+    start = pd.Timestamp('2018-11-01', tz='UTC')
+    end = pd.Timestamp('2019-03-01', tz='UTC')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.xnys = XNYSExchangeCalendar(cls.start, cls.end)
+        cls.xtse = XTSEExchangeCalendar(cls.start, cls.end)
+        cls.xnym = XNYMExchangeCalendar(cls.start, cls.end)
+        cls.xjpx = XJPXExchangeCalendar(cls.start, cls.end)
+
+    def combinations(self):
+        for calendars in (
+            (self.xnys, self.xtse),
+            (self.xnys, self.xnym),
+            (self.xnys, self.xtse, self.xnym),
+        ):
+            yield CalendarIntersection(calendars), calendars
+            yield CalendarUnion(calendars), calendars
+        # XJPX's breaks leave gaps within its sessions.
+        calendars = (self.xnys, self.xjpx)
+        yield CalendarUnion(calendars), calendars
+
+    def expected_minutes(self, combination, calendars):
+        minutes = [c.all_minutes.asi8 for c in calendars]
+        if isinstance(combination, CalendarIntersection):
+            combine = np.intersect1d
+        else:
+            combine = np.union1d
+        result = minutes[0]
+        for other in minutes[1:]:
+            result = combine(result, other)
+        return result
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            CalendarCombination([self.xnys])
+
+    def test_minutes(self):
+        for combination, calendars in self.combinations():
+            expected = self.expected_minutes(combination, calendars)
+            np.testing.assert_array_equal(
+                combination.all_minutes.asi8,
+                expected,
+            )
+
+            # The intervals are the runs of consecutive minutes.
+            gaps = np.flatnonzero(np.diff(expected) != NANOS_IN_MINUTE)
+            np.testing.assert_array_equal(
+                combination.market_opens_nanos,
+                expected[np.concatenate([[0], gaps + 1])],
+            )
+            np.testing.assert_array_equal(
+                combination.market_closes_nanos,
+                expected[np.concatenate([gaps, [len(expected) - 1]])],
+            )
+
+    def test_lookups(self):
+        rng = np.random.RandomState(0)
+        for combination, calendars in self.combinations():
+            minutes = self.expected_minutes(combination, calendars)
+            opens = combination.market_opens_nanos
+            closes = combination.market_closes_nanos
+
+            dts = np.concatenate([
+                rng.randint(opens[0] + 1, closes[-1], 200),
+                opens[1:-1:7] - NANOS_IN_MINUTE,
+                opens[1:-1:7],
+                closes[1:-1:7],
+                closes[1:-1:7] + NANOS_IN_MINUTE,
+            ])
+            dts = dts[(dts > closes[0]) & (dts < opens[-1])]
+            interval_idxs = np.searchsorted(closes, dts)
+            expected_open = opens[interval_idxs] <= dts
+            for dt_value, is_open in zip(dts, expected_open):
+                dt = pd.Timestamp(dt_value, tz='UTC')
+                self.assertEqual(combination.is_open_on_minute(dt), is_open)
+                self.assertEqual(
+                    combination.next_open(dt).value,
+                    opens[opens > dt_value][0],
+                )
+                self.assertEqual(
+                    combination.next_close(dt).value,
+                    closes[closes > dt_value][0],
+                )
+                self.assertEqual(
+                    combination.previous_open(dt).value,
+                    opens[opens < dt_value][-1],
+                )
+                self.assertEqual(
+                    combination.previous_close(dt).value,
+                    closes[closes < dt_value][-1],
+                )
+                self.assertEqual(
+                    combination.next_minute(dt).value,
+                    minutes[minutes > dt_value][0],
+                )
+                self.assertEqual(
+                    combination.previous_minute(dt).value,
+                    minutes[minutes < dt_value][-1],
+                )
+
+            np.testing.assert_array_equal(
+                combination.is_open_on_minutes(
+                    pd.DatetimeIndex(dts, tz='UTC'),
+                ),
+                expected_open,
+            )
+            dts = pd.DatetimeIndex(np.sort(dts), tz='UTC')
+            start, end = dts[10], dts[-10]
+            np.testing.assert_array_equal(
+                combination.minutes_in_range(start, end).asi8,
+                minutes[(minutes >= start.value) & (minutes <= end.value)],
+            )
+
+    def test_sessions(self):
+        for combination, calendars in self.combinations():
+            minutes = self.expected_minutes(combination, calendars)
+            labels = calendars[0].all_sessions
+            for calendar in calendars[1:]:
+                if isinstance(combination, CalendarIntersection):
+                    labels = labels.intersection(calendar.all_sessions)
+                else:
+                    labels = labels.union(calendar.all_sessions)
+
+            if isinstance(combination, CalendarIntersection):
+                # Only labels on whose sessions the calendars are open
+                # together.
+                def shared(label):
+                    in_sessions = np.ones(len(minutes), dtype=bool)
+                    for calendar in calendars:
+                        open_, close = calendar.open_and_close_for_session(
+                            label,
+                        )
+                        in_sessions &= (minutes >= open_.value) & \
+                            (minutes <= close.value)
+                    return in_sessions.any()
+
+                labels = labels[[shared(label) for label in labels]]
+
+            self.assertTrue(combination.all_sessions.equals(labels))
+
+    def test_intersection_without_shared_minutes(self):
+        # XJPX is never open at the same time as XNYS and XTSE.
+        intersection = CalendarIntersection(
+            [self.xnys, self.xtse, self.xjpx],
+        )
+        self.assertEqual(len(intersection.all_minutes), 0)
+        self.assertEqual(len(intersection.all_sessions), 0)
+
+    def test_past_last_interval(self):
+        for combination, _ in self.combinations():
+            last = combination.closes[-1]
+            for method in ('next_open', 'next_close', 'next_minute'):
+                with self.assertRaises(ValueError):
+                    getattr(combination, method)(last)
+            with self.assertRaises(ValueError):
+                combination.previous_open(combination.opens[0])
@@ -0,0 +1,141 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import tempfile
+from threading import Event, Lock, Thread
+import time
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from trading_calendars.calendar_utils import TradingCalendarDispatcher
+from trading_calendars.exchange_calendar_xjpx import XJPXExchangeCalendar
+from trading_calendars.exchange_calendar_xnys import XNYSExchangeCalendar
+from trading_calendars.schedule_cache import (
+    get_schedule_cache,
+    set_schedule_cache,
+)
+
+
+class GetCalendarTestCase(TestCase):
+
+    def test_concurrent_get_calendar_constructs_once(self):
+        calls = []
+        calls_lock = Lock()
+
+        def factory():
+            with calls_lock:
+                calls.append(None)
+            # Give the other threads time to pile up behind this one.
+            time.sleep(0.1)
+            return XNYSExchangeCalendar(
+                pd.Timestamp('2017-01-01', tz='UTC'),
+                pd.Timestamp('2017-02-01', tz='UTC'),
+            )
+
+        dispatcher = TradingCalendarDispatcher(
+            calendars={},
+            calendar_factories={'XNYS': factory},
+            aliases={'NYSE': 'XNYS'},
+        )
+
+        go = Event()
+        results = [None] * 16
+
+        def get(i):
+            go.wait()
+            results[i] = dispatcher.get_calendar('NYSE' if i % 2 else 'XNYS')
+
+        threads = [Thread(target=get, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        go.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertIsInstance(results[0], XNYSExchangeCalendar)
+        for result in results:
+            self.assertIs(result, results[0])
+        self.assertIs(dispatcher.get_calendar('XNYS'), results[0])
+
+
+class WarmCalendarsTestCase(TestCase):
+
+    calendar_types = {
+        'XNYS': XNYSExchangeCalendar,
+        'XJPX': XJPXExchangeCalendar,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.original_cache = get_schedule_cache()
+        set_schedule_cache(None)
+        cls.expected = {
+            name: calendar_type()
+            for name, calendar_type in cls.calendar_types.items()
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        set_schedule_cache(cls.original_cache)
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.other = object()
+        factories = dict(self.calendar_types, OTHER=lambda: self.other)
+        self.dispatcher = TradingCalendarDispatcher(
+            calendars={},
+            calendar_factories=factories,
+            aliases={'NYSE': 'XNYS'},
+        )
+
+    def tearDown(self):
+        set_schedule_cache(None)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def check_warm_calendars(self, executor=None):
+        result = self.dispatcher.warm_calendars(
+            ['NYSE', 'XJPX', 'OTHER'],
+            executor=executor,
+        )
+        self.assertEqual(sorted(result), ['NYSE', 'OTHER', 'XJPX'])
+        self.assertIs(result['OTHER'], self.other)
+        for name, calendar in (('XNYS', result['NYSE']),
+                               ('XJPX', result['XJPX'])):
+            expected = self.expected[name]
+            self.assertIs(type(calendar), type(expected))
+            self.assertIs(self.dispatcher.get_calendar(name), calendar)
+            self.assertTrue(calendar.schedule.equals(expected.schedule))
+            self.assertTrue(
+                calendar.early_closes.equals(expected.early_closes),
+            )
+            np.testing.assert_array_equal(
+                calendar.break_starts_nanos,
+                expected.break_starts_nanos,
+            )
+            np.testing.assert_array_equal(
+                calendar.break_ends_nanos,
+                expected.break_ends_nanos,
+            )
+
+    def test_warm_calendars(self):
+        self.check_warm_calendars()
+
+    def test_warm_calendars_in_threads(self):
+        with ThreadPoolExecutor(2) as executor:
+            self.check_warm_calendars(executor)
+
+    def test_warm_calendars_with_schedule_cache(self):
+        set_schedule_cache(self.root)
+        self.check_warm_calendars()
+        # The workers saved an entry per calendar.
+        self.assertEqual(len(os.listdir(self.root)), 2)
+
+    def test_warmed_calendars_are_kept(self):
+        calendar = self.dispatcher.get_calendar('XNYS')
+        self.assertIs(
+            self.dispatcher.warm_calendars(['XNYS'])['XNYS'],
+            calendar,
+        )
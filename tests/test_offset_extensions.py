@@ -0,0 +1,49 @@
+from datetime import date, datetime
+from unittest import TestCase, skipIf
+
+from trading_calendars.extensions.offset_extensions import (
+    buddha_birthday,
+    lunar_new_year,
+    summer_solstice,
+    vernal_equinox,
+)
+
+try:
+    import ephem
+except ImportError:
+    ephem = None
+
+
+class LunarDateTestCase(TestCase):
+
+    def test_supported_years(self):
+        self.assertEqual(lunar_new_year(1900), date(1900, 1, 31))
+        self.assertEqual(lunar_new_year(2099), date(2099, 1, 21))
+
+    def test_unsupported_years(self):
+        for year in (1899, 2100, 2150):
+            with self.assertRaisesRegex(ValueError, '1900 through 2099'):
+                lunar_new_year(year)
+            with self.assertRaisesRegex(ValueError, '1900 through 2099'):
+                buddha_birthday(year)
+
+
+class AstronomicalDateTestCase(TestCase):
+
+    def test_table_years(self):
+        self.assertEqual(vernal_equinox(2019), datetime(2019, 3, 20))
+        self.assertEqual(summer_solstice(2019), datetime(2019, 6, 21))
+        self.assertEqual(
+            vernal_equinox(2019, offset=1),
+            datetime(2019, 3, 21),
+        )
+
+    @skipIf(ephem is None, 'requires ephem')
+    def test_years_outside_of_the_tables(self):
+        for year in (1850, 2150):
+            expected = ephem.next_vernal_equinox(datetime(year, 1, 1))
+            expected = expected.datetime()
+            self.assertEqual(
+                vernal_equinox(year),
+                datetime(expected.year, expected.month, expected.day),
+            )
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from trading_calendars.exchange_calendar_ifeu import IFEUExchangeCalendar
+from trading_calendars.exchange_calendar_xmod import XMODExchangeCalendar
+
+
+class ProductGroupTestCase(TestCase):
+    """
+    Calendars whose holidays depend on ``product_group`` must not share the
+    rules of one product group with another.
+    """
+    start = pd.Timestamp('2010-01-01', tz='UTC')
+    end = pd.Timestamp('2016-01-01', tz='UTC')
+
+    def expected(self, calendar_type, product_group):
+        # A new class shares no memoized rules with calendar_type.
+        subclass = type(
+            calendar_type.__name__,
+            (calendar_type,),
+            {'product_group': product_group},
+        )
+        return subclass(self.start, self.end)
+
+    def check_product_groups(self, calendar_type, product_groups):
+        original = calendar_type.product_group
+        schedules = []
+        try:
+            for product_group in product_groups:
+                calendar_type.product_group = product_group
+                calendar = calendar_type(self.start, self.end)
+                expected = self.expected(calendar_type, product_group)
+
+                self.assertTrue(
+                    calendar.schedule.equals(expected.schedule),
+                    product_group,
+                )
+                np.testing.assert_array_equal(
+                    calendar.busdaycalendar.holidays,
+                    expected.busdaycalendar.holidays,
+                )
+                schedules.append(calendar.schedule)
+        finally:
+            calendar_type.product_group = original
+
+        for schedule in schedules[1:]:
+            self.assertFalse(schedule.equals(schedules[0]))
+
+    def test_ifeu(self):
+        self.check_product_groups(IFEUExchangeCalendar, ['UK', 'US', 'EU'])
+
+    def test_xmod(self):
+        self.check_product_groups(XMODExchangeCalendar, ['EQD', 'IRD'])
@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase, skipIf
+
+import numpy as np
+import pandas as pd
+
+from trading_calendars import (
+    schedule_cache,
+    ScheduleCache,
+    get_schedule_cache,
+    set_schedule_cache,
+)
+from trading_calendars.exchange_calendar_xnys import XNYSExchangeCalendar
+from trading_calendars.schedule_cache import _describe
+from trading_calendars.utils.pandas_utils import DatetimeArray
+
+
+class ScheduleCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.previous_cache = get_schedule_cache()
+
+    def tearDown(self):
+        set_schedule_cache(self.previous_cache)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def build(self, cache, start='2015-01-01', end='2016-01-01'):
+        set_schedule_cache(cache)
+        return XNYSExchangeCalendar(
+            pd.Timestamp(start, tz='UTC'),
+            pd.Timestamp(end, tz='UTC'),
+        )
+
+    def entries(self):
+        return sorted(
+            name for name in os.listdir(self.root)
+            if not name.startswith('.tmp-')
+        )
+
+    def age(self, name, days):
+        then = time.time() - days * 24 * 60 * 60
+        os.utime(os.path.join(self.root, name), (then, then))
+
+    def test_save_prunes_unused_entries(self):
+        cache = ScheduleCache(self.root, max_age=pd.Timedelta(days=7))
+
+        self.build(cache, end='2016-01-01')
+        old, = self.entries()
+        self.age(old, 8)
+
+        self.build(cache, end='2016-01-02')
+        new, = self.entries()
+        self.assertNotEqual(old, new)
+
+    def test_load_keeps_entries_in_use(self):
+        cache = ScheduleCache(self.root, max_age=pd.Timedelta(days=7))
+
+        self.build(cache, end='2016-01-01')
+        used, = self.entries()
+        self.age(used, 8)
+
+        # Loading the entry marks it as used again.
+        self.build(cache, end='2016-01-01')
+        self.build(cache, end='2016-01-02')
+        self.assertEqual(len(self.entries()), 2)
+        self.assertIn(used, self.entries())
+
+    def test_no_max_age_keeps_every_entry(self):
+        cache = ScheduleCache(self.root, max_age=None)
+
+        self.build(cache, end='2016-01-01')
+        old, = self.entries()
+        self.age(old, 365)
+
+        self.build(cache, end='2016-01-02')
+        self.assertEqual(len(self.entries()), 2)
+
+    def test_mmap_load_without_writable_minutes(self):
+        expected = self.build(None).all_minutes
+
+        # Written by a cache that doesn't store the trading minutes.
+        self.build(ScheduleCache(self.root))
+
+        def unwritable(path, array):
+            raise OSError('read-only file system')
+
+        publish = schedule_cache._publish
+        schedule_cache._publish = unwritable
+        try:
+            calendar = self.build(ScheduleCache(self.root, mmap=True))
+        finally:
+            schedule_cache._publish = publish
+
+        self.assertTrue(calendar.all_minutes.equals(expected))
+
+    @skipIf(DatetimeArray is None, 'pandas < 0.24 copies tz-aware values')
+    def test_mmap_minutes_are_not_copied(self):
+        expected = self.build(None).all_minutes
+
+        for _ in range(2):
+            # Built once from the rules, then once from the saved entry.
+            calendar = self.build(ScheduleCache(self.root, mmap=True))
+            minutes = calendar._trading_minutes_nanos
+            self.assertIsInstance(minutes, np.memmap)
+            self.assertTrue(
+                np.shares_memory(calendar.all_minutes.asi8, minutes),
+            )
+            self.assertTrue(calendar.all_minutes.equals(expected))
+
+
+class DescribeTestCase(TestCase):
+
+    def test_function_body_changes_description(self):
+        def observance(dt):
+            return dt
+
+        first = _describe(observance)
+
+        def observance(dt):
+            return dt + pd.Timedelta(days=1)
+
+        second = _describe(observance)
+
+        self.assertIn('observance', first)
+        self.assertNotEqual(first, second)
+
+    def test_same_function_same_description(self):
+        def make():
+            def observance(dt):
+                return dt
+            return observance
+
+        self.assertEqual(_describe(make()), _describe(make()))
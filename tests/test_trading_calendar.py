@@ -0,0 +1,948 @@
+import pickle
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from trading_calendars.exchange_calendar_ifeu import IFEUExchangeCalendar
+from trading_calendars.exchange_calendar_xcme import XCMEExchangeCalendar
+from trading_calendars.exchange_calendar_xjpx import XJPXExchangeCalendar
+from trading_calendars.exchange_calendar_xmod import XMODExchangeCalendar
+from trading_calendars.exchange_calendar_xnys import XNYSExchangeCalendar
+
+
+class LookupTestCase(TestCase):
+    """
+    Checks batch and nanosecond lookups against their scalar counterparts
+    and against brute force over the schedule, on calendars with early
+    closes (XNYS), overnight sessions (XCME) and breaks (XJPX).
+    """
+    calendar_types = (
+        XNYSExchangeCalendar,
+        XCMEExchangeCalendar,
+        XJPXExchangeCalendar,
+    )
+    start = pd.Timestamp('2016-12-01', tz='UTC')
+    end = pd.Timestamp('2018-02-01', tz='UTC')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendars = [
+            calendar_type(cls.start, cls.end)
+            for calendar_type in cls.calendar_types
+        ]
+
+    def sample_dts(self, calendar, seed=0):
+        """
+        Random dts within the calendar, on and off minute boundaries, along
+        with every open, close and break boundary of some sessions and the
+        minutes either side of them.
+        """
+        rng = np.random.RandomState(seed)
+        first = calendar.market_opens_nanos[0]
+        last = calendar.market_closes_nanos[-1]
+        # Stay clear of the last session so that every "next" lookup exists.
+        random = rng.randint(first + 1, last - 5 * 24 * 60 * 60 * 10 ** 9, 300)
+        random[::2] -= random[::2] % (60 * 10 ** 9)
+
+        edges = np.concatenate([
+            calendar.market_opens_nanos[1:40:3],
+            calendar.market_closes_nanos[1:40:3],
+            calendar.break_starts_nanos[1:40:3],
+            calendar.break_ends_nanos[1:40:3],
+        ])
+        edges = edges[edges != np.iinfo(np.int64).min]
+        minute = 60 * 10 ** 9
+        nanos = np.concatenate([random, edges - minute, edges, edges + minute])
+        return pd.DatetimeIndex(np.sort(nanos), tz='UTC')
+
+
+class MinutesWindowTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = XNYSExchangeCalendar(
+            pd.Timestamp('2015-01-01', tz='UTC'),
+            pd.Timestamp('2015-03-01', tz='UTC'),
+        )
+        cls.all_minutes = cls.calendar.all_minutes
+
+    def assert_window_matches_slice(self, start_idx, count):
+        end_idx = start_idx + count
+        if count < 0:
+            expected = self.all_minutes[(end_idx + 1):(start_idx + 1)]
+        else:
+            expected = self.all_minutes[start_idx:end_idx]
+
+        result = self.calendar.minutes_window(
+            self.all_minutes[start_idx],
+            count,
+        )
+        self.assertTrue(
+            result.equals(expected),
+            'minutes_window(%d, %d)' % (start_idx, count),
+        )
+
+    def test_backward_window_past_first_minute(self):
+        num_minutes = len(self.all_minutes)
+        for count in (-10, -11, -12, -50, -num_minutes, -2 * num_minutes):
+            self.assert_window_matches_slice(10, count)
+
+        # Slicing from a negative position counts back from the last minute,
+        # so a window overshooting the first minute is empty.
+        self.assertEqual(
+            len(self.calendar.minutes_window(self.all_minutes[10], -50)),
+            0,
+        )
+
+    def test_forward_window_past_last_minute(self):
+        last = len(self.all_minutes) - 1
+        for count in (0, 1, 10, 100):
+            self.assert_window_matches_slice(last - 5, count)
+
+    def test_window_after_last_minute(self):
+        last = self.all_minutes[-1]
+        self.assertTrue(
+            self.calendar.minutes_window(last, 10).equals(
+                self.all_minutes[-1:],
+            )
+        )
+        with self.assertRaises(IndexError):
+            self.calendar.minutes_window(last + pd.Timedelta(minutes=1), 1)
+
+
+class MinutesInRangeTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = XNYSExchangeCalendar(
+            pd.Timestamp('2015-01-01', tz='UTC'),
+            pd.Timestamp('2015-03-01', tz='UTC'),
+        )
+        cls.all_minutes = cls.calendar.all_minutes
+
+    def test_matches_all_minutes(self):
+        rng = np.random.RandomState(0)
+        first = self.all_minutes[0].value
+        last = self.all_minutes[-1].value
+        for _ in range(100):
+            start, end = sorted(rng.randint(first, last, 2))
+            start = pd.Timestamp(start, tz='UTC')
+            end = pd.Timestamp(end, tz='UTC')
+            expected = self.all_minutes[
+                (self.all_minutes >= start) & (self.all_minutes <= end)
+            ]
+            self.assertTrue(
+                self.calendar.minutes_in_range(start, end).equals(expected),
+            )
+
+    def test_end_after_last_minute(self):
+        last = self.all_minutes[-1]
+        self.assertTrue(
+            self.calendar.minutes_in_range(
+                self.all_minutes[-5],
+                last,
+            ).equals(self.all_minutes[-5:])
+        )
+        with self.assertRaises(IndexError):
+            self.calendar.minutes_in_range(
+                self.all_minutes[-5],
+                last + pd.Timedelta(minutes=1),
+            )
+
+
+class SessionsTestCase(TestCase):
+
+    def test_sessions_after_busdaycalendar_end(self):
+        start = pd.Timestamp('2095-01-01', tz='UTC')
+        end = pd.Timestamp('2105-01-01', tz='UTC')
+        calendar = XNYSExchangeCalendar(start, end)
+
+        holidays = calendar.regular_holidays.holidays(start, end)
+        weekdays = pd.date_range(start, end, freq='B')
+        expected = weekdays[~weekdays.isin(holidays)]
+
+        self.assertGreater(len(holidays[holidays.year > 2099]), 0)
+        self.assertTrue(calendar.all_sessions.equals(expected))
+
+
+class BatchOpenCloseTestCase(LookupTestCase):
+
+    def test_next_and_previous_opens_and_closes(self):
+        for calendar in self.calendars:
+            dts = self.sample_dts(calendar)
+            opens = calendar.market_opens_nanos
+            closes = calendar.market_closes_nanos
+            for method, values in (
+                ('next_open', opens),
+                ('next_close', closes),
+                ('previous_open', opens),
+                ('previous_close', closes),
+            ):
+                if method.startswith('next'):
+                    expected = [values[values > dt][0] for dt in dts.asi8]
+                else:
+                    # Only dts with a previous value.
+                    dts = dts[dts.asi8 > values[0]]
+                    expected = [values[values < dt][-1] for dt in dts.asi8]
+                expected = pd.DatetimeIndex(expected, tz='UTC')
+
+                scalar = pd.DatetimeIndex(
+                    [getattr(calendar, method)(dt) for dt in dts],
+                )
+                batch = getattr(calendar, method + 's')(dts)
+                batch_ns = getattr(calendar, method + 's')(dts.asi8)
+
+                self.assertTrue(scalar.equals(expected), method)
+                self.assertTrue(batch.equals(expected), method)
+                self.assertTrue(batch_ns.equals(expected), method)
+
+
+class IsOpenOnMinutesTestCase(LookupTestCase):
+
+    def test_is_open_on_minutes(self):
+        for calendar in self.calendars:
+            dts = self.sample_dts(calendar)
+            opens = calendar.market_opens_nanos
+            closes = calendar.market_closes_nanos
+            break_starts = calendar.break_starts_nanos
+            break_ends = calendar.break_ends_nanos
+            has_break = break_starts != np.iinfo(np.int64).min
+
+            expected = np.array([
+                (
+                    (opens <= dt) & (dt <= closes) &
+                    ~(has_break & (break_starts < dt) & (dt < break_ends))
+                ).any()
+                for dt in dts.asi8
+            ])
+            self.assertTrue(expected.any() and not expected.all())
+
+            scalar = np.array([calendar.is_open_on_minute(dt) for dt in dts])
+            np.testing.assert_array_equal(scalar, expected)
+            np.testing.assert_array_equal(
+                calendar.is_open_on_minutes(dts),
+                expected,
+            )
+            np.testing.assert_array_equal(
+                calendar.is_open_on_minutes(dts.asi8),
+                expected,
+            )
+
+
+class MinutesToSessionLabelsTestCase(LookupTestCase):
+
+    def test_minutes_to_session_labels(self):
+        for calendar in self.calendars:
+            dts = self.sample_dts(calendar)
+            # Only dts with a previous session.
+            dts = dts[dts.asi8 > calendar.market_closes_nanos[0]]
+            sessions = calendar.schedule.index
+            opens = calendar.market_opens_nanos
+            closes = calendar.market_closes_nanos
+
+            next_idxs = np.array([
+                np.flatnonzero(closes >= dt)[0] for dt in dts.asi8
+            ])
+            previous_idxs = np.array([
+                idx if opens[idx] <= dt else idx - 1
+                for idx, dt in zip(next_idxs, dts.asi8)
+            ])
+
+            for direction, idxs in (
+                ('next', next_idxs),
+                ('previous', previous_idxs),
+            ):
+                expected = sessions[idxs]
+                scalar = pd.DatetimeIndex([
+                    calendar.minute_to_session_label(dt, direction)
+                    for dt in dts
+                ])
+                self.assertTrue(scalar.equals(expected), direction)
+                self.assertTrue(
+                    calendar.minutes_to_session_labels(dts, direction).equals(
+                        expected,
+                    ),
+                    direction,
+                )
+                self.assertTrue(
+                    calendar.minutes_to_session_labels(
+                        dts.asi8,
+                        direction,
+                    ).equals(expected),
+                    direction,
+                )
+
+            is_open = calendar.is_open_on_minutes(dts)
+            self.assertTrue(
+                calendar.minutes_to_session_labels(
+                    dts[is_open],
+                    'none',
+                ).equals(sessions[next_idxs[is_open]])
+            )
+            with self.assertRaises(ValueError):
+                calendar.minutes_to_session_labels(dts, 'none')
+            with self.assertRaises(ValueError):
+                calendar.minutes_to_session_labels(dts, 'sideways')
+
+
+class MinuteToSessionLabelCacheTestCase(LookupTestCase):
+
+    def lookups(self, calendar):
+        # Repeated lookups, in and out of order, as consumers make them.
+        dts = self.sample_dts(calendar)
+        dts = dts[dts.asi8 > calendar.market_closes_nanos[0]]
+        rng = np.random.RandomState(1)
+        return dts.append(dts[rng.permutation(len(dts))]).append(dts)
+
+    def test_cache_configurations_agree(self):
+        for calendar in self.calendars:
+            dts = self.lookups(calendar)
+            is_open = calendar.is_open_on_minutes(dts)
+            expected = {
+                direction: calendar.minutes_to_session_labels(dts, direction)
+                for direction in ('next', 'previous')
+            }
+            try:
+                for size in (0, 1, 16):
+                    for session_range in (False, True):
+                        calendar.configure_minute_to_session_label_cache(
+                            size=size,
+                            session_range=session_range,
+                        )
+                        for direction in ('next', 'previous', 'none'):
+                            for i, dt in enumerate(dts):
+                                if direction == 'none':
+                                    if not is_open[i]:
+                                        continue
+                                    expected_label = expected['next'][i]
+                                else:
+                                    expected_label = expected[direction][i]
+                                self.assertEqual(
+                                    calendar.minute_to_session_label(
+                                        dt,
+                                        direction,
+                                    ),
+                                    expected_label,
+                                    (size, session_range, direction, dt),
+                                )
+            finally:
+                calendar.configure_minute_to_session_label_cache()
+
+    def test_cache_info(self):
+        calendar = self.calendars[0]
+        session = calendar.all_sessions[10]
+        minutes = calendar.minutes_for_session(session)
+        try:
+            calendar.configure_minute_to_session_label_cache(size=4)
+            for minute in minutes[:4]:
+                calendar.minute_to_session_label(minute)
+            for minute in minutes[:4]:
+                calendar.minute_to_session_label(minute)
+            info = calendar.minute_to_session_label_cache_info()
+            self.assertEqual((info.hits, info.misses), (4, 4))
+            self.assertEqual((info.size, info.session_range), (4, False))
+
+            calendar.configure_minute_to_session_label_cache(
+                size=0,
+                session_range=True,
+            )
+            for minute in minutes:
+                self.assertEqual(
+                    calendar.minute_to_session_label(minute),
+                    session,
+                )
+            info = calendar.minute_to_session_label_cache_info()
+            self.assertEqual(
+                (info.hits, info.misses),
+                (len(minutes) - 1, 1),
+            )
+        finally:
+            calendar.configure_minute_to_session_label_cache()
+
+
+class NanosLookupTestCase(LookupTestCase):
+
+    def test_ns_lookups_match_timestamp_lookups(self):
+        for calendar in self.calendars:
+            dts = self.sample_dts(calendar)
+            dts = dts[dts.asi8 > calendar.market_closes_nanos[0]]
+            for dt in dts:
+                for method in (
+                    'next_open',
+                    'next_close',
+                    'previous_open',
+                    'previous_close',
+                ):
+                    result = getattr(calendar, method + '_ns')(dt.value)
+                    self.assertIsInstance(result, np.int64)
+                    self.assertEqual(
+                        result,
+                        getattr(calendar, method)(dt).value,
+                    )
+
+                self.assertEqual(
+                    calendar.is_open_on_minute_ns(dt.value),
+                    calendar.is_open_on_minute(dt),
+                )
+                for direction in ('next', 'previous'):
+                    expected = calendar.minute_to_session_label(dt, direction)
+                    self.assertEqual(
+                        calendar.minute_to_session_label_ns(
+                            dt.value,
+                            direction,
+                        ),
+                        expected,
+                    )
+                    # Nanoseconds are accepted without coercion.
+                    self.assertEqual(
+                        calendar.minute_to_session_label(dt.value, direction),
+                        expected,
+                    )
+
+
+class NextPreviousMinuteTestCase(LookupTestCase):
+
+    def test_matches_all_minutes(self):
+        for calendar in self.calendars:
+            minutes = calendar.all_minutes.asi8
+            dts = self.sample_dts(calendar)
+            dts = dts[(dts.asi8 > minutes[0]) & (dts.asi8 < minutes[-1])]
+            for dt in dts:
+                expected_next = minutes[
+                    np.searchsorted(minutes, dt.value, side='right')
+                ]
+                expected_previous = minutes[
+                    np.searchsorted(minutes, dt.value, side='left') - 1
+                ]
+
+                self.assertEqual(
+                    calendar.next_minute_ns(dt.value),
+                    expected_next,
+                )
+                self.assertEqual(
+                    calendar.previous_minute_ns(dt.value),
+                    expected_previous,
+                )
+                self.assertEqual(
+                    calendar.next_minute(dt).value,
+                    expected_next,
+                )
+                self.assertEqual(
+                    calendar.previous_minute(dt).value,
+                    expected_previous,
+                )
+
+
+class ScheduleTestCase(TestCase):
+
+    def assert_same_schedule(self, result, expected):
+        self.assertIs(type(result), type(expected))
+        self.assertTrue(result.schedule.equals(expected.schedule))
+        self.assertTrue(result.early_closes.equals(expected.early_closes))
+        np.testing.assert_array_equal(
+            result.break_starts_nanos,
+            expected.break_starts_nanos,
+        )
+        np.testing.assert_array_equal(
+            result.break_ends_nanos,
+            expected.break_ends_nanos,
+        )
+        self.assertTrue(result.all_minutes.equals(expected.all_minutes))
+        self.assertEqual(
+            result.first_trading_session,
+            expected.first_trading_session,
+        )
+        self.assertEqual(
+            result.last_trading_session,
+            expected.last_trading_session,
+        )
+
+        sessions = expected.all_sessions
+        self.assertTrue(result.are_sessions(sessions).all())
+        minutes = expected.all_minutes[::97]
+        self.assertTrue(
+            result.minutes_to_session_labels(minutes).equals(
+                expected.minutes_to_session_labels(minutes),
+            )
+        )
+
+
+class ExtendTestCase(ScheduleTestCase):
+
+    calendar_types = (XNYSExchangeCalendar, XJPXExchangeCalendar)
+    start = pd.Timestamp('2017-01-01', tz='UTC')
+    end = pd.Timestamp('2017-07-01', tz='UTC')
+
+    def test_extend(self):
+        new_end = pd.Timestamp('2018-01-15', tz='UTC')
+        for calendar_type in self.calendar_types:
+            expected = calendar_type(self.start, new_end)
+            for with_minutes in (False, True):
+                calendar = calendar_type(self.start, self.end)
+                if with_minutes:
+                    calendar.all_minutes
+                calendar.extend(new_end)
+                self.assert_same_schedule(calendar, expected)
+
+    def test_extend_back(self):
+        new_start = pd.Timestamp('2016-06-01', tz='UTC')
+        for calendar_type in self.calendar_types:
+            expected = calendar_type(new_start, self.end)
+            for with_minutes in (False, True):
+                calendar = calendar_type(self.start, self.end)
+                if with_minutes:
+                    calendar.all_minutes
+                calendar.extend_back(new_start)
+                self.assert_same_schedule(calendar, expected)
+
+    def test_extend_to_intraday_bounds(self):
+        # Both ends are taken at their UTC date, as when building a calendar.
+        for new_start, new_end in (
+            (
+                pd.Timestamp('2016-06-01 15:30', tz='UTC'),
+                pd.Timestamp('2018-01-15 15:30', tz='UTC'),
+            ),
+            (
+                pd.Timestamp('2016-06-01 22:30', tz='US/Eastern'),
+                pd.Timestamp('2018-01-15 22:30', tz='US/Eastern'),
+            ),
+            (
+                pd.Timestamp('2016-06-01 15:30'),
+                pd.Timestamp('2018-01-15 15:30'),
+            ),
+        ):
+            for calendar_type in self.calendar_types:
+                expected = calendar_type(
+                    pd.Timestamp(new_start.value, tz='UTC').normalize(),
+                    pd.Timestamp(new_end.value, tz='UTC').normalize(),
+                )
+                calendar = calendar_type(self.start, self.end)
+                calendar.extend_back(new_start)
+                calendar.extend(new_end)
+                self.assert_same_schedule(calendar, expected)
+
+    def test_extend_within_range(self):
+        for calendar_type in self.calendar_types:
+            expected = calendar_type(self.start, self.end)
+            calendar = calendar_type(self.start, self.end)
+            calendar.extend(calendar.last_trading_session.tz_convert(
+                'US/Eastern',
+            ))
+            calendar.extend_back(
+                calendar.first_trading_session + pd.Timedelta(hours=12),
+            )
+            self.assert_same_schedule(calendar, expected)
+
+
+class ViewTestCase(ScheduleTestCase):
+
+    calendar_types = (XNYSExchangeCalendar, XJPXExchangeCalendar)
+    start = pd.Timestamp('2016-01-01', tz='UTC')
+    end = pd.Timestamp('2018-01-01', tz='UTC')
+    view_start = pd.Timestamp('2016-11-20', tz='UTC')
+    view_end = pd.Timestamp('2017-07-04', tz='UTC')
+
+    def test_view_matches_new_calendar(self):
+        for calendar_type in self.calendar_types:
+            expected = calendar_type(self.view_start, self.view_end)
+            for with_minutes in (False, True):
+                calendar = calendar_type(self.start, self.end)
+                if with_minutes:
+                    calendar.all_minutes
+                view = calendar.view(self.view_start, self.view_end)
+                self.assert_same_schedule(view, expected)
+
+                # Views of views slice the same arrays.
+                self.assert_same_schedule(
+                    calendar.view(end=self.view_end).view(self.view_start),
+                    expected,
+                )
+
+    def test_extend_view(self):
+        new_end = pd.Timestamp('2018-03-01', tz='UTC')
+        for calendar_type in self.calendar_types:
+            calendar = calendar_type(self.start, self.end)
+            view = calendar.view(self.view_start, self.view_end)
+            view.extend(new_end)
+            self.assert_same_schedule(
+                view,
+                calendar_type(self.view_start, new_end),
+            )
+            # The calendar the view was taken from is untouched.
+            self.assert_same_schedule(
+                calendar,
+                calendar_type(self.start, self.end),
+            )
+
+    def test_empty_view(self):
+        calendar = XNYSExchangeCalendar(self.start, self.end)
+        with self.assertRaises(ValueError):
+            calendar.view(self.view_end, self.view_start)
+
+
+class PickleTestCase(ScheduleTestCase):
+
+    calendar_types = (
+        XNYSExchangeCalendar,
+        XCMEExchangeCalendar,
+        XJPXExchangeCalendar,
+    )
+    start = pd.Timestamp('2005-01-01', tz='UTC')
+    end = pd.Timestamp('2018-01-01', tz='UTC')
+
+    def test_round_trip(self):
+        for calendar_type in self.calendar_types:
+            calendar = calendar_type(self.start, self.end)
+            calendar.configure_minute_to_session_label_cache(
+                size=4,
+                session_range=True,
+            )
+            result = pickle.loads(pickle.dumps(calendar, 2))
+            self.assert_same_schedule(result, calendar)
+            self.assertEqual(
+                result.minute_to_session_label_cache_info(),
+                calendar.minute_to_session_label_cache_info(),
+            )
+
+            # Pickling only the schedule arrays is smaller than pickling the
+            # schedule.
+            self.assertLess(
+                len(pickle.dumps(calendar, 2)),
+                len(pickle.dumps(calendar.schedule, 2)),
+            )
+
+    def test_extend_after_round_trip(self):
+        new_end = pd.Timestamp('2019-01-01', tz='UTC')
+        for calendar_type in self.calendar_types:
+            result = pickle.loads(
+                pickle.dumps(calendar_type(self.start, self.end), 2),
+            )
+            result.extend(new_end)
+            self.assert_same_schedule(
+                result,
+                calendar_type(self.start, new_end),
+            )
+
+    def test_product_group(self):
+        # The product group changes the holidays, so it is pickled with the
+        # schedule and the rebuilt calendar extends with the same rules.
+        new_end = pd.Timestamp('2019-01-01', tz='UTC')
+        for calendar_type, product_group in (
+            (IFEUExchangeCalendar, 'US'),
+            (XMODExchangeCalendar, 'IRD'),
+        ):
+            calendar = calendar_type(self.start, self.end)
+            calendar.product_group = product_group
+            calendar.extend(new_end)
+
+            result = pickle.loads(pickle.dumps(calendar, 2))
+            self.assertEqual(result.product_group, product_group)
+            self.assert_same_schedule(result, calendar)
+
+            calendar.extend(pd.Timestamp('2020-01-01', tz='UTC'))
+            result.extend(pd.Timestamp('2020-01-01', tz='UTC'))
+            self.assert_same_schedule(result, calendar)
+
+
+class BreaksTestCase(TestCase):
+    """
+    Checks XJPX's lunch breaks against a brute-force list of its minutes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = XJPXExchangeCalendar(
+            pd.Timestamp('2016-12-01', tz='UTC'),
+            pd.Timestamp('2017-03-01', tz='UTC'),
+        )
+        calendar = cls.calendar
+        minute = 60 * 10 ** 9
+        cls.session_minutes = {}
+        for i, session in enumerate(calendar.all_sessions):
+            cls.session_minutes[session] = pd.DatetimeIndex(
+                np.concatenate([
+                    np.arange(
+                        calendar.market_opens_nanos[i],
+                        calendar.break_starts_nanos[i] + minute,
+                        minute,
+                    ),
+                    np.arange(
+                        calendar.break_ends_nanos[i],
+                        calendar.market_closes_nanos[i] + minute,
+                        minute,
+                    ),
+                ]),
+                tz='UTC',
+            )
+        cls.minutes = pd.DatetimeIndex(
+            np.concatenate([
+                cls.session_minutes[session].asi8
+                for session in calendar.all_sessions
+            ]),
+            tz='UTC',
+        )
+
+    def lunch_minutes(self):
+        minute = pd.Timedelta(minutes=1)
+        for session in self.calendar.all_sessions[1:-1:5]:
+            break_start = self.calendar.break_starts[session]
+            break_end = self.calendar.break_ends[session]
+            yield session, break_start, break_end, pd.date_range(
+                break_start + minute, break_end - minute, freq=minute,
+            )
+
+    def test_every_session_has_a_break(self):
+        self.assertFalse(self.calendar.break_starts.isnull().any())
+        self.assertFalse(self.calendar.break_ends.isnull().any())
+
+    def test_all_minutes(self):
+        self.assertTrue(self.calendar.all_minutes.equals(self.minutes))
+
+    def test_minutes_for_session(self):
+        for session, expected in self.session_minutes.items():
+            self.assertTrue(
+                self.calendar.minutes_for_session(session).equals(expected),
+            )
+        sessions = self.calendar.all_sessions
+        self.assertEqual(
+            self.calendar.minutes_count_for_sessions_in_range(
+                sessions[0],
+                sessions[-1],
+            ),
+            len(self.minutes),
+        )
+
+    def test_minutes_in_range(self):
+        for _, break_start, break_end, lunch in self.lunch_minutes():
+            start = break_start - pd.Timedelta(minutes=30)
+            end = break_end + pd.Timedelta(minutes=30)
+            expected = self.minutes[
+                (self.minutes >= start) & (self.minutes <= end)
+            ]
+            self.assertTrue(
+                self.calendar.minutes_in_range(start, end).equals(expected),
+            )
+            # A range within the break is empty.
+            self.assertEqual(
+                len(self.calendar.minutes_in_range(lunch[0], lunch[-1])),
+                0,
+            )
+
+    def test_lunch_lookups(self):
+        for session, break_start, break_end, lunch in self.lunch_minutes():
+            self.assertTrue(self.calendar.is_open_on_minute(break_start))
+            self.assertTrue(self.calendar.is_open_on_minute(break_end))
+            self.assertFalse(self.calendar.is_open_on_minutes(lunch).any())
+
+            for dt in lunch[::10]:
+                self.assertFalse(self.calendar.is_open_on_minute(dt))
+                self.assertEqual(self.calendar.next_minute(dt), break_end)
+                self.assertEqual(
+                    self.calendar.previous_minute(dt),
+                    break_start,
+                )
+                # The break is part of the session.
+                self.assertEqual(
+                    self.calendar.next_open(dt),
+                    self.calendar.session_open(
+                        self.calendar.next_session_label(session),
+                    ),
+                )
+                self.assertEqual(
+                    self.calendar.previous_close(dt),
+                    self.calendar.session_close(
+                        self.calendar.previous_session_label(session),
+                    ),
+                )
+                for direction in ('next', 'previous'):
+                    self.assertEqual(
+                        self.calendar.minute_to_session_label(dt, direction),
+                        session,
+                    )
+                with self.assertRaises(ValueError):
+                    self.calendar.minute_to_session_label(dt, 'none')
+
+            self.assertTrue(
+                (self.calendar.minutes_to_session_labels(lunch) ==
+                 session).all()
+            )
+
+
+class BusdaycalendarTestCase(TestCase):
+
+    def assert_busdaycalendar_matches_sessions(self, calendar):
+        sessions = calendar.all_sessions
+        # A few weeks either side of the calendar's range, in which every
+        # day in the weekmask is a business day.
+        days = pd.date_range(
+            sessions[0] - pd.Timedelta(days=30),
+            sessions[-1] + pd.Timedelta(days=30),
+            tz='UTC',
+        )
+        within = (days >= sessions[0]) & (days <= sessions[-1])
+        is_busday = np.is_busday(
+            days.tz_localize(None).values.astype('datetime64[D]'),
+            busdaycal=calendar.busdaycalendar,
+        )
+        np.testing.assert_array_equal(
+            is_busday[within],
+            days[within].isin(sessions),
+        )
+        np.testing.assert_array_equal(
+            is_busday[~within],
+            np.is_busday(
+                days[~within].tz_localize(None).values.astype(
+                    'datetime64[D]',
+                ),
+                weekmask=calendar.weekmask,
+            ),
+        )
+
+        for session in sessions[:-1:7]:
+            self.assertEqual(
+                session + calendar.day,
+                calendar.next_session_label(session),
+            )
+
+    def test_pre_1970_start(self):
+        calendar = XNYSExchangeCalendar(
+            pd.Timestamp('1965-01-01', tz='UTC'),
+            pd.Timestamp('1975-01-01', tz='UTC'),
+        )
+        self.assert_busdaycalendar_matches_sessions(calendar)
+
+    def test_product_groups(self):
+        start = pd.Timestamp('2010-01-01', tz='UTC')
+        end = pd.Timestamp('2014-01-01', tz='UTC')
+        for calendar_type, product_groups in (
+            (IFEUExchangeCalendar, ('UK', 'US', 'EU')),
+            (XMODExchangeCalendar, ('EQD', 'IRD')),
+        ):
+            for product_group in product_groups:
+                calendar = calendar_type(start, end)
+                calendar.product_group = product_group
+                calendar.extend_back(pd.Timestamp('2009-01-01', tz='UTC'))
+                self.assert_busdaycalendar_matches_sessions(calendar)
+
+    def test_extend(self):
+        calendar = XNYSExchangeCalendar(
+            pd.Timestamp('2010-01-01', tz='UTC'),
+            pd.Timestamp('2011-01-01', tz='UTC'),
+        )
+        calendar.busdaycalendar
+        calendar.extend(pd.Timestamp('2012-01-01', tz='UTC'))
+        self.assert_busdaycalendar_matches_sessions(calendar)
+        self.assert_busdaycalendar_matches_sessions(
+            calendar.view(end=pd.Timestamp('2010-06-01', tz='UTC')),
+        )
+
+
+class SessionBitmapTestCase(LookupTestCase):
+
+    def sample_days(self, calendar):
+        """
+        Every midnight from a few days before the first session to a few
+        days after the last, and the same days at noon.
+        """
+        sessions = calendar.all_sessions
+        days = pd.date_range(
+            sessions[0] - pd.Timedelta(days=10),
+            sessions[-1] + pd.Timedelta(days=10),
+            tz='UTC',
+        )
+        return days.append(days + pd.Timedelta(hours=12)).sort_values()
+
+    def calendars_and_views(self):
+        for calendar in self.calendars:
+            yield calendar
+            # Short views leave partly used bytes at either end.
+            for start in range(8):
+                for length in (1, 2, 7, 8, 9, 20):
+                    sessions = calendar.all_sessions[start:start + length]
+                    yield calendar.view(sessions[0], sessions[-1])
+
+    def test_is_session(self):
+        for calendar in self.calendars_and_views():
+            dts = self.sample_days(calendar)
+            expected = dts.isin(calendar.all_sessions)
+            np.testing.assert_array_equal(calendar.are_sessions(dts), expected)
+            np.testing.assert_array_equal(
+                [calendar.is_session(dt) for dt in dts],
+                expected,
+            )
+
+    def test_session_distance(self):
+        rng = np.random.RandomState(0)
+        for calendar in self.calendars_and_views():
+            sessions = calendar.all_sessions.asi8
+            dts = self.sample_days(calendar)
+            starts = dts[rng.randint(0, len(dts), 200)]
+            ends = dts[rng.randint(0, len(dts), 200)]
+
+            lo = np.minimum(starts.asi8, ends.asi8)
+            hi = np.maximum(starts.asi8, ends.asi8)
+            expected = (
+                np.searchsorted(sessions, hi, side='right') -
+                np.searchsorted(sessions, lo, side='left')
+            )
+            expected = np.where(ends < starts, -expected, expected)
+
+            np.testing.assert_array_equal(
+                calendar.session_distances(starts, ends),
+                expected,
+            )
+            np.testing.assert_array_equal(
+                [
+                    calendar.session_distance(start, end)
+                    for start, end in zip(starts, ends)
+                ],
+                expected,
+            )
+
+
+class MinutesCountTestCase(LookupTestCase):
+
+    def test_minutes_counts_for_sessions_in_range(self):
+        rng = np.random.RandomState(0)
+        for calendar in self.calendars:
+            sessions = calendar.all_sessions
+            session_minutes = np.array([
+                len(calendar.minutes_for_session(session))
+                for session in sessions
+            ])
+
+            days = pd.date_range(
+                sessions[0] - pd.Timedelta(days=5),
+                sessions[-1] + pd.Timedelta(days=5),
+                tz='UTC',
+            )
+            starts = days[rng.randint(0, len(days), 200)]
+            ends = days[rng.randint(0, len(days), 200)]
+
+            start_idxs = np.searchsorted(sessions.asi8, starts.asi8, 'left')
+            end_idxs = np.searchsorted(sessions.asi8, ends.asi8, 'right')
+            # Reversed ranges are empty.
+            expected = np.array([
+                session_minutes[start_idx:end_idx].sum()
+                for start_idx, end_idx in zip(start_idxs, end_idxs)
+            ])
+
+            np.testing.assert_array_equal(
+                calendar.minutes_counts_for_sessions_in_range(starts, ends),
+                expected,
+            )
+            np.testing.assert_array_equal(
+                [
+                    calendar.minutes_count_for_sessions_in_range(start, end)
+                    for start, end in zip(starts, ends)
+                ],
+                expected,
+            )
+            self.assertEqual(
+                calendar.minutes_count_for_sessions_in_range(
+                    sessions[0],
+                    sessions[-1],
+                ),
+                len(calendar.all_minutes),
+            )
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from .trading_calendar import TradingCalendar
+from .calendar_combinations import CalendarIntersection, CalendarUnion
 from .calendar_utils import (
     clear_calendars,
     deregister_calendar,
@@ -22,17 +23,29 @@ from .calendar_utils import (
     register_calendar_alias,
     register_calendar_type,
     resolve_alias,
+    warm_calendars,
+)
+from .schedule_cache import (
+    ScheduleCache,
+    get_schedule_cache,
+    set_schedule_cache,
 )
 
 __all__ = [
+    'CalendarIntersection',
+    'CalendarUnion',
     'clear_calendars',
     'deregister_calendar',
     'get_calendar',
+    'get_schedule_cache',
     'register_calendar',
     'register_calendar_alias',
     'register_calendar_type',
     'resolve_alias',
+    'ScheduleCache',
+    'set_schedule_cache',
     'TradingCalendar',
+    'warm_calendars',
 ]
 
 from ._version import get_versions
@@ -0,0 +1,301 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Apache Arrow and Parquet import and export of calendar schedules.
+
+A schedule table has one row per session, with the columns
+
+- ``calendar``: the calendar's name, dictionary encoded.
+- ``session``: the session label.
+- ``market_open``: the session's open.
+- ``market_close``: the session's close.
+- ``early_close``: whether the session closes early.
+- ``break_start``: the last minute before the session's break, or null.
+- ``break_end``: the first minute after the session's break, or null.
+- ``minutes``: the number of trading minutes in the session.
+
+The timestamp columns are ``timestamp[ns, UTC]``. Several calendars can be
+stored in one table; their rows are contiguous, and the schema metadata
+records the type and row range of each, so that reading a calendar back only
+slices the table. The arrays are handed to the calendars without copying.
+
+These functions require ``pyarrow``, which is not otherwise a dependency.
+"""
+from importlib import import_module
+import json
+
+import numpy as np
+
+from .calendar_helpers import NAT_NANOS
+
+# The schema metadata key under which the calendars in a table are described.
+METADATA_KEY = b'trading_calendars'
+
+# Bump this whenever the table layout changes.
+FORMAT_VERSION = 2
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Arrow and Parquet support for trading calendars requires "
+            "pyarrow. Install it with `pip install pyarrow`."
+        )
+    return pyarrow
+
+
+def _as_calendar_list(calendars):
+    # Imported here to avoid a cycle with trading_calendar.
+    from .trading_calendar import TradingCalendar
+
+    if isinstance(calendars, TradingCalendar):
+        return [calendars]
+    return list(calendars)
+
+
+def _timestamps(pa, nanos, nullable=False):
+    nanos = np.ascontiguousarray(nanos, dtype=np.int64)
+    validity = None
+    if nullable:
+        missing = nanos == NAT_NANOS
+        if missing.any():
+            # Arrow packs booleans into the LSB-first bitmap that validity
+            # buffers use.
+            validity = pa.array(~missing, type=pa.bool_()).buffers()[1]
+    return pa.Array.from_buffers(
+        pa.timestamp('ns', tz='UTC'),
+        len(nanos),
+        [validity, pa.py_buffer(nanos)],
+    )
+
+
+def _nanos(pa, column):
+    # A zero-copy int64 view of a timestamp column, with NAT_NANOS in place
+    # of nulls. Columns stored at another resolution, as Parquet files
+    # written with older format versions are, are cast to nanoseconds first.
+    timestamp_type = pa.timestamp('ns', tz='UTC')
+    if column.type != timestamp_type:
+        column = column.cast(timestamp_type)
+    values = column.view(pa.int64())
+    if values.null_count:
+        values = values.fill_null(NAT_NANOS)
+    return values.to_numpy(zero_copy_only=True)
+
+
+def to_arrow(calendars):
+    """
+    Build a schedule table for one or more calendars.
+
+    Parameters
+    ----------
+    calendars : TradingCalendar or iterable[TradingCalendar]
+        The calendars to include. Their names must be distinct.
+
+    Returns
+    -------
+    table : pyarrow.Table
+        The schedule table described in this module's docstring.
+    """
+    pa = _import_pyarrow()
+
+    calendars = _as_calendar_list(calendars)
+    names = [calendar.name for calendar in calendars]
+    if len(set(names)) != len(names):
+        raise ValueError("Duplicate calendar names: %s" % names)
+
+    described = []
+    columns = {
+        name: [] for name in (
+            'calendar',
+            'session',
+            'market_open',
+            'market_close',
+            'early_close',
+            'break_start',
+            'break_end',
+            'minutes',
+        )
+    }
+    offset = 0
+    for code, calendar in enumerate(calendars):
+        arrays = calendar._schedule_arrays()
+        sessions = arrays['sessions']
+        count = len(sessions)
+
+        columns['calendar'].append(np.full(count, code, dtype=np.int32))
+        columns['session'].append(sessions)
+        columns['market_open'].append(arrays['opens'])
+        columns['market_close'].append(arrays['closes'])
+        columns['early_close'].append(
+            np.in1d(sessions, arrays['early_closes']),
+        )
+        columns['break_start'].append(arrays['break_starts'])
+        columns['break_end'].append(arrays['break_ends'])
+        columns['minutes'].append(np.diff(calendar._session_minute_offsets))
+
+        cls = type(calendar)
+        described.append({
+            'name': calendar.name,
+            'type': '%s:%s' % (cls.__module__, cls.__name__),
+            'offset': offset,
+            'length': count,
+        })
+        offset += count
+
+    def concat(name):
+        arrays = columns[name]
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    metadata = {
+        'version': FORMAT_VERSION,
+        'calendars': described,
+    }
+    return pa.Table.from_arrays(
+        [
+            pa.DictionaryArray.from_arrays(
+                pa.array(concat('calendar'), type=pa.int32()),
+                pa.array(names, type=pa.string()),
+            ),
+            _timestamps(pa, concat('session')),
+            _timestamps(pa, concat('market_open')),
+            _timestamps(pa, concat('market_close')),
+            pa.array(concat('early_close'), type=pa.bool_()),
+            _timestamps(pa, concat('break_start'), nullable=True),
+            _timestamps(pa, concat('break_end'), nullable=True),
+            pa.array(concat('minutes'), type=pa.int64()),
+        ],
+        names=[
+            'calendar',
+            'session',
+            'market_open',
+            'market_close',
+            'early_close',
+            'break_start',
+            'break_end',
+            'minutes',
+        ],
+        metadata={METADATA_KEY: json.dumps(metadata).encode('utf-8')},
+    )
+
+
+def from_arrow(table):
+    """
+    Rebuild the calendars in a schedule table without evaluating any rules.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table produced by ``to_arrow`` or read by ``read_parquet``.
+
+    Returns
+    -------
+    calendars : dict[str -> TradingCalendar]
+        The calendars in the table, keyed by name. Their arrays are read-only
+        views of the table's buffers.
+    """
+    pa = _import_pyarrow()
+
+    raw = (table.schema.metadata or {}).get(METADATA_KEY)
+    if raw is None:
+        raise ValueError("Table is not a trading calendar schedule table.")
+    metadata = json.loads(raw.decode('utf-8'))
+    if metadata['version'] > FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported schedule table version: %r" % metadata['version']
+        )
+
+    # Views of a single chunk are free; tables read in several chunks are
+    # combined once.
+    if any(table.column(name).num_chunks != 1 for name in table.column_names):
+        table = table.combine_chunks()
+
+    def column(name):
+        return table.column(name).chunk(0)
+
+    sessions = _nanos(pa, column('session'))
+    opens = _nanos(pa, column('market_open'))
+    closes = _nanos(pa, column('market_close'))
+    early_close = column('early_close').to_numpy(zero_copy_only=False)
+    if 'break_start' in table.column_names:
+        break_starts = _nanos(pa, column('break_start'))
+        break_ends = _nanos(pa, column('break_end'))
+    else:
+        # Written before breaks were supported.
+        break_starts = break_ends = np.full(len(sessions), NAT_NANOS)
+
+    calendars = {}
+    for described in metadata['calendars']:
+        module, _, name = described['type'].partition(':')
+        calendar_type = getattr(import_module(module), name)
+
+        rows = slice(
+            described['offset'],
+            described['offset'] + described['length'],
+        )
+        calendar_sessions = sessions[rows]
+        calendars[described['name']] = calendar_type._from_schedule_arrays({
+            'sessions': calendar_sessions,
+            'opens': opens[rows],
+            'closes': closes[rows],
+            'early_closes': calendar_sessions[early_close[rows]],
+            'break_starts': break_starts[rows],
+            'break_ends': break_ends[rows],
+        })
+
+    return calendars
+
+
+def write_parquet(calendars, path, **kwargs):
+    """
+    Write the schedules of one or more calendars to a Parquet file.
+
+    Parameters
+    ----------
+    calendars : TradingCalendar or iterable[TradingCalendar]
+        The calendars to write.
+    path : str
+        The file to write.
+    **kwargs
+        Forwarded to ``pyarrow.parquet.write_table``. By default the file is
+        written with format version 2.6, which stores the timestamps in
+        nanoseconds; older versions store them in microseconds.
+    """
+    pa = _import_pyarrow()
+    kwargs.setdefault('version', '2.6')
+    kwargs.setdefault('coerce_timestamps', None)
+    pa.parquet.write_table(to_arrow(calendars), path, **kwargs)
+
+
+def read_parquet(path, memory_map=True):
+    """
+    Read the calendars in a Parquet file written by ``write_parquet``.
+
+    Parameters
+    ----------
+    path : str
+        The file to read.
+    memory_map : bool, optional
+        Whether to memory map the file while reading. Default is True.
+
+    Returns
+    -------
+    calendars : dict[str -> TradingCalendar]
+        The calendars in the file, keyed by name.
+    """
+    pa = _import_pyarrow()
+    return from_arrow(pa.parquet.read_table(path, memory_map=memory_map))
@@ -0,0 +1,349 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Calendars combining the trading times of several TradingCalendars.
+"""
+from abc import ABCMeta, abstractmethod
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+from pandas import DatetimeIndex
+from six import with_metaclass
+
+from .calendar_helpers import (
+    are_open,
+    combine_intervals,
+    compute_all_minutes,
+    compute_minute_offsets,
+    is_open,
+    minute_position,
+    minutes_in_position_range,
+    next_divider_idx,
+    next_minute_val,
+    previous_divider_idx,
+    previous_minute_val,
+)
+from .utils.memoize import lazyval
+from .utils.pandas_utils import nanos_array
+
+
+class CalendarCombination(with_metaclass(ABCMeta)):
+    """
+    The trading times of several calendars, combined.
+
+    The intervals during which each calendar is open, which exclude any
+    breaks, are merged into a single sorted list of intervals, so the minute
+    lookups cost the same as for one calendar. An interval of the combination
+    may span several sessions of the underlying calendars; touching intervals
+    are merged.
+
+    Parameters
+    ----------
+    calendars : iterable[TradingCalendar]
+        The calendars to combine.
+    """
+    def __init__(self, calendars):
+        self.calendars = tuple(calendars)
+        if not self.calendars:
+            raise ValueError("At least one calendar is required.")
+
+        opens, closes = combine_intervals(
+            [c._interval_starts for c in self.calendars],
+            [c._interval_ends for c in self.calendars],
+            self._min_count(len(self.calendars)),
+        )
+        self.market_opens_nanos = opens
+        self.market_closes_nanos = closes
+
+        self.all_sessions = self._combine_sessions()
+
+    def __repr__(self):
+        return '%s(%s)' % (
+            type(self).__name__,
+            ', '.join(c.name for c in self.calendars),
+        )
+
+    @abstractmethod
+    def _min_count(self, num_calendars):
+        """
+        The number of calendars that must be open at a minute for the
+        combination to be open.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _combine_sessions(self):
+        """
+        Combine the session labels of the calendars, once the intervals of
+        the combination are known.
+        """
+        raise NotImplementedError()
+
+    @property
+    def opens(self):
+        """
+        The start of each interval during which the combination is open.
+        """
+        return DatetimeIndex(self.market_opens_nanos, tz='UTC')
+
+    @property
+    def closes(self):
+        """
+        The last minute of each interval during which the combination is open.
+        """
+        return DatetimeIndex(self.market_closes_nanos, tz='UTC')
+
+    @property
+    def first_trading_session(self):
+        return self.all_sessions[0]
+
+    @property
+    def last_trading_session(self):
+        return self.all_sessions[-1]
+
+    @lazyval
+    def _minute_offsets(self):
+        return compute_minute_offsets(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+        )
+
+    @lazyval
+    def all_minutes(self):
+        """
+        Returns a DatetimeIndex representing all the minutes during which the
+        combination is open.
+        """
+        return DatetimeIndex(
+            compute_all_minutes(
+                self.market_opens_nanos,
+                self.market_closes_nanos,
+            ),
+            tz='UTC',
+        )
+
+    def is_session(self, dt):
+        """
+        Given a dt, returns whether it's a session label of the combination.
+        """
+        return dt in self.all_sessions
+
+    def sessions_in_range(self, start_session_label, end_session_label):
+        """
+        Given start and end session labels, return all the sessions of the
+        combination in that range, inclusive.
+        """
+        return self.all_sessions[
+            self.all_sessions.slice_indexer(
+                start_session_label,
+                end_session_label
+            )
+        ]
+
+    def is_open_on_minute(self, dt):
+        """
+        Given a dt, return whether the combination is open at the given dt.
+        """
+        return is_open(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+            dt.value,
+        )
+
+    def is_open_on_minutes(self, dts):
+        """
+        Given an array of dts, return whether the combination is open at each.
+        """
+        return are_open(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+            nanos_array(dts),
+        )
+
+    def _cannot_go_later(self, dt):
+        return ValueError(
+            "Cannot go later in calendar: %s is at or after the last "
+            "interval of %r." % (dt, self)
+        )
+
+    def next_open(self, dt):
+        """
+        Given a dt, returns the next time the combination opens.
+
+        Raises ValueError if the combination doesn't open after ``dt``.
+        """
+        try:
+            idx = next_divider_idx(self.market_opens_nanos, dt.value)
+            return pd.Timestamp(self.market_opens_nanos[idx], tz='UTC')
+        except IndexError:
+            raise self._cannot_go_later(dt)
+
+    def next_close(self, dt):
+        """
+        Given a dt, returns the last minute of the next interval during which
+        the combination is open.
+
+        Raises ValueError if no interval of the combination closes after
+        ``dt``.
+        """
+        try:
+            idx = next_divider_idx(self.market_closes_nanos, dt.value)
+            return pd.Timestamp(self.market_closes_nanos[idx], tz='UTC')
+        except IndexError:
+            raise self._cannot_go_later(dt)
+
+    def previous_open(self, dt):
+        """
+        Given a dt, returns the previous time the combination opened.
+        """
+        idx = previous_divider_idx(self.market_opens_nanos, dt.value)
+        return pd.Timestamp(self.market_opens_nanos[idx], tz='UTC')
+
+    def previous_close(self, dt):
+        """
+        Given a dt, returns the last minute of the previous interval during
+        which the combination was open.
+        """
+        idx = previous_divider_idx(self.market_closes_nanos, dt.value)
+        return pd.Timestamp(self.market_closes_nanos[idx], tz='UTC')
+
+    def next_minute(self, dt):
+        """
+        Given a dt, return the next minute at which the combination is open.
+
+        Raises ValueError if the combination isn't open after ``dt``.
+        """
+        try:
+            minute_val = next_minute_val(
+                self.market_opens_nanos,
+                self.market_closes_nanos,
+                dt.value,
+            )
+        except IndexError:
+            raise self._cannot_go_later(dt)
+        return pd.Timestamp(minute_val, tz='UTC')
+
+    def previous_minute(self, dt):
+        """
+        Given a dt, return the previous minute at which the combination was
+        open.
+        """
+        return pd.Timestamp(
+            previous_minute_val(
+                self.market_opens_nanos,
+                self.market_closes_nanos,
+                dt.value,
+            ),
+            tz='UTC',
+        )
+
+    def minutes_in_range(self, start_minute, end_minute):
+        """
+        Given start and end minutes, return all the minutes in that range,
+        inclusive, during which the combination is open.
+        """
+        start_idx = minute_position(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+            self._minute_offsets,
+            start_minute.value,
+        )
+        end_idx = minute_position(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+            self._minute_offsets,
+            end_minute.value,
+            side='right',
+        )
+        return DatetimeIndex(
+            minutes_in_position_range(
+                self.market_opens_nanos,
+                self._minute_offsets,
+                start_idx,
+                end_idx,
+            ),
+            tz='UTC',
+        )
+
+
+class CalendarIntersection(CalendarCombination):
+    """
+    The minutes during which every one of several calendars is open.
+
+    The sessions of the intersection are the labels that are sessions of
+    every calendar and during whose sessions every calendar is open at the
+    same time, at least for a minute.
+
+    Parameters
+    ----------
+    calendars : iterable[TradingCalendar]
+        The calendars to intersect.
+    """
+    def _min_count(self, num_calendars):
+        return num_calendars
+
+    def _combine_sessions(self):
+        labels = reduce(
+            DatetimeIndex.intersection,
+            [c.all_sessions for c in self.calendars],
+        )
+
+        # The window on each label during which all of its sessions are
+        # under way. Every minute of the intersection in that window belongs
+        # to each calendar's session on the label.
+        window_starts = window_ends = None
+        for calendar in self.calendars:
+            idxs = calendar.all_sessions.get_indexer(labels)
+            opens = calendar.market_opens_nanos[idxs]
+            closes = calendar.market_closes_nanos[idxs]
+            if window_starts is None:
+                window_starts, window_ends = opens, closes
+            else:
+                window_starts = np.maximum(window_starts, opens)
+                window_ends = np.minimum(window_ends, closes)
+
+        opens = self.market_opens_nanos
+        closes = self.market_closes_nanos
+        if not len(opens):
+            return labels[:0]
+
+        # The first interval ending in each window must start within it.
+        interval_idxs = np.searchsorted(closes, window_starts)
+        in_range = interval_idxs < len(closes)
+        interval_starts = opens[np.where(in_range, interval_idxs, 0)]
+        return labels[in_range & (interval_starts <= window_ends)]
+
+
+class CalendarUnion(CalendarCombination):
+    """
+    The minutes during which any of several calendars is open.
+
+    The sessions of the union are the labels that are sessions of any of the
+    calendars.
+
+    Parameters
+    ----------
+    calendars : iterable[TradingCalendar]
+        The calendars to combine.
+    """
+    def _min_count(self, num_calendars):
+        return 1
+
+    def _combine_sessions(self):
+        return reduce(
+            DatetimeIndex.union,
+            [c.all_sessions for c in self.calendars],
+        )
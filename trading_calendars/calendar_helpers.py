@@ -1,6 +1,13 @@
+from collections import namedtuple
+
+from lru import LRU
 import numpy as np
 
 NANOSECONDS_PER_MINUTE = int(6e10)
+NANOSECONDS_PER_DAY = 24 * 60 * NANOSECONDS_PER_MINUTE
+
+# The nanosecond value of NaT, used for sessions without a break.
+NAT_NANOS = np.iinfo(np.int64).min
 
 
 def next_divider_idx(dividers, minute_val):
@@ -25,6 +32,29 @@ def previous_divider_idx(dividers, minute_val):
     return divider_idx - 1
 
 
+def next_divider_idxs(dividers, minute_vals):
+    """
+    Vectorized version of ``next_divider_idx``.
+
+    Searching to the right means that a minute exactly on a divider goes to
+    the next one. Indexing ``dividers`` with the result raises IndexError for
+    minutes at or after the last divider, as with the scalar version.
+    """
+    return np.searchsorted(dividers, minute_vals, side="right")
+
+
+def previous_divider_idxs(dividers, minute_vals):
+    """
+    Vectorized version of ``previous_divider_idx``.
+    """
+    divider_idxs = np.searchsorted(dividers, minute_vals)
+
+    if (divider_idxs == 0).any():
+        raise ValueError("Cannot go earlier in calendar!")
+
+    return divider_idxs - 1
+
+
 def is_open(opens, closes, minute_val):
 
     open_idx = np.searchsorted(opens, minute_val)
@@ -44,28 +74,458 @@ def is_open(opens, closes, minute_val):
             return False
 
 
-def compute_all_minutes(opens_in_ns, closes_in_ns):
+def are_open(opens, closes, minute_vals):
+    """
+    Vectorized version of ``is_open``.
+
+    A minute is within a session exactly when more sessions have opened at
+    or before it than have closed strictly before it.
+    """
+    opened = np.searchsorted(opens, minute_vals, side='right')
+    closed = np.searchsorted(closes, minute_vals, side='left')
+    return opened != closed
+
+
+def minute_to_session_idxs(opens,
+                           closes,
+                           minute_vals,
+                           direction="next",
+                           break_starts=None,
+                           break_ends=None):
+    """
+    Given arrays of opens, closes and (unsorted) minutes, all in nanoseconds,
+    return the index of the session containing each minute.
+
+    ``direction`` decides what happens to minutes outside of any session, as
+    in ``TradingCalendar.minute_to_session_label``: "next" uses the next
+    session, "previous" uses the previous session, and "none" raises a
+    ValueError. If ``break_starts`` and ``break_ends`` are given, minutes
+    during a session's break are also rejected by "none".
+    """
+    # The first session closing at or after each minute.
+    session_idxs = np.searchsorted(closes, minute_vals)
+
+    if direction == "next":
+        return session_idxs
+    elif direction not in ("previous", "none"):
+        raise ValueError("Invalid direction parameter: {0}".format(direction))
+
+    closed = ~are_open(opens, closes, minute_vals)
+    if direction == "previous":
+        session_idxs = np.where(closed, session_idxs - 1, session_idxs)
+        if (session_idxs < 0).any():
+            raise ValueError("Cannot go earlier in calendar!")
+        return session_idxs
+
+    if break_starts is not None:
+        clipped = np.minimum(session_idxs, len(closes) - 1)
+        closed |= (
+            (break_starts[clipped] < minute_vals) &
+            (minute_vals < break_ends[clipped])
+        )
+    if closed.any():
+        raise ValueError(
+            "{0} of the given dts are not exchange minutes!".format(
+                closed.sum(),
+            )
+        )
+
+    return session_idxs
+
+
+def compute_all_minutes(opens_in_ns,
+                        closes_in_ns,
+                        break_starts_in_ns=None,
+                        break_ends_in_ns=None):
     """
     Given arrays of opens and closes, both in nanoseconds,
     return an array of each minute between the opens and closes.
-    """
-    deltas = closes_in_ns - opens_in_ns
 
-    # + 1 because we want 390 mins per standard day, not 389
-    daily_sizes = (deltas // NANOSECONDS_PER_MINUTE) + 1
-    num_minutes = daily_sizes.sum()
-
-    # One allocation for the entire thing. This assumes that each day
-    # represents a contiguous block of minutes.
-    pieces = []
-
-    for open_, size in zip(opens_in_ns, daily_sizes):
-        pieces.append(
-            np.arange(open_,
-                      open_ + size * NANOSECONDS_PER_MINUTE,
-                      NANOSECONDS_PER_MINUTE)
+    If ``break_starts_in_ns`` and ``break_ends_in_ns`` are given, the minutes
+    strictly between each session's break start and break end are excluded.
+    """
+    if break_starts_in_ns is not None:
+        opens_in_ns, closes_in_ns, _ = compute_intervals(
+            opens_in_ns,
+            closes_in_ns,
+            break_starts_in_ns,
+            break_ends_in_ns,
         )
 
-    out = np.concatenate(pieces).view('datetime64[ns]')
-    assert len(out) == num_minutes
+    offsets = compute_minute_offsets(opens_in_ns, closes_in_ns)
+    out = minutes_in_position_range(
+        opens_in_ns,
+        offsets,
+        0,
+        offsets[-1],
+    ).view('datetime64[ns]')
     return out
+
+
+def compute_intervals(opens, closes, break_starts, break_ends):
+    """
+    Split each session at its break into the intervals during which the market
+    is open.
+
+    Parameters
+    ----------
+    opens, closes : np.ndarray[int64]
+        The first and last minute of each session, in nanoseconds.
+    break_starts, break_ends : np.ndarray[int64]
+        The last minute before and the first minute after each session's
+        break, in nanoseconds, or ``NAT_NANOS`` for sessions without a break.
+
+    Returns
+    -------
+    starts, ends : np.ndarray[int64]
+        The first and last minute of each interval, sorted.
+    session_offsets : np.ndarray[int64]
+        The index of each session's first interval, followed by the number of
+        intervals, so that session ``i`` is made up of the intervals
+        ``session_offsets[i]:session_offsets[i + 1]``.
+    """
+    has_break = break_starts != NAT_NANOS
+    if not has_break.any():
+        # One interval per session; share the arrays.
+        return opens, closes, np.arange(len(opens) + 1, dtype=np.int64)
+
+    session_offsets = np.empty(len(opens) + 1, dtype=np.int64)
+    session_offsets[0] = 0
+    np.cumsum(has_break + 1, out=session_offsets[1:])
+
+    starts = np.empty(session_offsets[-1], dtype=np.int64)
+    ends = np.empty(session_offsets[-1], dtype=np.int64)
+
+    first = session_offsets[:-1]
+    starts[first] = opens
+    ends[first] = np.where(has_break, break_starts, closes)
+
+    second = first[has_break] + 1
+    starts[second] = break_ends[has_break]
+    ends[second] = closes[has_break]
+
+    return starts, ends, session_offsets
+
+
+def compute_minute_offsets(starts_in_ns, ends_in_ns):
+    """
+    Given arrays of interval starts and (inclusive) ends, both in nanoseconds,
+    return the number of minutes preceding each interval, followed by the
+    total number of minutes.
+
+    Together with ``starts_in_ns`` and ``ends_in_ns``, this describes every
+    minute of the intervals without materializing them: the minute at
+    position ``offsets[i] + k`` is ``starts_in_ns[i] + k`` minutes.
+    """
+    # + 1 because we want 390 mins per standard day, not 389
+    sizes = (ends_in_ns - starts_in_ns) // NANOSECONDS_PER_MINUTE + 1
+
+    offsets = np.empty(len(sizes) + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets
+
+
+def minute_position(starts, ends, offsets, minute_val, side='left'):
+    """
+    Find the position of ``minute_val`` among the minutes of the intervals.
+
+    This is equivalent to ``np.searchsorted(all_minutes, minute_val, side)``,
+    but only searches the intervals.
+    """
+    idx = np.searchsorted(ends, minute_val)
+    if idx == len(ends):
+        # after the last interval
+        return int(offsets[-1])
+
+    start = starts[idx]
+    if minute_val < start:
+        # between intervals, or before the first one
+        return int(offsets[idx])
+
+    if side == 'left':
+        # the number of minutes strictly before minute_val
+        within = -((start - minute_val) // NANOSECONDS_PER_MINUTE)
+    else:
+        # the number of minutes at or before minute_val
+        within = (minute_val - start) // NANOSECONDS_PER_MINUTE + 1
+
+    return int(offsets[idx] + within)
+
+
+def next_minute_val(starts, ends, minute_val):
+    """
+    Return the first minute, in nanoseconds, of the intervals that is after
+    ``minute_val``.
+
+    Raises IndexError if there is no such minute.
+    """
+    idx = np.searchsorted(ends, minute_val, side='right')
+    start = starts[idx]
+    if minute_val < start:
+        return int(start)
+
+    steps = (minute_val - start) // NANOSECONDS_PER_MINUTE + 1
+    return int(start + steps * NANOSECONDS_PER_MINUTE)
+
+
+def previous_minute_val(starts, ends, minute_val):
+    """
+    Return the last minute, in nanoseconds, of the intervals that is before
+    ``minute_val``.
+
+    Raises ValueError if there is no such minute.
+    """
+    idx = np.searchsorted(starts, minute_val) - 1
+    if idx < 0:
+        raise ValueError("Cannot go earlier in calendar!")
+
+    if minute_val > ends[idx]:
+        return int(ends[idx])
+
+    start = starts[idx]
+    steps = -((start - minute_val) // NANOSECONDS_PER_MINUTE) - 1
+    return int(start + steps * NANOSECONDS_PER_MINUTE)
+
+
+def minutes_in_position_range(starts, offsets, start_pos, end_pos):
+    """
+    Return an array of the minutes, in nanoseconds, at positions
+    ``[start_pos, end_pos)`` among the minutes of the intervals.
+    """
+    if end_pos <= start_pos:
+        return np.array([], dtype=np.int64)
+
+    first = np.searchsorted(offsets, start_pos, side='right') - 1
+    last = np.searchsorted(offsets, end_pos - 1, side='right') - 1
+
+    # The minute at position p in interval i is
+    # (starts[i] - offsets[i] minutes) + p minutes, so repeat each interval's
+    # base once per requested minute and add the positions.
+    bounds = offsets[first:last + 2].copy()
+    bounds[0] = start_pos
+    bounds[-1] = end_pos
+    bases = (
+        starts[first:last + 1] -
+        offsets[first:last + 1] * NANOSECONDS_PER_MINUTE
+    )
+
+    return (
+        np.repeat(bases, np.diff(bounds)) +
+        np.arange(start_pos, end_pos, dtype=np.int64) * NANOSECONDS_PER_MINUTE
+    )
+
+
+def combine_intervals(starts, ends, min_count):
+    """
+    Find the minutes covered by at least ``min_count`` of several sets of
+    intervals, in one sorted sweep.
+
+    Parameters
+    ----------
+    starts : list[np.ndarray[int64]]
+        For each set, the sorted starts of its non-overlapping intervals, in
+        nanoseconds.
+    ends : list[np.ndarray[int64]]
+        For each set, the (inclusive) ends of its intervals, in nanoseconds.
+    min_count : int
+        The number of sets that must cover a minute for it to be included.
+        ``len(starts)`` gives the intersection of the sets and 1 their union.
+
+    Returns
+    -------
+    starts, ends : np.ndarray[int64]
+        The starts and (inclusive) ends of the covered intervals. Touching
+        intervals are merged.
+    """
+    starts = np.concatenate(starts)
+    # Sweep over half-open intervals so that touching intervals meet.
+    ends = np.concatenate(ends) + NANOSECONDS_PER_MINUTE
+
+    times = np.concatenate([starts, ends])
+    deltas = np.concatenate([
+        np.ones(len(starts), dtype=np.int64),
+        np.full(len(ends), -1, dtype=np.int64),
+    ])
+
+    # Sort by time, with starts before ends at equal times so that an
+    # interval starting where another ends continues the coverage.
+    order = np.lexsort((-deltas, times))
+    times = times[order]
+    covered = np.cumsum(deltas[order]) >= min_count
+    was_covered = np.concatenate([[False], covered[:-1]])
+
+    out_starts = times[covered & ~was_covered]
+    out_ends = times[~covered & was_covered]
+
+    nonempty = out_starts < out_ends
+    return out_starts[nonempty], out_ends[nonempty] - NANOSECONDS_PER_MINUTE
+
+
+# The number of set bits in each byte value.
+_BYTE_POPCOUNTS = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, None],
+    axis=1,
+).sum(axis=1).astype(np.int64)
+
+SessionBitmap = namedtuple(
+    'SessionBitmap',
+    'first_session num_days bits ranks',
+)
+
+
+def compute_session_bitmap(sessions):
+    """
+    Build a bitset with one bit per day from the first session to the last,
+    set on the days that are sessions.
+
+    Parameters
+    ----------
+    sessions : np.ndarray[int64]
+        The sorted session labels, as nanoseconds at midnight UTC.
+
+    Returns
+    -------
+    bitmap : SessionBitmap
+        ``bits`` holds the days most significant bit first, as
+        ``np.packbits`` packs them, followed by at least one clear byte, and
+        ``ranks[i]`` is the number of sessions in the bytes before
+        ``bits[i]``.
+    """
+    first_session = int(sessions[0])
+    days = (sessions - first_session) // NANOSECONDS_PER_DAY
+    num_days = int(days[-1]) + 1
+
+    flags = np.zeros(num_days + 8, dtype=bool)
+    flags[days] = True
+    bits = np.packbits(flags)
+
+    ranks = np.empty(len(bits), dtype=np.int64)
+    ranks[0] = 0
+    np.cumsum(_BYTE_POPCOUNTS[bits[:-1]], out=ranks[1:])
+
+    return SessionBitmap(first_session, num_days, bits, ranks)
+
+
+def bitmap_contains(bitmap, nanos):
+    """
+    Whether each of ``nanos`` is a session label.
+    """
+    offsets = nanos - bitmap.first_session
+    days = offsets // NANOSECONDS_PER_DAY
+    valid = (
+        (offsets % NANOSECONDS_PER_DAY == 0) &
+        (days >= 0) &
+        (days < bitmap.num_days)
+    )
+    days = np.where(valid, days, 0)
+    return valid & (
+        (bitmap.bits[days >> 3] >> (7 - (days & 7))) & 1
+    ).astype(bool)
+
+
+def bitmap_rank(bitmap, days):
+    """
+    The number of sessions on the days before each of ``days``, given as
+    positions in ``[0, bitmap.num_days]``.
+    """
+    days = np.asarray(days)
+    bytes_ = days >> 3
+    # The bits of the days before each day within its byte are the high ones.
+    masks = np.right_shift(0xff00, days & 7) & 0xff
+    return bitmap.ranks[bytes_] + _BYTE_POPCOUNTS[bitmap.bits[bytes_] & masks]
+
+
+def bitmap_searchsorted(bitmap, nanos, side='left'):
+    """
+    Equivalent to ``np.searchsorted(sessions, nanos, side)``, using the
+    bitmap's prefix counts instead of a binary search.
+    """
+    offsets = nanos - bitmap.first_session
+    if side == 'left':
+        # the number of days starting strictly before nanos
+        days = -(-offsets // NANOSECONDS_PER_DAY)
+    else:
+        # the number of days starting at or before nanos
+        days = offsets // NANOSECONDS_PER_DAY + 1
+
+    if isinstance(days, np.ndarray):
+        return bitmap_rank(bitmap, np.clip(days, 0, bitmap.num_days))
+
+    # Plain integer arithmetic is much cheaper than numpy's for one value.
+    day = min(max(days, 0), bitmap.num_days)
+    byte = day >> 3
+    return bitmap.ranks.item(byte) + _BYTE_POPCOUNTS.item(
+        bitmap.bits.item(byte) & (0xff00 >> (day & 7)) & 0xff,
+    )
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses size session_range')
+
+
+class MinuteToSessionLabelCache(object):
+    """
+    A cache of minute -> session label lookups.
+
+    Parameters
+    ----------
+    size : int
+        The number of recently requested minutes whose "next" session label
+        is remembered. 0 disables this part of the cache.
+    session_range : bool
+        If True, also remember the open and close of the last session that
+        contained a requested minute, so that any minute inside it hits,
+        whatever its direction.
+    """
+    def __init__(self, size=1, session_range=False):
+        self.size = size
+        self.session_range = session_range
+        self._labels = LRU(size) if size else None
+        # An empty range until a session is remembered.
+        self._range_open, self._range_close, self._range_label = 1, 0, None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, minute_val, direction):
+        """
+        Look up the label of the session for ``minute_val``.
+
+        Raises KeyError on a miss.
+        """
+        if self._range_open <= minute_val <= self._range_close:
+            self.hits += 1
+            return self._range_label
+
+        if direction == "next" and self._labels is not None:
+            try:
+                label = self._labels[minute_val]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                return label
+
+        self.misses += 1
+        raise KeyError(minute_val)
+
+    def set(self, minute_val, label, open_val, close_val):
+        """
+        Remember that ``label`` is the next session for ``minute_val``, and
+        that the market is open from ``open_val`` to ``close_val`` during
+        that session, without a break.
+        """
+        if self._labels is not None:
+            self._labels[minute_val] = label
+
+        if self.session_range and open_val <= minute_val:
+            self._range_open = open_val
+            self._range_close = close_val
+            self._range_label = label
+
+    def info(self):
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=self.size,
+            session_range=self.session_range,
+        )
@@ -1,3 +1,5 @@
+from threading import Lock
+
 from .always_open import AlwaysOpenCalendar
 from .errors import (
     CalendarNameCollision,
@@ -17,6 +19,8 @@ from .exchange_calendar_xnym import XNYMExchangeCalendar
 from .exchange_calendar_xnys import XNYSExchangeCalendar
 from .exchange_calendar_xpar import XPARExchangeCalendar
 from .exchange_calendar_xtse import XTSEExchangeCalendar
+from .schedule_cache import get_schedule_cache, set_schedule_cache
+from .trading_calendar import TradingCalendar
 from .weekday_calendar import WeekdayCalendar
 
 _default_calendar_factories = {
@@ -70,10 +74,19 @@ class TradingCalendarDispatcher(object):
         self._calendar_factories = calendar_factories
         self._aliases = aliases
 
+        # One lock per calendar name, held while that calendar is built, so
+        # that concurrent requests for it construct it only once.
+        self._construction_locks = {}
+        self._construction_locks_lock = Lock()
+
     def get_calendar(self, name):
         """
         Retrieves an instance of an TradingCalendar whose name is given.
 
+        This is safe to call from multiple threads. If several threads request
+        a calendar that hasn't been loaded yet, one of them constructs it while
+        the others wait for it.
+
         Parameters
         ----------
         name : str
@@ -98,9 +111,98 @@ class TradingCalendarDispatcher(object):
             # We don't have a factory registered for this name.  Barf.
             raise InvalidCalendarName(calendar_name=name)
 
-        # Cache the calendar for future use.
-        calendar = self._calendars[canonical_name] = factory()
-        return calendar
+        with self._construction_lock(canonical_name):
+            try:
+                # Another thread may have built it while we were waiting.
+                return self._calendars[canonical_name]
+            except KeyError:
+                pass
+
+            # Cache the calendar for future use.
+            calendar = self._calendars[canonical_name] = factory()
+            return calendar
+
+    def warm_calendars(self, names=None, executor=None):
+        """
+        Construct calendars concurrently in worker processes.
+
+        The rules of calendars registered by type are evaluated in
+        ``executor``, and only their int64 schedule arrays are sent back, from
+        which the calendars are built without evaluating any rules. If a
+        schedule cache is configured, the workers save the arrays to it
+        instead, and the calendars are loaded from there. Calendars
+        registered with other factories are built in this process.
+
+        Parameters
+        ----------
+        names : iterable[str], optional
+            The names of the calendars to construct. Default is every calendar
+            with a registered factory.
+        executor : concurrent.futures.Executor, optional
+            The executor in which to build the calendars. Default is a new
+            ``ProcessPoolExecutor``, which is shut down before returning.
+
+        Returns
+        -------
+        calendars : dict[str -> TradingCalendar]
+            The requested calendars, keyed by the given names.
+        """
+        if names is None:
+            names = list(self._calendar_factories)
+
+        canonical_names = {name: self.resolve_alias(name) for name in names}
+
+        to_build = {}
+        for name in set(canonical_names.values()):
+            if name in self._calendars:
+                continue
+            try:
+                factory = self._calendar_factories[name]
+            except KeyError:
+                raise InvalidCalendarName(calendar_name=name)
+            if isinstance(factory, type) and \
+                    issubclass(factory, TradingCalendar):
+                to_build[name] = factory
+
+        if to_build:
+            owns_executor = executor is None
+            if owns_executor:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor()
+            try:
+                cache = get_schedule_cache()
+                futures = {
+                    name: executor.submit(_schedule_arrays, factory, cache)
+                    for name, factory in to_build.items()
+                }
+                for name, future in futures.items():
+                    arrays = future.result()
+                    with self._construction_lock(name):
+                        if name in self._calendars:
+                            continue
+                        factory = to_build[name]
+                        if arrays is None:
+                            # The worker saved the schedule to the cache.
+                            calendar = factory()
+                        else:
+                            calendar = factory._from_schedule_arrays(arrays)
+                        self._calendars[name] = calendar
+            finally:
+                if owns_executor:
+                    executor.shutdown()
+
+        return {
+            name: self.get_calendar(canonical_name)
+            for name, canonical_name in canonical_names.items()
+        }
+
+    def _construction_lock(self, name):
+        with self._construction_locks_lock:
+            try:
+                return self._construction_locks[name]
+            except KeyError:
+                lock = self._construction_locks[name] = Lock()
+                return lock
 
     def has_calendar(self, name):
         """
@@ -261,6 +363,23 @@ class TradingCalendarDispatcher(object):
         self._aliases.clear()
 
 
+def _schedule_arrays(calendar_type, cache):
+    # Run in the worker processes of `warm_calendars`.
+    #
+    # The type's own __init__ is run, so that its default range is used, but
+    # the arrays it would hydrate the calendar with are captured instead:
+    # building the calendar's indexes and minutes here would be wasted work.
+    # With a cache, __init__ saves the arrays to it and nothing is returned.
+    set_schedule_cache(cache)
+    arrays = {}
+    calendar = object.__new__(calendar_type)
+    calendar._hydrate = lambda **kwargs: arrays.update(kwargs)
+    calendar.__init__()
+    if cache is not None:
+        return None
+    return arrays
+
+
 # We maintain a global calendar dispatcher so that users can just do
 # `register_calendar('my_calendar', calendar) and then use `get_calendar`
 # without having to thread around a dispatcher.
@@ -277,3 +396,4 @@ register_calendar = global_calendar_dispatcher.register_calendar
 register_calendar_type = global_calendar_dispatcher.register_calendar_type
 register_calendar_alias = global_calendar_dispatcher.register_calendar_alias
 resolve_alias = global_calendar_dispatcher.resolve_alias
+warm_calendars = global_calendar_dispatcher.warm_calendars
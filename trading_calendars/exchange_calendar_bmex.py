@@ -40,6 +40,7 @@ from .trading_calendar import (
     TradingCalendar,
     WEEKDAYS,
 )
+from .utils.memoize import classlazyval
 
 NewYearsDay = new_years_day()
 
@@ -127,7 +128,7 @@ class BMEXExchangeCalendar(TradingCalendar):
         (None, time(17, 30)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsDay,
@@ -146,7 +147,7 @@ class BMEXExchangeCalendar(TradingCalendar):
             NewYearsEveThrough2010,
         ])
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (
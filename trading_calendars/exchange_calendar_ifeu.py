@@ -40,6 +40,7 @@ class IFEUExchangeCalendar(TradingCalendar):
     https://www.theice.com/publicdocs/futures/Trading_Schedule_Migrated_Liffe_Contracts.pdf # noqa
     """
     product_group = 'UK' # UK, US, EU
+    _rule_attributes = ('product_group',)
     regular_early_close = time(13)
 
     name = 'IFEU'
@@ -19,6 +19,7 @@ from trading_calendars.us_holidays import (
     USMemorialDay,
     USIndependenceDay,
     USNationalDaysofMourning)
+from trading_calendars.utils.memoize import classlazyval
 
 
 class IFUSExchangeCalendar(TradingCalendar):
@@ -51,7 +52,7 @@ class IFUSExchangeCalendar(TradingCalendar):
     def open_offset(self):
         return -1
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (self.regular_early_close, HolidayCalendar([
@@ -64,7 +65,7 @@ class IFUSExchangeCalendar(TradingCalendar):
             ]))
         ]
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return list(chain(
             USNationalDaysofMourning,
@@ -73,7 +74,7 @@ class IFUSExchangeCalendar(TradingCalendar):
             [Timestamp('2012-10-29', tz='UTC')]
         ))
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         # https://www.theice.com/publicdocs/futures_us/exchange_notices/NewExNot2016Holidays.pdf # noqa
         return HolidayCalendar([
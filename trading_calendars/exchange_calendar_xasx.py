@@ -36,6 +36,7 @@ from .common_holidays import (
     weekend_boxing_day,
 )
 from .trading_calendar import HolidayCalendar, TradingCalendar
+from .utils.memoize import classlazyval
 
 NewYearsDay = new_years_day(observance=weekend_to_monday)
 
@@ -121,7 +122,7 @@ class XASXExchangeCalendar(TradingCalendar):
         (None, time(16)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsDay,
@@ -137,11 +138,11 @@ class XASXExchangeCalendar(TradingCalendar):
             WeekendBoxingDay,
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return [EasterTuesday2011AdHoc]
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (
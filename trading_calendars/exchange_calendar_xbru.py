@@ -29,6 +29,7 @@ from .common_holidays import (
     new_years_eve,
 )
 from .trading_calendar import HolidayCalendar, TradingCalendar, WEEKDAYS
+from .utils.memoize import classlazyval
 
 NewYearsDay = new_years_day()
 
@@ -98,7 +99,7 @@ class XBRUExchangeCalendar(TradingCalendar):
         (None, time(17, 30)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsDay,
@@ -113,7 +114,7 @@ class XBRUExchangeCalendar(TradingCalendar):
             NewYearsEveBefore2002,
         ])
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (
@@ -38,6 +38,7 @@ from .us_holidays import (
     USMemorialDay,
     USIndependenceDay
 )
+from .utils.memoize import classlazyval
 
 
 class XCMEExchangeCalendar(TradingCalendar):
@@ -72,7 +73,7 @@ class XCMEExchangeCalendar(TradingCalendar):
     def open_offset(self):
         return -1
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         # The CME has different holiday rules depending on the type of
         # instrument. For example, http://www.cmegroup.com/tools-information/holiday-calendar/files/2016-4th-of-july-holiday-schedule.pdf # noqa
@@ -90,11 +91,11 @@ class XCMEExchangeCalendar(TradingCalendar):
             Christmas,
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return USNationalDaysofMourning
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [(
             self.regular_early_close,
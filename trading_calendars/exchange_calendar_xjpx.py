@@ -35,6 +35,7 @@ from .xjpx_holidays import (
     EmperorAkihitoBirthday,
     EmperorNaruhitoBirthday,
 )
+from .utils.memoize import classlazyval
 
 
 XJPX_START_DEFAULT = pd.Timestamp('2000-01-01', tz='UTC')
@@ -50,8 +51,8 @@ class XJPXExchangeCalendar(TradingCalendar):
     Lunch
     Second session: 12:30pm - 3:00pm
 
-    NOTE: we are treating the two sessions per day as one session for now,
-    because we will not be handling minutely data in the immediate future.
+    The two sessions of each day form a single session with a lunch break,
+    during which the exchange is closed.
 
     Regularly-Observed Holidays (see tse_holidays.py for more info):
     - New Year's Holidays (Dec. 31 - Jan. 3)
@@ -79,7 +80,7 @@ class XJPXExchangeCalendar(TradingCalendar):
 
     name = 'XJPX'
 
-    z = timezone('Asia/Tokyo')
+    tz = timezone('Asia/Tokyo')
 
     open_times = (
         (None, time(9, 1)),
@@ -89,7 +90,15 @@ class XJPXExchangeCalendar(TradingCalendar):
         (None, time(15)),
     )
 
-    @property
+    break_start_times = (
+        (None, time(11, 30)),
+    )
+
+    break_end_times = (
+        (None, time(12, 31)),
+    )
+
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsHolidayDec31,
@@ -116,7 +125,7 @@ class XJPXExchangeCalendar(TradingCalendar):
             EmperorNaruhitoBirthday,
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return list(chain(
             VernalEquinoxes,
@@ -27,6 +27,7 @@ from .common_holidays import (
     new_years_eve,
 )
 from .trading_calendar import HolidayCalendar, TradingCalendar
+from .utils.memoize import classlazyval
 
 NewYearsDay = new_years_day()
 
@@ -75,7 +76,7 @@ class XMILExchangeCalendar(TradingCalendar):
         (None, time(17, 30)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsDay,
@@ -43,6 +43,7 @@ class XMODExchangeCalendar(TradingCalendar):
     - EQD does not observe early close
     """
     product_group = 'EQD' # EQD or IRD
+    _rule_attributes = ('product_group',)
     eqd_regular_early_close = time(13)
     ird_regular_early_close = time(13, 30)
     # ird_open_time = time(2, 31)
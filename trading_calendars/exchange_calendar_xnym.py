@@ -38,6 +38,7 @@ from .us_holidays import (
     USMemorialDay,
     USIndependenceDay
 )
+from .utils.memoize import classlazyval
 
 
 class XNYMExchangeCalendar(TradingCalendar):
@@ -68,7 +69,7 @@ class XNYMExchangeCalendar(TradingCalendar):
     def open_offset(self):
         return -1
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         # The CME has different holiday rules depending on the type of
         # instrument. For example, http://www.cmegroup.com/tools-information/holiday-calendar/files/2016-4th-of-july-holiday-schedule.pdf # noqa
@@ -86,11 +87,11 @@ class XNYMExchangeCalendar(TradingCalendar):
             Christmas,
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return USNationalDaysofMourning
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [(
             self.regular_early_close,
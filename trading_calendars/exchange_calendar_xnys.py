@@ -42,6 +42,7 @@ from .us_holidays import (
     ChristmasEveBefore1993,
     ChristmasEveInOrAfter1993,
 )
+from .utils.memoize import classlazyval
 
 # Useful resources for making changes to this file:
 # http://www.nyse.com/pdfs/closings.pdf
@@ -110,7 +111,7 @@ class XNYSExchangeCalendar(TradingCalendar):
         (None, time(16)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             USNewYearsDay,
@@ -124,7 +125,7 @@ class XNYSExchangeCalendar(TradingCalendar):
             Christmas,
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         return list(chain(
             September11Closings,
@@ -132,7 +133,7 @@ class XNYSExchangeCalendar(TradingCalendar):
             USNationalDaysofMourning,
         ))
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (self.regular_early_close, HolidayCalendar([
@@ -147,7 +148,7 @@ class XNYSExchangeCalendar(TradingCalendar):
             ])),
         ]
 
-    @property
+    @classlazyval
     def special_closes_adhoc(self):
         return [
             (
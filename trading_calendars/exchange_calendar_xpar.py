@@ -28,6 +28,7 @@ from .common_holidays import (
     new_years_eve,
 )
 from .trading_calendar import HolidayCalendar, TradingCalendar, WEEKDAYS
+from .utils.memoize import classlazyval
 
 NewYearsDay = new_years_day()
 
@@ -96,7 +97,7 @@ class XPARExchangeCalendar(TradingCalendar):
         (None, time(17, 30)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             NewYearsDay,
@@ -110,7 +111,7 @@ class XPARExchangeCalendar(TradingCalendar):
             NewYearsEveBefore2002,
         ])
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (
@@ -27,6 +27,7 @@ from .common_holidays import (
     boxing_day,
     weekend_boxing_day,
 )
+from .utils.memoize import classlazyval
 
 
 # New Year's Day
@@ -138,7 +139,7 @@ class XTSEExchangeCalendar(TradingCalendar):
         (None, time(16)),
     )
 
-    @property
+    @classlazyval
     def regular_holidays(self):
         return HolidayCalendar([
             XTSENewYearsDay,
@@ -155,14 +156,14 @@ class XTSEExchangeCalendar(TradingCalendar):
             WeekendBoxingDay
         ])
 
-    @property
+    @classlazyval
     def adhoc_holidays(self):
         # NOTE: change the name of this property
         return list(chain(
             September11ClosingsCanada
         ))
 
-    @property
+    @classlazyval
     def special_closes(self):
         return [
             (self.regular_early_close, HolidayCalendar([
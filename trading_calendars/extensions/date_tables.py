@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Dates of the lunar festivals, equinoxes and solstices for the years
+FIRST_YEAR through LAST_YEAR, used by offset_extensions.
+
+Each table holds ``month * 100 + day`` for every year, starting at
+FIRST_YEAR. The equinoxes and solstices are UTC dates.
+
+Generated by scripts/generate_date_tables.py. Do not edit by hand.
+"""
+import numpy as np
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2099
+
+
+# Lunar New Year, the 1st day of the 1st lunar month.
+LUNAR_NEW_YEAR = np.array([
+     131,  219,  208,  129,  216,  204,  125,  213,  202,  122,  # 1900
+     210,  130,  218,  206,  126,  214,  203,  123,  211,  201,  # 1910
+     220,  208,  128,  216,  205,  124,  213,  202,  123,  210,  # 1920
+     130,  217,  206,  126,  214,  204,  124,  211,  131,  219,  # 1930
+     208,  127,  215,  205,  125,  213,  202,  122,  210,  129,  # 1940
+     217,  206,  127,  214,  203,  124,  212,  131,  218,  208,  # 1950
+     128,  215,  205,  125,  213,  202,  121,  209,  130,  217,  # 1960
+     206,  127,  215,  203,  123,  211,  131,  218,  207,  128,  # 1970
+     216,  205,  125,  213,  202,  220,  209,  129,  217,  206,  # 1980
+     127,  215,  204,  123,  210,  131,  219,  207,  128,  216,  # 1990
+     205,  124,  212,  201,  122,  209,  129,  218,  207,  126,  # 2000
+     214,  203,  123,  210,  131,  219,  208,  128,  216,  205,  # 2010
+     125,  212,  201,  122,  210,  129,  217,  206,  126,  213,  # 2020
+     203,  123,  211,  131,  219,  208,  128,  215,  204,  124,  # 2030
+     212,  201,  122,  210,  130,  217,  206,  126,  214,  202,  # 2040
+     123,  211,  201,  219,  208,  128,  215,  204,  124,  212,  # 2050
+     202,  121,  209,  129,  217,  205,  126,  214,  203,  123,  # 2060
+     211,  131,  219,  207,  127,  215,  205,  124,  212,  202,  # 2070
+     122,  209,  129,  217,  206,  126,  214,  203,  124,  210,  # 2080
+     130,  218,  207,  127,  215,  205,  125,  212,  201,  121,  # 2090
+], dtype=np.int16)
+
+# Buddha's Birthday, the 8th day of the 4th lunar month.
+BUDDHA_BIRTHDAY = np.array([
+     506,  525,  515,  504,  522,  511,  501,  519,  507,  526,  # 1900
+     516,  506,  524,  513,  502,  521,  509,  528,  517,  507,  # 1910
+     525,  515,  504,  523,  511,  430,  519,  508,  526,  516,  # 1920
+     506,  524,  513,  502,  520,  510,  528,  517,  507,  526,  # 1930
+     514,  503,  522,  511,  430,  519,  508,  527,  516,  505,  # 1940
+     524,  513,  501,  520,  510,  529,  517,  507,  526,  515,  # 1950
+     503,  522,  511,  501,  519,  508,  527,  516,  504,  523,  # 1960
+     512,  502,  520,  510,  429,  518,  506,  525,  514,  503,  # 1970
+     521,  511,  501,  520,  508,  527,  516,  505,  523,  512,  # 1980
+     502,  521,  510,  528,  518,  507,  524,  514,  503,  522,  # 1990
+     511,  430,  519,  508,  526,  515,  505,  524,  512,  502,  # 2000
+     521,  510,  428,  517,  506,  525,  514,  503,  522,  512,  # 2010
+     430,  519,  508,  526,  515,  505,  524,  513,  502,  520,  # 2020
+     509,  528,  516,  506,  525,  515,  503,  522,  511,  430,  # 2030
+     518,  507,  526,  516,  505,  524,  513,  502,  520,  509,  # 2040
+     528,  517,  506,  525,  515,  504,  522,  511,  430,  519,  # 2050
+     507,  526,  516,  505,  523,  512,  501,  520,  509,  428,  # 2060
+     517,  507,  525,  514,  503,  522,  510,  430,  519,  508,  # 2070
+     526,  516,  505,  524,  512,  501,  520,  510,  428,  517,  # 2080
+     507,  525,  513,  503,  521,  511,  430,  519,  508,  527,  # 2090
+], dtype=np.int16)
+
+# The Dragon Boat Festival, the 5th day of the 5th lunar month.
+DRAGON_BOAT_FESTIVAL = np.array([
+     601,  620,  610,  531,  618,  607,  626,  615,  603,  622,  # 1900
+     611,  601,  619,  609,  529,  617,  605,  623,  613,  602,  # 1910
+     620,  610,  531,  618,  606,  625,  614,  604,  622,  611,  # 1920
+     601,  620,  608,  528,  616,  605,  623,  613,  602,  621,  # 1930
+     610,  530,  618,  607,  625,  614,  604,  623,  611,  601,  # 1940
+     619,  609,  528,  615,  605,  624,  613,  602,  621,  610,  # 1950
+     529,  617,  606,  625,  614,  604,  623,  612,  531,  619,  # 1960
+     608,  528,  615,  605,  624,  614,  602,  621,  610,  530,  # 1970
+     617,  606,  625,  615,  604,  622,  611,  531,  618,  608,  # 1980
+     528,  616,  605,  624,  613,  602,  620,  609,  530,  618,  # 1990
+     606,  625,  615,  604,  622,  611,  531,  619,  608,  528,  # 2000
+     616,  606,  623,  612,  602,  620,  609,  530,  618,  607,  # 2010
+     625,  614,  603,  622,  610,  531,  619,  609,  528,  616,  # 2020
+     605,  624,  612,  601,  620,  610,  530,  618,  607,  527,  # 2030
+     614,  603,  622,  611,  531,  619,  608,  529,  615,  604,  # 2040
+     623,  613,  601,  620,  610,  530,  617,  606,  625,  614,  # 2050
+     603,  622,  611,  601,  619,  608,  528,  616,  604,  623,  # 2060
+     613,  602,  620,  610,  530,  617,  606,  624,  614,  604,  # 2070
+     622,  611,  601,  619,  607,  527,  615,  605,  623,  613,  # 2080
+     602,  621,  609,  529,  617,  606,  624,  614,  604,  623,  # 2090
+], dtype=np.int16)
+
+# The Mid-Autumn Festival, the 15th day of the 8th lunar month.
+MID_AUTUMN_FESTIVAL = np.array([
+     908,  927,  916, 1005,  924,  913, 1002,  922,  910,  928,  # 1900
+     918, 1006,  925,  915, 1004,  923,  912,  930,  919, 1008,  # 1910
+     926,  916, 1005,  925,  913, 1002,  921,  910,  928,  917,  # 1920
+    1006,  926,  915, 1004,  923,  912,  930,  919, 1008,  927,  # 1930
+     916, 1005,  924,  914, 1001,  920,  910,  929,  917, 1006,  # 1940
+     926,  915, 1003,  922,  911,  930,  919,  908,  927,  917,  # 1950
+    1005,  924,  913, 1002,  920,  910,  929,  918, 1006,  926,  # 1960
+     915, 1003,  922,  911,  930,  920,  908,  927,  916, 1005,  # 1970
+     923,  912, 1001,  921,  910,  929,  918, 1007,  925,  914,  # 1980
+    1003,  922,  911,  930,  920,  909,  927,  916, 1005,  924,  # 1990
+     912, 1001,  921,  911,  928,  918, 1006,  925,  914, 1003,  # 2000
+     922,  912,  930,  919,  908,  927,  915, 1004,  924,  913,  # 2010
+    1001,  921,  910,  929,  917, 1006,  925,  915, 1003,  922,  # 2020
+     912, 1001,  919,  908,  927,  916, 1004,  924,  913, 1002,  # 2030
+     920,  910,  928,  917, 1005,  925,  915, 1004,  922,  911,  # 2040
+     930,  919,  907,  926,  916, 1005,  924,  913, 1002,  921,  # 2050
+     909,  928,  917, 1006,  925,  915, 1003,  923,  911,  929,  # 2060
+     919,  908,  926,  916, 1005,  924,  912, 1001,  920,  910,  # 2070
+     928,  917, 1006,  926,  914, 1003,  922,  911,  929,  918,  # 2080
+     908,  927,  916, 1005,  924,  913,  930,  920,  909,  929,  # 2090
+], dtype=np.int16)
+
+# The Double Nine Festival, the 9th day of the 9th lunar month.
+DOUBLE_NINE_FESTIVAL = np.array([
+    1031, 1020, 1010, 1028, 1017, 1007, 1026, 1015, 1003, 1022,  # 1900
+    1011, 1030, 1018, 1008, 1027, 1017, 1005, 1024, 1013, 1101,  # 1910
+    1020, 1009, 1028, 1018, 1007, 1026, 1015, 1004, 1021, 1011,  # 1920
+    1030, 1019, 1008, 1027, 1016, 1006, 1023, 1012, 1031, 1021,  # 1930
+    1009, 1028, 1018, 1007, 1025, 1014, 1003, 1022, 1011, 1030,  # 1940
+    1019, 1009, 1027, 1016, 1005, 1024, 1012, 1031, 1021, 1010,  # 1950
+    1028, 1018, 1007, 1025, 1014, 1003, 1022, 1012, 1030, 1019,  # 1960
+    1008, 1027, 1015, 1004, 1023, 1013, 1031, 1021, 1010, 1029,  # 1970
+    1017, 1006, 1025, 1014, 1003, 1022, 1012, 1031, 1019, 1008,  # 1980
+    1026, 1016, 1004, 1023, 1013, 1101, 1020, 1010, 1028, 1017,  # 1990
+    1006, 1025, 1014, 1004, 1022, 1011, 1030, 1019, 1007, 1026,  # 2000
+    1016, 1005, 1023, 1013, 1002, 1021, 1009, 1028, 1017, 1007,  # 2010
+    1025, 1014, 1004, 1023, 1011, 1029, 1018, 1008, 1026, 1016,  # 2020
+    1005, 1024, 1012, 1001, 1020, 1009, 1027, 1017, 1007, 1026,  # 2030
+    1014, 1003, 1022, 1011, 1029, 1018, 1008, 1027, 1016, 1005,  # 2040
+    1024, 1013, 1030, 1020, 1009, 1028, 1017, 1006, 1025, 1014,  # 2050
+    1002, 1021, 1011, 1030, 1018, 1008, 1027, 1016, 1004, 1023,  # 2060
+    1012, 1031, 1020, 1009, 1028, 1018, 1006, 1025, 1014, 1003,  # 2070
+    1021, 1011, 1030, 1019, 1008, 1027, 1016, 1005, 1022, 1012,  # 2080
+    1031, 1021, 1009, 1028, 1017, 1006, 1024, 1013, 1003, 1022,  # 2090
+], dtype=np.int16)
+
+# The March equinox.
+VERNAL_EQUINOX = np.array([
+     321,  321,  321,  321,  321,  321,  321,  321,  321,  321,  # 1900
+     321,  321,  320,  321,  321,  321,  320,  321,  321,  321,  # 1910
+     320,  321,  321,  321,  320,  321,  321,  321,  320,  321,  # 1920
+     321,  321,  320,  321,  321,  321,  320,  321,  321,  321,  # 1930
+     320,  321,  321,  321,  320,  320,  321,  321,  320,  320,  # 1940
+     321,  321,  320,  320,  321,  321,  320,  320,  321,  321,  # 1950
+     320,  320,  321,  321,  320,  320,  321,  321,  320,  320,  # 1960
+     321,  321,  320,  320,  321,  321,  320,  320,  320,  321,  # 1970
+     320,  320,  320,  321,  320,  320,  320,  321,  320,  320,  # 1980
+     320,  321,  320,  320,  320,  321,  320,  320,  320,  321,  # 1990
+     320,  320,  320,  321,  320,  320,  320,  321,  320,  320,  # 2000
+     320,  320,  320,  320,  320,  320,  320,  320,  320,  320,  # 2010
+     320,  320,  320,  320,  320,  320,  320,  320,  320,  320,  # 2020
+     320,  320,  320,  320,  320,  320,  320,  320,  320,  320,  # 2030
+     320,  320,  320,  320,  319,  320,  320,  320,  319,  320,  # 2040
+     320,  320,  319,  320,  320,  320,  319,  320,  320,  320,  # 2050
+     319,  320,  320,  320,  319,  320,  320,  320,  319,  320,  # 2060
+     320,  320,  319,  320,  320,  320,  319,  319,  320,  320,  # 2070
+     319,  319,  320,  320,  319,  319,  320,  320,  319,  319,  # 2080
+     320,  320,  319,  319,  320,  320,  319,  319,  320,  320,  # 2090
+], dtype=np.int16)
+
+# The June solstice.
+SUMMER_SOLSTICE = np.array([
+     621,  622,  622,  622,  621,  622,  622,  622,  621,  622,  # 1900
+     622,  622,  621,  622,  622,  622,  621,  622,  622,  622,  # 1910
+     621,  621,  622,  622,  621,  621,  622,  622,  621,  621,  # 1920
+     622,  622,  621,  621,  622,  622,  621,  621,  622,  622,  # 1930
+     621,  621,  622,  622,  621,  621,  622,  622,  621,  621,  # 1940
+     621,  622,  621,  621,  621,  622,  621,  621,  621,  622,  # 1950
+     621,  621,  621,  622,  621,  621,  621,  622,  621,  621,  # 1960
+     621,  622,  621,  621,  621,  622,  621,  621,  621,  621,  # 1970
+     621,  621,  621,  621,  621,  621,  621,  621,  621,  621,  # 1980
+     621,  621,  621,  621,  621,  621,  621,  621,  621,  621,  # 1990
+     621,  621,  621,  621,  621,  621,  621,  621,  620,  621,  # 2000
+     621,  621,  620,  621,  621,  621,  620,  621,  621,  621,  # 2010
+     620,  621,  621,  621,  620,  621,  621,  621,  620,  621,  # 2020
+     621,  621,  620,  621,  621,  621,  620,  621,  621,  621,  # 2030
+     620,  620,  621,  621,  620,  620,  621,  621,  620,  620,  # 2040
+     621,  621,  620,  620,  621,  621,  620,  620,  621,  621,  # 2050
+     620,  620,  621,  621,  620,  620,  621,  621,  620,  620,  # 2060
+     620,  621,  620,  620,  620,  621,  620,  620,  620,  621,  # 2070
+     620,  620,  620,  621,  620,  620,  620,  621,  620,  620,  # 2080
+     620,  621,  620,  620,  620,  621,  620,  620,  620,  620,  # 2090
+], dtype=np.int16)
@@ -6,6 +6,8 @@ from pandas.compat import add_metaclass
 from datetime import datetime, timedelta
 import numpy as np
 
+from ..holiday_cache import holiday_dates
+
 def friday_week_of(dt):
     """
     returns friday of current week
@@ -41,6 +43,47 @@ def hong_kong_rules(dt):
         return dt.replace(day=prc_day.day+1)
     return dt
 
+# Vectorized counterparts of the observances above. Each takes a
+# DatetimeIndex and returns the DatetimeIndex the scalar observance would
+# produce elementwise.
+
+def _days(n):
+    return np.asarray(n, dtype='int64').astype('timedelta64[D]')
+
+def friday_week_of_index(dates):
+    return dates + _days(4 - dates.dayofweek)
+
+def sunday_to_tuesday_index(dates):
+    return dates + _days(np.where(dates.dayofweek == 6, 2, 0))
+
+def sunday_to_wednesday_index(dates):
+    return dates + _days(np.where(dates.dayofweek == 6, 3, 0))
+
+def hong_kong_rules_index(dates):
+    # Day of the month of the National Day observance: October 1st, or the
+    # 2nd when the 1st is a Sunday. 1970-01-01 was a Thursday.
+    years = np.asarray(dates.year, dtype='int64')
+    october_first = (
+        (years - 1970).astype('datetime64[Y]').astype('datetime64[M]') +
+        np.timedelta64(9, 'M')
+    ).astype('datetime64[D]').astype('int64')
+    prc_day = np.where((october_first + 3) % 7 == 6, 2, 1)
+
+    dates = dates + _days(dates.dayofweek == 6)
+    on_prc_day = (
+        (np.asarray(dates.month) == 10) & (np.asarray(dates.day) == prc_day)
+    )
+    return dates + _days(on_prc_day)
+
+# Observances with a vectorized counterpart. HolidayWithFilter applies any
+# other observance one date at a time.
+VECTORIZED_OBSERVANCES = {
+    friday_week_of: friday_week_of_index,
+    sunday_to_tuesday: sunday_to_tuesday_index,
+    sunday_to_wednesday: sunday_to_wednesday_index,
+    hong_kong_rules: hong_kong_rules_index,
+}
+
 class HolidayWithFilter(object):
     """
     Class that defines a holiday with start/end dates and rules
@@ -99,7 +142,7 @@ class HolidayWithFilter(object):
             info += 'year_filter={yrf}'.format(yrf=self.year_filter)
 
         if self.year_mask is not None:
-            info += 'year_mask={yrm}'.format(yrf=self.year_mask)
+            info += 'year_mask={yrm}'.format(yrm=self.year_mask)
 
         repr = 'Holiday: {name} ({info})'.format(name=self.name, info=info)
         return repr
@@ -115,6 +158,15 @@ class HolidayWithFilter(object):
             If True, return a series that has dates and holiday names.
             False will only return dates.
         """
+        return holiday_dates(self, start_date, end_date,
+                             return_name=return_name,
+                             compute=self._compute_dates)
+
+    def _compute_dates(self, start_date, end_date, return_name=False):
+        """
+        Calculate holidays observed between start date and end date, without
+        consulting the holiday cache.
+        """
         start_date = Timestamp(start_date)
         end_date = Timestamp(end_date)
 
@@ -192,6 +244,9 @@ class HolidayWithFilter(object):
         Dates with rules applied
         """
         if self.observance is not None:
+            vectorized = VECTORIZED_OBSERVANCES.get(self.observance)
+            if vectorized is not None:
+                return vectorized(dates)
             return dates.map(lambda d: self.observance(d))
 
         if self.offset is not None:
@@ -1,58 +1,73 @@
 # -*- coding: utf-8 -*-
-import ephem
-from lunardate import LunarDate
-###
 from pandas import DateOffset
-from pandas.errors import PerformanceWarning
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pandas.tseries.offsets import apply_wraps
 from pandas._libs.tslibs.offsets import (
     _is_normalized,
 )
 
-def summer_solstice(year,offset=None,observance=None):
-    dt = datetime(year,1,1)
-    dt = ephem.next_summer_solstice(dt).datetime().replace(hour=0, minute=0, second=0, microsecond=0)
-    if offset != None:
+from . import date_tables
+from .date_tables import FIRST_YEAR, LAST_YEAR
+
+# The event dates are looked up in the precomputed date_tables, which cover
+# every year lunardate can convert. ephem is only imported for equinoxes and
+# solstices outside of the tables. Run scripts/generate_date_tables.py to
+# regenerate them.
+
+def _table_date(table, year):
+    month_day = int(table[year - FIRST_YEAR])
+    return date(year, month_day // 100, month_day % 100)
+
+def _lunar_date(year, table):
+    if not FIRST_YEAR <= year <= LAST_YEAR:
+        raise ValueError(
+            "Lunar dates are only supported for the years %d through %d,"
+            " got %d." % (FIRST_YEAR, LAST_YEAR, year)
+        )
+    return _table_date(table, year)
+
+def _astronomical_date(year, event, table):
+    if FIRST_YEAR <= year <= LAST_YEAR:
+        dt = _table_date(table, year)
+    else:
+        import ephem
+        dt = getattr(ephem, event)(datetime(year, 1, 1)).datetime()
+    return datetime(dt.year, dt.month, dt.day)
+
+def _observed(dt, offset, observance):
+    if offset is not None:
         dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+    return dt if observance is None else observance(dt)
 
-def vernal_equinox(year,offset=None,observance=None):
-    dt = datetime(year,1,1)
-    dt = ephem.next_vernal_equinox(dt).datetime().replace(hour=0, minute=0, second=0, microsecond=0)
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def summer_solstice(year, offset=None, observance=None):
+    dt = _astronomical_date(year, 'next_summer_solstice',
+                            date_tables.SUMMER_SOLSTICE)
+    return _observed(dt, offset, observance)
 
-def lunar_new_year(year,offset=None,observance=None):
-    dt = LunarDate(year, 1, 1).toSolarDate()
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def vernal_equinox(year, offset=None, observance=None):
+    dt = _astronomical_date(year, 'next_vernal_equinox',
+                            date_tables.VERNAL_EQUINOX)
+    return _observed(dt, offset, observance)
 
-def buddha_birthday(year,offset=None,observance=None):
-    dt = LunarDate(year, 4, 8).toSolarDate()
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def lunar_new_year(year, offset=None, observance=None):
+    dt = _lunar_date(year, date_tables.LUNAR_NEW_YEAR)
+    return _observed(dt, offset, observance)
 
-def dragon_boat_festival(year,offset=None,observance=None):
-    dt = LunarDate(year, 5, 5).toSolarDate()
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def buddha_birthday(year, offset=None, observance=None):
+    dt = _lunar_date(year, date_tables.BUDDHA_BIRTHDAY)
+    return _observed(dt, offset, observance)
 
-def mid_autumn_festival(year,offset=None,observance=None):
-    dt = LunarDate(year, 8, 15).toSolarDate()
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def dragon_boat_festival(year, offset=None, observance=None):
+    dt = _lunar_date(year, date_tables.DRAGON_BOAT_FESTIVAL)
+    return _observed(dt, offset, observance)
 
-def double_nine_festival(year,offset=None,observance=None):
-    dt = LunarDate(year, 9, 9).toSolarDate()
-    if offset != None:
-        dt = dt + timedelta(offset)
-    return dt if observance == None else observance(dt)
+def mid_autumn_festival(year, offset=None, observance=None):
+    dt = _lunar_date(year, date_tables.MID_AUTUMN_FESTIVAL)
+    return _observed(dt, offset, observance)
+
+def double_nine_festival(year, offset=None, observance=None):
+    dt = _lunar_date(year, date_tables.DOUBLE_NINE_FESTIVAL)
+    return _observed(dt, offset, observance)
 
 def localize_pydatetime(dt, tz):
     """
@@ -0,0 +1,121 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Process-wide cache of the dates produced by holiday rules.
+
+Many calendars share rules such as ``USNewYearsDay`` or ``GoodFriday``, and
+each one used to evaluate them over its whole date range. The dates of a rule
+are cached by rule and year instead, so each rule is evaluated at most once for
+any year, however many calendars use it. A request for a range that is only
+partly covered evaluates the rule just for the missing years.
+
+Rules are keyed by identity and held weakly, so rules that are no longer
+referenced drop out of the cache.
+"""
+from datetime import datetime
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+import pandas as pd
+
+_lock = Lock()
+
+# rule -> {tz -> (first year, last year, DatetimeIndex of dates)}
+_cache = WeakKeyDictionary()
+
+
+def _year_range(first_year, last_year, tz, compute):
+    start = pd.Timestamp(datetime(first_year, 1, 1), tz=tz)
+    end = pd.Timestamp(datetime(last_year, 12, 31), tz=tz)
+    dates = pd.DatetimeIndex(compute(start, end))
+    if dates.tz is None and tz is not None:
+        # Rules that match no dates can return a tz-naive empty index.
+        dates = dates.tz_localize(tz)
+    return dates
+
+
+def holiday_dates(rule, start, end, return_name=False, compute=None):
+    """
+    The dates of a holiday rule between ``start`` and ``end``, inclusive.
+
+    This returns what ``rule.dates(start, end, return_name)`` would, reading
+    the dates from the cache and evaluating the rule only for years it has not
+    been evaluated for yet.
+
+    Parameters
+    ----------
+    rule : pandas.tseries.holiday.Holiday or HolidayWithFilter
+        The holiday rule.
+    start : datetime-like
+        The start of the range.
+    end : datetime-like
+        The end of the range.
+    return_name : bool, optional
+        If True, return a Series mapping the dates to the rule's name.
+    compute : callable, optional
+        ``compute(start, end)`` evaluates the rule without consulting the
+        cache. Defaults to ``rule.dates``.
+
+    Returns
+    -------
+    dates : DatetimeIndex or Series
+    """
+    if compute is None:
+        compute = rule.dates
+
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end)
+
+    # A rule for a single year returns its date whatever the range.
+    if getattr(rule, 'year', None) is not None:
+        return compute(start, end, return_name=return_name)
+
+    tz = start.tz
+    first_year, last_year = start.year, end.year
+
+    with _lock:
+        entry = _cache.get(rule, {}).get(tz)
+
+    if entry is None:
+        dates = _year_range(first_year, last_year, tz, compute)
+    else:
+        cached_first, cached_last, dates = entry
+        if first_year < cached_first:
+            dates = _year_range(
+                first_year, cached_first - 1, tz, compute
+            ).append(dates)
+        if last_year > cached_last:
+            dates = dates.append(
+                _year_range(cached_last + 1, last_year, tz, compute),
+            )
+        first_year = min(first_year, cached_first)
+        last_year = max(last_year, cached_last)
+
+    if entry is None or (first_year, last_year) != entry[:2]:
+        with _lock:
+            _cache.setdefault(rule, {})[tz] = (first_year, last_year, dates)
+
+    dates = dates[(dates >= start) & (dates <= end)]
+    if return_name:
+        return pd.Series(rule.name, index=dates)
+    return dates
+
+
+def clear_holiday_cache():
+    """
+    Drop every cached holiday date.
+    """
+    with _lock:
+        _cache.clear()
@@ -222,7 +222,7 @@ class XMOD_IRD_AbstractHolidayCalendar:
             WeekendBoxingDay
         ])
         
-        regular_adhoc = list(chain(
+        adhoc = list(chain(
             September11ClosingsCanada
         ))
         
@@ -0,0 +1,438 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+On-disk cache of computed TradingCalendar schedules.
+
+Building a calendar evaluates every holiday rule over the whole date range,
+which is expensive enough to matter for short-lived processes. A
+``ScheduleCache`` stores the resulting session, open, close, early close and
+break arrays as raw int64 ``.npy`` files so that later processes can hydrate a
+calendar without evaluating any rules.
+
+Entries are keyed by the calendar class, a fingerprint of its rules and
+trading times, the requested date range (at day resolution) and the library
+version, so editing a rule produces a new key instead of a stale hit.
+
+The default end date moves forward every day, so each day's calendars are
+stored under new keys. Entries that have not been loaded or saved for
+``max_age`` are removed whenever a new entry is saved, which bounds the
+cache to the entries in recent use.
+
+With ``mmap=True`` the arrays, along with every trading minute of the
+calendar, are opened as read-only ``numpy.memmap`` files, so processes
+hydrating the same entry share the same physical pages instead of each
+holding a private copy.
+"""
+import errno
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from types import CodeType
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar
+from six import string_types
+
+from .calendar_helpers import compute_all_minutes
+
+# Bump this whenever the on-disk layout changes.
+CACHE_FORMAT_VERSION = 2
+
+# How long an entry may go unused before it is pruned.
+DEFAULT_MAX_AGE = pd.Timedelta(days=7)
+
+# Environment variables used to configure the default cache.
+CACHE_DIR_ENV = 'TRADING_CALENDARS_CACHE_DIR'
+CACHE_MMAP_ENV = 'TRADING_CALENDARS_CACHE_MMAP'
+
+# The int64 arrays stored for each entry.
+SCHEDULE_ARRAYS = (
+    'sessions',
+    'opens',
+    'closes',
+    'early_closes',
+    'break_starts',
+    'break_ends',
+)
+
+# The int64 array of every trading minute, stored for memory-mapped caches.
+MINUTES_ARRAY = 'minutes'
+
+# The attributes of a TradingCalendar that determine its schedule.
+_FINGERPRINT_ATTRIBUTES = (
+    'tz',
+    'weekmask',
+    'open_times',
+    'close_times',
+    'open_offset',
+    'close_offset',
+    'break_start_times',
+    'break_end_times',
+    'regular_holidays',
+    'adhoc_holidays',
+    'special_opens',
+    'special_opens_adhoc',
+    'special_closes',
+    'special_closes_adhoc',
+)
+
+_ADDRESS = re.compile(r' at 0x[0-9a-fA-F]+')
+_UNSAFE_CHARS = re.compile(r'[^\w.-]')
+
+
+def _describe_code(code):
+    """
+    Digest a code object's bytecode, constants and referenced names, so that
+    editing a function's body changes its description.
+    """
+    digest = hashlib.sha1(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            # Nested functions, lambdas and comprehensions.
+            const = _describe_code(const)
+        else:
+            const = _describe(const)
+        digest.update(const.encode('utf-8'))
+        digest.update(b'\0')
+    for name in code.co_names:
+        digest.update(name.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _describe(obj):
+    """
+    Build a stable textual description of a rule object.
+
+    Object reprs embed memory addresses, which differ between processes, so
+    those are stripped; holiday calendars and rules are described by their
+    contents rather than their identity, and functions such as observances
+    and filters by their qualified name and a digest of their code.
+    """
+    if hasattr(obj, '__code__'):
+        return '%s.%s#%s' % (
+            getattr(obj, '__module__', None),
+            getattr(obj, '__qualname__', obj.__name__),
+            _describe_code(obj.__code__),
+        )
+    if isinstance(obj, AbstractHolidayCalendar):
+        return 'HolidayCalendar(%s)' % _describe(obj.rules)
+    if hasattr(obj, 'dates') and hasattr(obj, '__dict__'):
+        # Holiday rules (pandas.Holiday and HolidayWithFilter).
+        return '%s(%s)' % (type(obj).__name__, _describe(vars(obj)))
+    if isinstance(obj, dict):
+        return '{%s}' % ', '.join(
+            '%s: %s' % (key, _describe(value))
+            for key, value in sorted(obj.items())
+        )
+    if isinstance(obj, (list, tuple, pd.Index, np.ndarray)):
+        return '[%s]' % ', '.join(_describe(item) for item in obj)
+    if isinstance(obj, (set, frozenset)):
+        # Set iteration order depends on string hashing, which varies between
+        # processes.
+        return '{%s}' % ', '.join(sorted(_describe(item) for item in obj))
+    return _ADDRESS.sub('', repr(obj))
+
+
+def calendar_fingerprint(calendar):
+    """
+    Compute a digest of everything that determines a calendar's schedule.
+
+    Parameters
+    ----------
+    calendar : TradingCalendar
+        The calendar to fingerprint.
+
+    Returns
+    -------
+    fingerprint : str
+        A hex digest that changes whenever the calendar's rules or trading
+        times change.
+    """
+    digest = hashlib.sha1()
+    for attr in _FINGERPRINT_ATTRIBUTES:
+        description = '%s=%s\n' % (attr, _describe(getattr(calendar, attr)))
+        digest.update(description.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ScheduleCache(object):
+    """
+    A directory of precomputed calendar schedules.
+
+    Each entry is a subdirectory holding one ``.npy`` file per array in
+    ``SCHEDULE_ARRAYS``. Entries are published atomically, so concurrent
+    writers never expose a partially written entry.
+
+    Parameters
+    ----------
+    root : str
+        The directory in which to store entries. It is created on first write.
+    mmap : bool, optional
+        If True, entries also store every trading minute, and all arrays are
+        loaded as read-only memory maps. Default is False.
+    max_age : pd.Timedelta or None, optional
+        Entries that have not been loaded or saved for this long are removed
+        when a new entry is saved. None keeps every entry. Default is seven
+        days.
+    """
+    def __init__(self, root, mmap=False, max_age=DEFAULT_MAX_AGE):
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.mmap = mmap
+        self.max_age = max_age
+
+    def __repr__(self):
+        return '%s(%r, mmap=%r)' % (type(self).__name__, self.root, self.mmap)
+
+    def key(self, calendar, start, end):
+        """
+        Compute the cache key for ``calendar`` built over ``[start, end]``.
+
+        Parameters
+        ----------
+        calendar : TradingCalendar
+            The calendar being constructed.
+        start : pd.Timestamp
+            The start of the calendar's range.
+        end : pd.Timestamp
+            The end of the calendar's range.
+
+        Returns
+        -------
+        key : str
+            The name of the entry for this calendar and range.
+        """
+        # Imported here to avoid a cycle with the package's __init__.
+        from trading_calendars import __version__
+
+        cls = type(calendar)
+        digest = hashlib.sha1()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            __version__,
+            '%s.%s' % (cls.__module__, cls.__name__),
+            pd.Timestamp(start).normalize().isoformat(),
+            pd.Timestamp(end).normalize().isoformat(),
+            calendar_fingerprint(calendar),
+        ):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+
+        return '%s-%s' % (
+            _UNSAFE_CHARS.sub('_', calendar.name),
+            digest.hexdigest(),
+        )
+
+    def path(self, key):
+        """
+        The directory holding the entry for ``key``.
+        """
+        return os.path.join(self.root, key)
+
+    def load(self, key):
+        """
+        Load the arrays stored under ``key``.
+
+        Returns
+        -------
+        arrays : dict[str -> np.ndarray] or None
+            The stored int64 arrays, or None if there is no usable entry. If
+            this cache is memory-mapped, the arrays are read-only memmaps and
+            include ``MINUTES_ARRAY``.
+        """
+        path = self.path(key)
+        mmap_mode = 'r' if self.mmap else None
+        try:
+            arrays = {
+                name: np.load(
+                    os.path.join(path, name + '.npy'),
+                    mmap_mode=mmap_mode,
+                )
+                for name in SCHEDULE_ARRAYS
+            }
+        except (IOError, OSError, ValueError):
+            return None
+
+        # Mark the entry as in use so that it isn't pruned.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        if self.mmap:
+            minutes_path = os.path.join(path, MINUTES_ARRAY + '.npy')
+            try:
+                arrays[MINUTES_ARRAY] = np.load(minutes_path, mmap_mode='r')
+            except (IOError, OSError, ValueError):
+                # The entry was written by a cache that wasn't memory-mapped.
+                minutes = compute_all_minutes(
+                    arrays['opens'],
+                    arrays['closes'],
+                    arrays['break_starts'],
+                    arrays['break_ends'],
+                ).view(np.int64)
+                try:
+                    _publish(minutes_path, minutes)
+                    minutes = np.load(minutes_path, mmap_mode='r')
+                except (IOError, OSError, ValueError):
+                    # The entry isn't writable; use the minutes from memory.
+                    pass
+                arrays[MINUTES_ARRAY] = minutes
+
+        return arrays
+
+    def save(self, key, arrays):
+        """
+        Store ``arrays`` under ``key``.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by ``ScheduleCache.key``.
+        arrays : dict[str -> np.ndarray]
+            The int64 arrays named in ``SCHEDULE_ARRAYS``.
+        """
+        try:
+            os.makedirs(self.root)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=self.root)
+        try:
+            for name in SCHEDULE_ARRAYS:
+                np.save(
+                    os.path.join(tmp, name + '.npy'),
+                    np.asarray(arrays[name], dtype=np.int64),
+                )
+            if self.mmap:
+                np.save(
+                    os.path.join(tmp, MINUTES_ARRAY + '.npy'),
+                    compute_all_minutes(
+                        arrays['opens'],
+                        arrays['closes'],
+                        arrays['break_starts'],
+                        arrays['break_ends'],
+                    ).view(np.int64),
+                )
+            try:
+                os.rename(tmp, self.path(key))
+            except OSError:
+                # Another process published this entry first; theirs is
+                # equivalent to ours.
+                pass
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        if self.max_age is not None:
+            self.prune(self.max_age)
+
+    def prune(self, max_age):
+        """
+        Remove the entries that have not been loaded or saved within
+        ``max_age``.
+
+        Processes that have already memory-mapped a removed entry keep their
+        mappings.
+
+        Parameters
+        ----------
+        max_age : pd.Timedelta
+            How long an entry may go unused.
+        """
+        cutoff = time.time() - pd.Timedelta(max_age).total_seconds()
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return
+
+        for name in names:
+            path = os.path.join(self.root, name)
+            try:
+                stale = os.path.getmtime(path) < cutoff
+            except OSError:
+                # Removed by another process.
+                continue
+            if stale and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def clear(self):
+        """
+        Remove every entry in this cache.
+        """
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _publish(path, array):
+    """
+    Atomically write ``array`` as int64 to the ``.npy`` file at ``path``.
+    """
+    fd, tmp = tempfile.mkstemp(
+        prefix='.tmp-',
+        suffix='.npy',
+        dir=os.path.dirname(path),
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.asarray(array).view(np.int64))
+        os.rename(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _cache_from_environment():
+    root = os.environ.get(CACHE_DIR_ENV)
+    if not root:
+        return None
+    mmap = os.environ.get(CACHE_MMAP_ENV, '').lower() in ('1', 'true', 'yes')
+    return ScheduleCache(root, mmap=mmap)
+
+
+_schedule_cache = _cache_from_environment()
+
+
+def get_schedule_cache():
+    """
+    The ScheduleCache used when constructing calendars, or None if disabled.
+    """
+    return _schedule_cache
+
+
+def set_schedule_cache(cache, mmap=False):
+    """
+    Set the ScheduleCache used when constructing calendars.
+
+    By default this is read from the ``TRADING_CALENDARS_CACHE_DIR``
+    environment variable, and caching is disabled if it is unset. Setting
+    ``TRADING_CALENDARS_CACHE_MMAP=1`` makes the default cache memory-mapped.
+
+    Parameters
+    ----------
+    cache : ScheduleCache, str or None
+        The cache to use, a directory to create one in, or None to disable
+        caching.
+    mmap : bool, optional
+        Whether a cache created from a directory is memory-mapped. Ignored
+        if ``cache`` is already a ScheduleCache. Default is False.
+    """
+    global _schedule_cache
+    if isinstance(cache, string_types):
+        cache = ScheduleCache(cache, mmap=mmap)
+    _schedule_cache = cache
@@ -13,10 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractproperty
-from lru import LRU
-import warnings
 
-from operator import attrgetter
 from pandas.tseries.holiday import AbstractHolidayCalendar
 from six import with_metaclass
 import numpy as np
@@ -24,21 +21,43 @@ from numpy import searchsorted
 import pandas as pd
 from pandas import (
     DataFrame,
-    date_range,
     DatetimeIndex,
 )
 from pandas.tseries.offsets import CustomBusinessDay
 import toolz
 
+from .arrow import from_arrow, to_arrow
 from .calendar_helpers import (
+    MinuteToSessionLabelCache,
+    NANOSECONDS_PER_DAY,
+    NAT_NANOS,
+    are_open,
+    bitmap_contains,
+    bitmap_searchsorted,
     compute_all_minutes,
+    compute_intervals,
+    compute_minute_offsets,
+    compute_session_bitmap,
     is_open,
+    minute_position,
+    minute_to_session_idxs,
+    minutes_in_position_range,
     next_divider_idx,
+    next_divider_idxs,
+    next_minute_val,
     previous_divider_idx,
+    previous_divider_idxs,
+    previous_minute_val,
 )
+from .holiday_cache import holiday_dates
+from .schedule_cache import get_schedule_cache
 from .utils.memoize import lazyval
-from .utils.pandas_utils import days_at_time
-from .utils.preprocess import preprocess, coerce
+from .utils.pandas_utils import (
+    days_array,
+    days_at_time,
+    nanos_array,
+    utc_index,
+)
 
 
 start_default = pd.Timestamp('1990-01-01', tz='UTC')
@@ -52,6 +71,25 @@ MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = range(7)
 WEEKDAYS = (MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY)
 WEEKENDS = (SATURDAY, SUNDAY)
 
+# The schedule arrays with one entry per session.
+_SESSION_ARRAYS = (
+    'sessions',
+    'opens',
+    'closes',
+    'break_starts',
+    'break_ends',
+)
+
+
+def _nanos(dt):
+    """
+    The UTC nanoseconds of a datetime-like, with naive datetimes interpreted
+    as UTC, as the session labels are.
+    """
+    if isinstance(dt, pd.Timestamp):
+        return dt.value
+    return pd.Timestamp(dt).value
+
 
 def selection(arr, start, end):
     predicates = []
@@ -94,27 +132,97 @@ class TradingCalendar(with_metaclass(ABCMeta)):
     considered a specific point in time, and that midnight UTC is just being
     used for convenience.
 
-    For each session, we store the open and close time in UTC time.
+    For each session, we store the open and close time in UTC time. Sessions
+    may also have a break, such as a lunch break, during which the exchange is
+    closed; see ``break_start_times`` and ``break_end_times``.
+
+    The minute lookups (``is_open_on_minute``, ``next_open``, ``next_close``,
+    ``previous_open``, ``previous_close``, ``next_minute``,
+    ``previous_minute`` and ``minute_to_session_label``) have ``_ns``
+    counterparts that take the dt as int64 UTC nanoseconds and,
+    apart from ``minute_to_session_label_ns``, return int64 UTC nanoseconds,
+    so that hot loops never construct a ``pd.Timestamp``.
     """
+    # The number of recent minutes whose session `minute_to_session_label`
+    # remembers, and whether it also remembers the last resolved session's
+    # open and close. See `configure_minute_to_session_label_cache`.
+    minute_to_session_label_cache_size = 1
+    minute_to_session_label_session_range = False
+
+    # The lazyvals derived from the schedule, which must be recomputed when
+    # the schedule changes.
+    _schedule_lazyvals = (
+        '_trading_minutes_nanos',
+        '_minute_offsets',
+        '_session_minute_offsets',
+        '_session_bitmap',
+        'all_minutes',
+        'busdaycalendar',
+        'day',
+    )
+
+    # The attributes that may be configured for each calendar and that its
+    # rules depend on, such as a product group.
+    _rule_attributes = ()
+
     def __init__(self, start=start_default, end=end_default):
-        # Midnight in UTC for each trading day.
+        # Hydrate from the on-disk schedule cache when one is configured,
+        # rather than re-evaluating every holiday rule.
+        cache = get_schedule_cache()
+        arrays = None
+        if cache is not None:
+            key = cache.key(self, start, end)
+            arrays = cache.load(key)
+
+        if arrays is None:
+            arrays = self._compute_schedule_arrays(start, end)
+            if cache is not None:
+                cache.save(key, arrays)
+                if cache.mmap:
+                    # Back this instance by the files we just wrote so that it
+                    # shares pages with every other process using them.
+                    arrays = cache.load(key) or arrays
+
+        self._hydrate(**arrays)
+
+    def _compute_schedule_arrays(self, start, end):
+        """
+        Evaluate this calendar's rules over ``[start, end]``.
 
-        # In pandas 0.18.1, pandas calls into its own code here in a way that
-        # fires a warning. The calling code in pandas tries to suppress the
-        # warning, but does so incorrectly, causing it to bubble out here.
-        # Actually catch and suppress the warning here:
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            _all_days = date_range(start, end, freq=self.day, tz='UTC')
+        Returns
+        -------
+        arrays : dict[str -> np.ndarray]
+            int64 nanosecond arrays of the session labels, opens, closes and
+            the labels of sessions that close early, keyed by the names in
+            ``schedule_cache.SCHEDULE_ARRAYS``.
+        """
+        # Midnight in UTC for each trading day.
+        days = np.arange(
+            days_array([start])[0],
+            days_array([end])[0] + 1,
+            dtype='datetime64[D]',
+        )
+        # Only evaluate the holiday rules over the requested range.
+        busdaycalendar = rules_busdaycalendar(
+            self.weekmask,
+            self.adhoc_holidays,
+            self.regular_holidays,
+            start,
+            end,
+        )
+        days = days[np.is_busday(days, busdaycal=busdaycalendar)]
+        _all_days = DatetimeIndex(
+            days.astype('datetime64[ns]'),
+        ).tz_localize('UTC')
 
         # `DatetimeIndex`s of standard opens/closes for each day.
-        self._opens = _group_times(
+        _opens = _group_times(
             _all_days,
             self.open_times,
             self.tz,
             self.open_offset,
         )
-        self._closes = _group_times(
+        _closes = _group_times(
             _all_days,
             self.close_times,
             self.tz,
@@ -127,50 +235,426 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         _special_closes = self._calculate_special_closes(start, end)
 
         # Overwrite the special opens and closes on top of the standard ones.
-        _overwrite_special_dates(_all_days, self._opens, _special_opens)
-        _overwrite_special_dates(_all_days, self._closes, _special_closes)
+        _overwrite_special_dates(_all_days, _opens, _special_opens)
+        _overwrite_special_dates(_all_days, _closes, _special_closes)
+
+        sessions = _all_days.values.astype('datetime64[ns]').view(np.int64)
+        opens = _opens.values.astype('datetime64[ns]').view(np.int64)
+        closes = _closes.values.astype('datetime64[ns]').view(np.int64)
+
+        # The label of the session containing each special close.
+        if len(_special_closes):
+            special_closes = _special_closes.values.astype(
+                'datetime64[ns]',
+            ).view(np.int64)
+            early_closes = sessions[searchsorted(closes, special_closes)]
+        else:
+            early_closes = np.array([], dtype=np.int64)
+
+        if self.break_start_times:
+            break_starts = _group_times(
+                _all_days,
+                self.break_start_times,
+                self.tz,
+                0,
+            ).values.astype('datetime64[ns]').view(np.int64)
+            break_ends = _group_times(
+                _all_days,
+                self.break_end_times,
+                self.tz,
+                0,
+            ).values.astype('datetime64[ns]').view(np.int64)
+
+            # Sessions whose special open or close falls outside of the break
+            # have no break.
+            no_break = (closes <= break_starts) | (opens >= break_ends)
+            break_starts[no_break] = NAT_NANOS
+            break_ends[no_break] = NAT_NANOS
+        else:
+            break_starts = np.full(len(sessions), NAT_NANOS, dtype=np.int64)
+            break_ends = break_starts.copy()
+
+        return {
+            'sessions': sessions,
+            'opens': opens,
+            'closes': closes,
+            'early_closes': early_closes,
+            'break_starts': break_starts,
+            'break_ends': break_ends,
+        }
+
+    def _hydrate(self,
+                 sessions,
+                 opens,
+                 closes,
+                 early_closes,
+                 break_starts=None,
+                 break_ends=None,
+                 minutes=None):
+        """
+        Set up this calendar's state from precomputed int64 nanosecond arrays.
+
+        The arrays are used as-is, so they may be read-only memory maps. If
+        ``break_starts`` and ``break_ends`` are not given, no session has a
+        break. If ``minutes`` is not given, every trading minute is only
+        computed when ``all_minutes`` is first accessed.
+        """
+        _all_days = DatetimeIndex(sessions, tz='UTC')
+
+        # `DatetimeIndex`s of the opens/closes for each day.
+        self._opens = DatetimeIndex(opens, tz='UTC')
+        self._closes = DatetimeIndex(closes, tz='UTC')
 
-        # In pandas 0.16.1 _opens and _closes will lose their timezone
-        # information. This looks like it has been resolved in 0.17.1.
-        # http://pandas.pydata.org/pandas-docs/stable/whatsnew.html#datetime-with-tz  # noqa
         self.schedule = DataFrame(
             index=_all_days,
             columns=['market_open', 'market_close'],
             data={
-                'market_open': self._opens,
-                'market_close': self._closes,
+                'market_open': opens.view('datetime64[ns]'),
+                'market_close': closes.view('datetime64[ns]'),
             },
-            dtype='datetime64[ns]',
         )
 
         # Simple cache to avoid recalculating the same minute -> session in
         # "next" mode. Analysis of current zipline code paths show that
         # `minute_to_session_label` is often called consecutively with the same
         # inputs.
-        self._minute_to_session_label_cache = LRU(1)
+        self.configure_minute_to_session_label_cache(
+            size=self.minute_to_session_label_cache_size,
+            session_range=self.minute_to_session_label_session_range,
+        )
 
-        self.market_opens_nanos = self.schedule.market_open.values.\
-            astype(np.int64)
+        self.market_opens_nanos = opens
+        self.market_closes_nanos = closes
 
-        self.market_closes_nanos = self.schedule.market_close.values.\
-            astype(np.int64)
+        if break_starts is None:
+            break_starts = np.full(len(sessions), NAT_NANOS, dtype=np.int64)
+            break_ends = break_starts
+        self.break_starts_nanos = break_starts
+        self.break_ends_nanos = break_ends
 
-        self._trading_minutes_nanos = self.all_minutes.values.\
-            astype(np.int64)
+        # The intervals during which the market is open: one per session, or
+        # two for sessions with a break.
+        (
+            self._interval_starts,
+            self._interval_ends,
+            self._session_interval_offsets,
+        ) = compute_intervals(opens, closes, break_starts, break_ends)
+
+        self._precomputed_minutes = minutes
 
         self.first_trading_session = _all_days[0]
         self.last_trading_session = _all_days[-1]
 
-        self._early_closes = pd.DatetimeIndex(
-            _special_closes.map(self.minute_to_session_label)
+        self._early_closes = DatetimeIndex(early_closes, tz='UTC')
+
+    @classmethod
+    def _from_schedule_arrays(cls, arrays):
+        """
+        Build a calendar from the arrays returned by ``_schedule_arrays``
+        without evaluating any rules.
+        """
+        calendar = object.__new__(cls)
+        calendar._hydrate(**arrays)
+        return calendar
+
+    def _schedule_arrays(self):
+        return {
+            'sessions': np.asarray(self.schedule.index.asi8),
+            'opens': np.asarray(self.market_opens_nanos),
+            'closes': np.asarray(self.market_closes_nanos),
+            'early_closes': np.asarray(self._early_closes.asi8),
+            'break_starts': np.asarray(self.break_starts_nanos),
+            'break_ends': np.asarray(self.break_ends_nanos),
+        }
+
+    def to_arrow(self):
+        """
+        This calendar's schedule as a pyarrow Table.
+
+        See ``trading_calendars.arrow`` for the table's layout. Requires
+        pyarrow.
+        """
+        return to_arrow(self)
+
+    @classmethod
+    def from_arrow(cls, table):
+        """
+        Rebuild a calendar from a table produced by ``to_arrow`` without
+        evaluating any rules.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            A schedule table holding exactly one calendar.
+
+        Returns
+        -------
+        TradingCalendar
+            The calendar, of the type recorded in the table.
+        """
+        calendars = from_arrow(table)
+        if len(calendars) != 1:
+            raise ValueError(
+                "Expected a table with one calendar, found %d: %s" % (
+                    len(calendars),
+                    sorted(calendars),
+                )
+            )
+        calendar, = calendars.values()
+        return calendar
+
+    def __reduce__(self):
+        # Pickle only the schedule, which is enough to rebuild the calendar
+        # without evaluating its rules, and the attributes that its rules
+        # depend on, so that the rebuilt calendar extends the same way. The
+        # calendar's name and range are implied by its type and sessions.
+        cache_info = self.minute_to_session_label_cache_info()
+        return (
+            _rebuild_calendar,
+            (
+                type(self),
+                _pack_schedule(self._schedule_arrays()),
+                cache_info.size,
+                cache_info.session_range,
+                {name: getattr(self, name) for name in self._rule_attributes},
+            ),
+        )
+
+    def _rehydrate(self, arrays, minutes=None):
+        """
+        Replace this calendar's schedule with ``arrays``, keeping the
+        configuration of the ``minute_to_session_label`` cache.
+        """
+        cache_info = self.minute_to_session_label_cache_info()
+        for name in self._schedule_lazyvals:
+            descriptor = getattr(type(self), name)
+            if self in descriptor:
+                del descriptor[self]
+
+        self._hydrate(minutes=minutes, **arrays)
+        self.configure_minute_to_session_label_cache(
+            size=cache_info.size,
+            session_range=cache_info.session_range,
+        )
+
+    def extend(self, new_end):
+        """
+        Extend this calendar forward to ``new_end`` in place.
+
+        Only the rules for the added sessions are evaluated; the existing
+        schedule is kept as-is. If the trading minutes have already been
+        computed, the new minutes are appended to them.
+
+        Parameters
+        ----------
+        new_end : pd.Timestamp
+            The new end of the calendar's range, taken at its UTC date. Does
+            nothing if this is not after the last trading session.
+        """
+        last = self.last_trading_session
+        new_end = pd.Timestamp(days_array([new_end])[0], tz='UTC')
+        if new_end <= last:
+            return
+
+        # The current last session is recomputed along with the new ones, as
+        # its specials may have fallen outside of the original range. Start a
+        # day before it to include specials on the previous UTC day.
+        added = self._compute_schedule_arrays(
+            last - pd.Timedelta(days=1),
+            new_end,
+        )
+        keep = added['sessions'] >= last.value
+
+        arrays = self._schedule_arrays()
+        combined = {
+            name: np.concatenate([arrays[name][:-1], added[name][keep]])
+            for name in _SESSION_ARRAYS
+        }
+        early_closes = arrays['early_closes']
+        added_early_closes = added['early_closes']
+        combined['early_closes'] = np.concatenate([
+            early_closes[early_closes < last.value],
+            added_early_closes[added_early_closes >= last.value],
+        ])
+
+        minutes = None
+        if self in type(self)._trading_minutes_nanos:
+            minutes = np.concatenate([
+                self._trading_minutes_nanos[:self._session_minute_offsets[-2]],
+                compute_all_minutes(
+                    added['opens'][keep],
+                    added['closes'][keep],
+                    added['break_starts'][keep],
+                    added['break_ends'][keep],
+                ).view(np.int64),
+            ])
+
+        self._rehydrate(combined, minutes=minutes)
+
+    def extend_back(self, new_start):
+        """
+        Extend this calendar backward to ``new_start`` in place.
+
+        Only the rules for the added sessions are evaluated; the existing
+        schedule is kept as-is. If the trading minutes have already been
+        computed, the new minutes are prepended to them.
+
+        Parameters
+        ----------
+        new_start : pd.Timestamp
+            The new start of the calendar's range, taken at its UTC date.
+            Does nothing if this is not before the first trading session.
+        """
+        first = self.first_trading_session
+        new_start = pd.Timestamp(days_array([new_start])[0], tz='UTC')
+        if new_start >= first:
+            return
+
+        # The current first session is recomputed along with the new ones, as
+        # its specials may have fallen outside of the original range. End a
+        # day after it to include specials on the next UTC day.
+        added = self._compute_schedule_arrays(
+            new_start,
+            first + pd.Timedelta(days=1),
+        )
+        keep = added['sessions'] <= first.value
+
+        arrays = self._schedule_arrays()
+        combined = {
+            name: np.concatenate([added[name][keep], arrays[name][1:]])
+            for name in _SESSION_ARRAYS
+        }
+        early_closes = arrays['early_closes']
+        added_early_closes = added['early_closes']
+        combined['early_closes'] = np.concatenate([
+            added_early_closes[added_early_closes <= first.value],
+            early_closes[early_closes > first.value],
+        ])
+
+        minutes = None
+        if self in type(self)._trading_minutes_nanos:
+            minutes = np.concatenate([
+                compute_all_minutes(
+                    added['opens'][keep],
+                    added['closes'][keep],
+                    added['break_starts'][keep],
+                    added['break_ends'][keep],
+                ).view(np.int64),
+                self._trading_minutes_nanos[self._session_minute_offsets[1]:],
+            ])
+
+        self._rehydrate(combined, minutes=minutes)
+
+    def view(self, start=None, end=None):
+        """
+        A calendar restricted to the sessions between ``start`` and ``end``.
+
+        No rules are evaluated and nothing is copied: the returned calendar's
+        schedule, nanosecond arrays and, if already computed, trading minutes
+        are slices of this calendar's.
+
+        Parameters
+        ----------
+        start : pd.Timestamp, optional
+            The first session label to include. Default is this calendar's
+            first session.
+        end : pd.Timestamp, optional
+            The last session label to include. Default is this calendar's
+            last session.
+
+        Returns
+        -------
+        TradingCalendar
+            A calendar of the same type covering the sessions in the range.
+            Extending it does not affect this calendar.
+        """
+        sessions = self.schedule.index
+        start_idx = 0
+        end_idx = len(sessions)
+        if start is not None:
+            start_idx = sessions.searchsorted(start, side='left')
+        if end is not None:
+            end_idx = sessions.searchsorted(end, side='right')
+
+        if start_idx >= end_idx:
+            raise ValueError(
+                "No sessions between {0} and {1}.".format(start, end)
+            )
+
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+
+        view._opens = self._opens[start_idx:end_idx]
+        view._closes = self._closes[start_idx:end_idx]
+        view.schedule = self.schedule.iloc[start_idx:end_idx]
+        view.market_opens_nanos = self.market_opens_nanos[start_idx:end_idx]
+        view.market_closes_nanos = self.market_closes_nanos[start_idx:end_idx]
+        view.break_starts_nanos = self.break_starts_nanos[start_idx:end_idx]
+        view.break_ends_nanos = self.break_ends_nanos[start_idx:end_idx]
+
+        # Without breaks, these are slices of this calendar's intervals.
+        (
+            view._interval_starts,
+            view._interval_ends,
+            view._session_interval_offsets,
+        ) = compute_intervals(
+            view.market_opens_nanos,
+            view.market_closes_nanos,
+            view.break_starts_nanos,
+            view.break_ends_nanos,
+        )
+
+        view._precomputed_minutes = None
+        if self in type(self)._trading_minutes_nanos:
+            offsets = self._session_minute_offsets
+            view._precomputed_minutes = self._trading_minutes_nanos[
+                offsets[start_idx]:offsets[end_idx]
+            ]
+
+        view.first_trading_session = sessions[start_idx]
+        view.last_trading_session = sessions[end_idx - 1]
+
+        early_closes = self._early_closes
+        view._early_closes = early_closes[
+            early_closes.searchsorted(view.first_trading_session):
+            early_closes.searchsorted(view.last_trading_session, side='right')
+        ]
+
+        cache_info = self.minute_to_session_label_cache_info()
+        view.configure_minute_to_session_label_cache(
+            size=cache_info.size,
+            session_range=cache_info.session_range,
+        )
+
+        return view
+
+    @lazyval
+    def busdaycalendar(self):
+        """
+        A numpy.busdaycalendar whose business days are this calendar's
+        sessions.
+
+        Its holidays are the days in the weekmask from the first through the
+        last trading session that are not sessions; outside of that range
+        every day in the weekmask is a business day.
+
+        It can be passed as ``busdaycal`` to ``numpy.is_busday``,
+        ``numpy.busday_offset`` and ``numpy.busday_count`` for vectorized
+        session arithmetic on datetime64[D] arrays.
+        """
+        sessions = days_array(self.schedule.index)
+        days = np.arange(sessions[0], sessions[-1] + 1, dtype='datetime64[D]')
+        days = days[np.is_busday(days, weekmask=self.weekmask)]
+        return np.busdaycalendar(
+            weekmask=self.weekmask,
+            holidays=np.setdiff1d(days, sessions, assume_unique=True),
         )
 
     @lazyval
     def day(self):
         return CustomBusinessDay(
-            holidays=self.adhoc_holidays,
-            calendar=self.regular_holidays,
             weekmask=self.weekmask,
+            calendar=self.busdaycalendar,
         )
 
     @abstractproperty
@@ -210,11 +694,101 @@ class TradingCalendar(with_metaclass(ABCMeta)):
     def close_offset(self):
         return 0
 
+    @property
+    def break_start_times(self):
+        """
+        The last minute before the market breaks during a session, in the same
+        format as ``close_times``, or None if sessions have no break.
+        """
+        return None
+
+    @property
+    def break_end_times(self):
+        """
+        The first minute after the market resumes from a break, in the same
+        format as ``open_times``, or None if sessions have no break.
+        """
+        return None
+
+    @property
+    def break_starts(self):
+        """
+        The last minute before each session's break, or NaT if it has none.
+        """
+        return pd.Series(
+            self.break_starts_nanos.view('datetime64[ns]'),
+            index=self.schedule.index,
+        ).dt.tz_localize('UTC')
+
+    @property
+    def break_ends(self):
+        """
+        The first minute after each session's break, or NaT if it has none.
+        """
+        return pd.Series(
+            self.break_ends_nanos.view('datetime64[ns]'),
+            index=self.schedule.index,
+        ).dt.tz_localize('UTC')
+
+    @lazyval
+    def _trading_minutes_nanos(self):
+        if self._precomputed_minutes is not None:
+            return self._precomputed_minutes
+
+        return compute_all_minutes(
+            self._interval_starts,
+            self._interval_ends,
+        ).view(np.int64)
+
+    @lazyval
+    def _minute_offsets(self):
+        """
+        The number of trading minutes before each interval during which the
+        market is open, followed by the total number of trading minutes.
+
+        This indexes the trading minutes without materializing them; see
+        ``calendar_helpers.compute_minute_offsets``.
+        """
+        return compute_minute_offsets(
+            self._interval_starts,
+            self._interval_ends,
+        )
+
     @lazyval
-    def _minutes_per_session(self):
-        diff = self.schedule.market_close - self.schedule.market_open
-        diff = diff.astype('timedelta64[m]')
-        return diff + 1
+    def _session_minute_offsets(self):
+        """
+        The number of trading minutes before each session, followed by the
+        total number of trading minutes.
+        """
+        return self._minute_offsets[self._session_interval_offsets]
+
+    def _minute_position(self, minute_val, side='left'):
+        # Equivalent to searchsorted(self._trading_minutes_nanos, minute_val).
+        return minute_position(
+            self._interval_starts,
+            self._interval_ends,
+            self._minute_offsets,
+            minute_val,
+            side,
+        )
+
+    def _minutes_in_position_range(self, start_pos, end_pos):
+        # Equivalent to self.all_minutes[start_pos:end_pos].
+        if self._precomputed_minutes is not None:
+            return utc_index(self._precomputed_minutes[start_pos:end_pos])
+
+        return utc_index(
+            minutes_in_position_range(
+                self._interval_starts,
+                self._minute_offsets,
+                start_pos,
+                end_pos,
+            ),
+        )
+
+    @lazyval
+    def _session_bitmap(self):
+        return compute_session_bitmap(self.schedule.index.asi8)
 
     def minutes_count_for_sessions_in_range(self, start_session, end_session):
         """
@@ -231,7 +805,56 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         int: The total number of minutes for the contiguous chunk of sessions.
              between start_session and end_session, inclusive.
         """
-        return int(self._minutes_per_session[start_session:end_session].sum())
+        start_idx, end_idx = self._session_bounds(
+            _nanos(start_session),
+            _nanos(end_session),
+        )
+        if end_idx <= start_idx:
+            return 0
+        offsets = self._session_minute_offsets
+        return offsets.item(end_idx) - offsets.item(start_idx)
+
+    def minutes_counts_for_sessions_in_range(self,
+                                             start_sessions,
+                                             end_sessions):
+        """
+        Vectorized version of ``minutes_count_for_sessions_in_range``.
+
+        Parameters
+        ----------
+        start_sessions : pd.DatetimeIndex or np.ndarray
+            The first session of each range.
+        end_sessions : pd.DatetimeIndex or np.ndarray
+            The last session of each range.
+
+        Returns
+        -------
+        np.ndarray[int64]
+            The total number of minutes of the sessions in each range,
+            inclusive.
+        """
+        start_idxs, end_idxs = self._session_bounds(
+            nanos_array(start_sessions),
+            nanos_array(end_sessions),
+        )
+        offsets = self._session_minute_offsets
+        return np.where(
+            end_idxs > start_idxs,
+            offsets[end_idxs] - offsets[start_idxs],
+            0,
+        )
+
+    def _session_bounds(self, start_nanos, end_nanos):
+        """
+        The position of the first session at or after ``start_nanos`` and one
+        past the last session at or before ``end_nanos``, from the session
+        bitmap's prefix counts. Works on scalars and arrays alike.
+        """
+        bitmap = self._session_bitmap
+        return (
+            bitmap_searchsorted(bitmap, start_nanos),
+            bitmap_searchsorted(bitmap, end_nanos, side='right'),
+        )
 
     @property
     def regular_holidays(self):
@@ -317,7 +940,30 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         bool
             Whether the given dt is a valid session label.
         """
-        return dt in self.schedule.index
+        bitmap = self._session_bitmap
+        day, remainder = divmod(
+            _nanos(dt) - bitmap.first_session,
+            NANOSECONDS_PER_DAY,
+        )
+        if remainder or not 0 <= day < bitmap.num_days:
+            return False
+        return bool((bitmap.bits[day >> 3] >> (7 - (day & 7))) & 1)
+
+    def are_sessions(self, dts):
+        """
+        Vectorized version of ``is_session``.
+
+        Parameters
+        ----------
+        dts : pd.DatetimeIndex or np.ndarray[datetime64[ns] or int64]
+            The dts being tested. Naive datetimes are interpreted as UTC.
+
+        Returns
+        -------
+        np.ndarray[bool]
+            Whether each dt is a valid session label.
+        """
+        return bitmap_contains(self._session_bitmap, nanos_array(dts))
 
     def is_open_on_minute(self, dt):
         """
@@ -333,8 +979,31 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         bool
             Whether the exchange is open on this dt.
         """
-        return is_open(self.market_opens_nanos, self.market_closes_nanos,
-                       dt.value)
+        return self.is_open_on_minute_ns(dt.value)
+
+    def is_open_on_minutes(self, dts):
+        """
+        Given an array of dts, return whether this exchange is open at each.
+
+        Vectorized version of ``is_open_on_minute``.
+
+        Parameters
+        ----------
+        dts: pd.DatetimeIndex or np.ndarray
+            The dts for which to check if this exchange is open. Integer
+            arrays are interpreted as UTC nanoseconds.
+
+        Returns
+        -------
+        np.ndarray[bool]
+            Whether the exchange is open on each dt, suitable for use as a
+            mask.
+        """
+        return are_open(
+            self._interval_starts,
+            self._interval_ends,
+            nanos_array(dts),
+        )
 
     def next_open(self, dt):
         """
@@ -353,8 +1022,7 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp
             The UTC timestamp of the next open.
         """
-        idx = next_divider_idx(self.market_opens_nanos, dt.value)
-        return pd.Timestamp(self.market_opens_nanos[idx], tz='UTC')
+        return pd.Timestamp(self.next_open_ns(dt.value), tz='UTC')
 
     def next_close(self, dt):
         """
@@ -370,8 +1038,7 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp
             The UTC timestamp of the next close.
         """
-        idx = next_divider_idx(self.market_closes_nanos, dt.value)
-        return pd.Timestamp(self.market_closes_nanos[idx], tz='UTC')
+        return pd.Timestamp(self.next_close_ns(dt.value), tz='UTC')
 
     def previous_open(self, dt):
         """
@@ -387,8 +1054,7 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp
             The UTC imestamp of the previous open.
         """
-        idx = previous_divider_idx(self.market_opens_nanos, dt.value)
-        return pd.Timestamp(self.market_opens_nanos[idx], tz='UTC')
+        return pd.Timestamp(self.previous_open_ns(dt.value), tz='UTC')
 
     def previous_close(self, dt):
         """
@@ -404,8 +1070,188 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp
             The UTC timestamp of the previous close.
         """
-        idx = previous_divider_idx(self.market_closes_nanos, dt.value)
-        return pd.Timestamp(self.market_closes_nanos[idx], tz='UTC')
+        return pd.Timestamp(self.previous_close_ns(dt.value), tz='UTC')
+
+    def next_opens(self, dts):
+        """
+        Given an array of dts, returns the next open for each.
+
+        Vectorized version of ``next_open``.
+
+        Parameters
+        ----------
+        dts: pd.DatetimeIndex or np.ndarray
+            The dts for which to get the next opens. Integer arrays are
+            interpreted as UTC nanoseconds.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The UTC timestamps of the next opens.
+        """
+        idxs = next_divider_idxs(self.market_opens_nanos, nanos_array(dts))
+        return DatetimeIndex(self.market_opens_nanos[idxs], tz='UTC')
+
+    def next_closes(self, dts):
+        """
+        Given an array of dts, returns the next close for each.
+
+        Vectorized version of ``next_close``.
+
+        Parameters
+        ----------
+        dts: pd.DatetimeIndex or np.ndarray
+            The dts for which to get the next closes. Integer arrays are
+            interpreted as UTC nanoseconds.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The UTC timestamps of the next closes.
+        """
+        idxs = next_divider_idxs(self.market_closes_nanos, nanos_array(dts))
+        return DatetimeIndex(self.market_closes_nanos[idxs], tz='UTC')
+
+    def previous_opens(self, dts):
+        """
+        Given an array of dts, returns the previous open for each.
+
+        Vectorized version of ``previous_open``.
+
+        Parameters
+        ----------
+        dts: pd.DatetimeIndex or np.ndarray
+            The dts for which to get the previous opens. Integer arrays are
+            interpreted as UTC nanoseconds.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The UTC timestamps of the previous opens.
+        """
+        idxs = previous_divider_idxs(
+            self.market_opens_nanos,
+            nanos_array(dts),
+        )
+        return DatetimeIndex(self.market_opens_nanos[idxs], tz='UTC')
+
+    def previous_closes(self, dts):
+        """
+        Given an array of dts, returns the previous close for each.
+
+        Vectorized version of ``previous_close``.
+
+        Parameters
+        ----------
+        dts: pd.DatetimeIndex or np.ndarray
+            The dts for which to get the previous closes. Integer arrays are
+            interpreted as UTC nanoseconds.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The UTC timestamps of the previous closes.
+        """
+        idxs = previous_divider_idxs(
+            self.market_closes_nanos,
+            nanos_array(dts),
+        )
+        return DatetimeIndex(self.market_closes_nanos[idxs], tz='UTC')
+
+    def is_open_on_minute_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, return whether this exchange is open at it.
+
+        Nanosecond-native version of ``is_open_on_minute``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to check if this exchange
+            is open.
+
+        Returns
+        -------
+        bool
+            Whether the exchange is open on this dt.
+        """
+        return is_open(self._interval_starts, self._interval_ends, dt_ns)
+
+    def next_open_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, returns the next open in nanoseconds.
+
+        Nanosecond-native version of ``next_open``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the next open.
+
+        Returns
+        -------
+        np.int64
+            The next open, in UTC nanoseconds.
+        """
+        idx = next_divider_idx(self.market_opens_nanos, dt_ns)
+        return self.market_opens_nanos[idx]
+
+    def next_close_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, returns the next close in nanoseconds.
+
+        Nanosecond-native version of ``next_close``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the next close.
+
+        Returns
+        -------
+        np.int64
+            The next close, in UTC nanoseconds.
+        """
+        idx = next_divider_idx(self.market_closes_nanos, dt_ns)
+        return self.market_closes_nanos[idx]
+
+    def previous_open_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, returns the previous open in nanoseconds.
+
+        Nanosecond-native version of ``previous_open``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the previous open.
+
+        Returns
+        -------
+        np.int64
+            The previous open, in UTC nanoseconds.
+        """
+        idx = previous_divider_idx(self.market_opens_nanos, dt_ns)
+        return self.market_opens_nanos[idx]
+
+    def previous_close_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, returns the previous close in nanoseconds.
+
+        Nanosecond-native version of ``previous_close``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the previous close.
+
+        Returns
+        -------
+        np.int64
+            The previous close, in UTC nanoseconds.
+        """
+        idx = previous_divider_idx(self.market_closes_nanos, dt_ns)
+        return self.market_closes_nanos[idx]
 
     def next_minute(self, dt):
         """
@@ -422,8 +1268,7 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp
             The next exchange minute.
         """
-        idx = next_divider_idx(self._trading_minutes_nanos, dt.value)
-        return self.all_minutes[idx]
+        return pd.Timestamp(self.next_minute_ns(dt.value), tz='UTC')
 
     def previous_minute(self, dt):
         """
@@ -442,8 +1287,55 @@ class TradingCalendar(with_metaclass(ABCMeta)):
             The previous exchange minute.
         """
 
-        idx = previous_divider_idx(self._trading_minutes_nanos, dt.value)
-        return self.all_minutes[idx]
+        return pd.Timestamp(self.previous_minute_ns(dt.value), tz='UTC')
+
+    def next_minute_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, return the next exchange minute in
+        nanoseconds.
+
+        Nanosecond-native version of ``next_minute``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the next exchange
+            minute.
+
+        Returns
+        -------
+        int
+            The next exchange minute, in UTC nanoseconds.
+        """
+        return next_minute_val(
+            self._interval_starts,
+            self._interval_ends,
+            dt_ns,
+        )
+
+    def previous_minute_ns(self, dt_ns):
+        """
+        Given a dt in nanoseconds, return the previous exchange minute in
+        nanoseconds.
+
+        Nanosecond-native version of ``previous_minute``.
+
+        Parameters
+        ----------
+        dt_ns: int
+            The dt, in UTC nanoseconds, for which to get the previous exchange
+            minute.
+
+        Returns
+        -------
+        int
+            The previous exchange minute, in UTC nanoseconds.
+        """
+        return previous_minute_val(
+            self._interval_starts,
+            self._interval_ends,
+            dt_ns,
+        )
 
     def next_session_label(self, session_label):
         """
@@ -514,9 +1406,10 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.DateTimeIndex
             All the minutes for the given session.
         """
-        return self.minutes_in_range(
-            start_minute=self.schedule.at[session_label, 'market_open'],
-            end_minute=self.schedule.at[session_label, 'market_close'],
+        idx = self.schedule.index.get_loc(session_label)
+        return self._minutes_in_position_range(
+            self._session_minute_offsets[idx],
+            self._session_minute_offsets[idx + 1],
         )
 
     def execution_minutes_for_session(self, session_label):
@@ -554,23 +1447,36 @@ class TradingCalendar(with_metaclass(ABCMeta)):
 
     def minutes_window(self, start_dt, count):
         start_dt_nanos = start_dt.value
-        all_minutes_nanos = self._trading_minutes_nanos
-        start_idx = all_minutes_nanos.searchsorted(start_dt_nanos)
+        num_minutes = self._minute_offsets[-1]
+        start_idx = self._minute_position(start_dt_nanos)
+
+        if start_idx == num_minutes:
+            raise IndexError(
+                "{} is after the last minute of the calendar".format(start_dt)
+            )
 
-        # searchsorted finds the index of the minute **on or after** start_dt.
+        # The position found is that of the minute **on or after** start_dt.
         # If the latter, push back to the prior minute.
-        if all_minutes_nanos[start_idx] != start_dt_nanos:
+        if self._minute_position(start_dt_nanos, side='right') == start_idx:
             start_idx -= 1
 
-        if start_idx < 0 or start_idx >= len(all_minutes_nanos):
+        if start_idx < 0 or start_idx >= num_minutes:
             raise KeyError("Can't start minute window at {}".format(start_dt))
 
         end_idx = start_idx + count
 
         if start_idx > end_idx:
-            return self.all_minutes[(end_idx + 1):(start_idx + 1)]
+            window = slice(end_idx + 1, start_idx + 1)
         else:
-            return self.all_minutes[start_idx:end_idx]
+            window = slice(start_idx, end_idx)
+
+        # Resolve the window as self.all_minutes[window] would, where a
+        # negative position counts back from the last minute.
+        start_pos, end_pos, _ = window.indices(num_minutes)
+        return self._minutes_in_position_range(
+            start_pos,
+            max(end_pos, start_pos),
+        )
 
     def sessions_in_range(self, start_session_label, end_session_label):
         """
@@ -649,10 +1555,9 @@ class TradingCalendar(with_metaclass(ABCMeta)):
                 end_session_label,
                 start_session_label,
             )
-        start_idx = self.all_sessions.searchsorted(start_session_label)
-        end_idx = self.all_sessions.searchsorted(
-            end_session_label,
-            side='right',
+        start_idx, end_idx = self._session_bounds(
+            _nanos(start_session_label),
+            _nanos(end_session_label),
         )
 
         out = end_idx - start_idx
@@ -661,6 +1566,35 @@ class TradingCalendar(with_metaclass(ABCMeta)):
 
         return out
 
+    def session_distances(self, start_session_labels, end_session_labels):
+        """
+        Vectorized version of ``session_distance``.
+
+        Parameters
+        ----------
+        start_session_labels : pd.DatetimeIndex or np.ndarray
+            The labels of the start sessions.
+        end_session_labels : pd.DatetimeIndex or np.ndarray
+            The labels of the ending sessions, inclusive.
+
+        Returns
+        -------
+        np.ndarray[int64]
+            The distance between each pair of sessions, negated where the
+            start session is after the end session.
+        """
+        starts = nanos_array(start_session_labels)
+        ends = nanos_array(end_session_labels)
+
+        negate = ends < starts
+        start_idxs, end_idxs = self._session_bounds(
+            np.where(negate, ends, starts),
+            np.where(negate, starts, ends),
+        )
+
+        out = end_idxs - start_idxs
+        return np.where(negate, -out, out)
+
     def minutes_in_range(self, start_minute, end_minute):
         """
         Given start and end minutes, return all the calendar minutes
@@ -681,17 +1615,19 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.DatetimeIndex
             The minutes in the desired range.
         """
-        start_idx = searchsorted(self._trading_minutes_nanos,
-                                 start_minute.value)
+        start_idx = self._minute_position(start_minute.value)
 
-        end_idx = searchsorted(self._trading_minutes_nanos,
-                               end_minute.value)
+        if self._minute_position(end_minute.value) == self._minute_offsets[-1]:
+            raise IndexError(
+                "{} is after the last minute of the calendar".format(
+                    end_minute,
+                )
+            )
 
-        if end_minute.value == self._trading_minutes_nanos[end_idx]:
-            # if the end minute is a market minute, increase by 1
-            end_idx += 1
+        # side='right' includes the end minute if it is a market minute
+        end_idx = self._minute_position(end_minute.value, side='right')
 
-        return self.all_minutes[start_idx:end_idx]
+        return self._minutes_in_position_range(start_idx, end_idx)
 
     def minutes_for_sessions_in_range(self,
                                       start_session_label,
@@ -791,20 +1727,8 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         """
         Returns a DatetimeIndex representing all the minutes in this calendar.
         """
-        opens_in_ns = self._opens.values.astype(
-            'datetime64[ns]',
-        ).view('int64')
-
-        closes_in_ns = self._closes.values.astype(
-            'datetime64[ns]',
-        ).view('int64')
+        return utc_index(self._trading_minutes_nanos)
 
-        return DatetimeIndex(
-            compute_all_minutes(opens_in_ns, closes_in_ns),
-            tz='utc',
-        )
-
-    @preprocess(dt=coerce(pd.Timestamp, attrgetter('value')))
     def minute_to_session_label(self, dt, direction="next"):
         """
         Given a minute, get the label of its containing session.
@@ -829,15 +1753,57 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         pd.Timestamp (midnight UTC)
             The label of the containing session.
         """
-        if direction == "next":
-            try:
-                return self._minute_to_session_label_cache[dt]
-            except KeyError:
-                pass
+        if isinstance(dt, pd.Timestamp):
+            dt = dt.value
+
+        return self.minute_to_session_label_ns(dt, direction)
+
+    def minute_to_session_label_ns(self, dt_ns, direction="next"):
+        """
+        Given a minute in nanoseconds, get the label of its containing session.
+
+        Nanosecond-native version of ``minute_to_session_label``.
+
+        Parameters
+        ----------
+        dt_ns : int
+            The dt, in UTC nanoseconds, for which to get the containing
+            session.
+
+        direction: str
+            "next", "previous" or "none"; see ``minute_to_session_label``.
+
+        Returns
+        -------
+        pd.Timestamp (midnight UTC)
+            The label of the containing session.
+        """
+        dt = dt_ns
+        try:
+            return self._minute_to_session_label_cache.get(dt, direction)
+        except KeyError:
+            pass
 
         idx = searchsorted(self.market_closes_nanos, dt)
         current_or_next_session = self.schedule.index[idx]
-        self._minute_to_session_label_cache[dt] = current_or_next_session
+
+        # The part of the session, before or after its break, that contains
+        # or follows dt.
+        open_val = self.market_opens_nanos[idx]
+        close_val = self.market_closes_nanos[idx]
+        break_start = self.break_starts_nanos[idx]
+        if break_start != NAT_NANOS:
+            if dt <= break_start:
+                close_val = break_start
+            else:
+                open_val = self.break_ends_nanos[idx]
+
+        self._minute_to_session_label_cache.set(
+            dt,
+            current_or_next_session,
+            open_val,
+            close_val,
+        )
 
         if direction == "next":
             return current_or_next_session
@@ -847,8 +1813,7 @@ class TradingCalendar(with_metaclass(ABCMeta)):
                 # if the exchange is closed, use the previous session
                 return self.schedule.index[idx - 1]
         elif direction == "none":
-            if not is_open(self.market_opens_nanos, self.market_closes_nanos,
-                           dt):
+            if dt < open_val:
                 # if the exchange is closed, blow up
                 raise ValueError("The given dt is not an exchange minute!")
         else:
@@ -858,6 +1823,78 @@ class TradingCalendar(with_metaclass(ABCMeta)):
 
         return current_or_next_session
 
+    def configure_minute_to_session_label_cache(self,
+                                                size=1,
+                                                session_range=False):
+        """
+        Replace the cache used by ``minute_to_session_label``.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of recently requested minutes to remember. 0 disables
+            the per-minute cache. Default is 1.
+        session_range : bool, optional
+            If True, also remember the open and close of the last resolved
+            session, so that any minute within it is answered immediately.
+            Default is False.
+        """
+        self._minute_to_session_label_cache = MinuteToSessionLabelCache(
+            size=size,
+            session_range=session_range,
+        )
+
+    def minute_to_session_label_cache_info(self):
+        """
+        Statistics for the cache used by ``minute_to_session_label``.
+
+        Returns
+        -------
+        CacheInfo
+            A namedtuple of the hits, misses, size and session_range of the
+            cache.
+        """
+        return self._minute_to_session_label_cache.info()
+
+    def minutes_to_session_labels(self, dts, direction="next"):
+        """
+        Given an array of minutes, get the labels of their containing sessions.
+
+        Vectorized version of ``minute_to_session_label``. Unlike
+        ``minute_index_to_session_labels``, the minutes need not be sorted or
+        market minutes.
+
+        Parameters
+        ----------
+        dts : pd.DatetimeIndex or np.ndarray
+            The dts for which to get the containing sessions. Integer arrays
+            are interpreted as UTC nanoseconds.
+
+        direction: str
+            "next" (default) means that if a dt is not part of a session, the
+            label of the next session is used.
+
+            "previous" means that if a dt is not part of a session, the label
+            of the previous session is used.
+
+            "none" means that a ValueError will be raised if any dt is not
+            part of a session.
+
+        Returns
+        -------
+        pd.DatetimeIndex (midnight UTC)
+            The label of the containing session for each dt.
+        """
+        idxs = minute_to_session_idxs(
+            self.market_opens_nanos,
+            self.market_closes_nanos,
+            nanos_array(dts),
+            direction,
+            self.break_starts_nanos,
+            self.break_ends_nanos,
+        )
+        return self.schedule.index[idxs]
+
     def minute_index_to_session_labels(self, index):
         """
         Given a sorted DatetimeIndex of market minutes, return a
@@ -983,6 +2020,141 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         )
 
 
+def rules_busdaycalendar(weekmask,
+                         adhoc_holidays,
+                         regular_holidays,
+                         start,
+                         end):
+    """
+    Build a numpy.busdaycalendar from a calendar's holiday rules.
+
+    Parameters
+    ----------
+    weekmask : str
+        The days of the week that are sessions, as in ``np.busdaycalendar``.
+    adhoc_holidays : list[pd.Timestamp]
+        The ad hoc holidays.
+    regular_holidays : HolidayCalendar or None
+        The regular holiday rules.
+    start : datetime-like
+        The first day on which to evaluate ``regular_holidays``.
+    end : datetime-like
+        The last day on which to evaluate ``regular_holidays``.
+
+    Returns
+    -------
+    busdaycalendar : np.busdaycalendar
+    """
+    holidays = [days_array(adhoc_holidays)]
+    if regular_holidays is not None:
+        # The rules are cached by naive date range, whatever the timezone of
+        # the requested one.
+        start, end = (pd.Timestamp(day) for day in days_array([start, end]))
+        holidays.append(days_array(regular_holidays.holidays(start, end)))
+    return np.busdaycalendar(
+        weekmask=weekmask,
+        holidays=np.concatenate(holidays),
+    )
+
+
+# Pickled calendars store their session labels as int32 days, and their
+# opens, closes and breaks as int32 seconds after their session's label,
+# rather than as int64 nanoseconds. Arrays that don't fit are kept as-is.
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+_NANOSECONDS_PER_SECOND = 10 ** 9
+
+
+def _pack_days(nanos):
+    days, remainder = np.divmod(nanos, NANOSECONDS_PER_DAY)
+    if remainder.any() or \
+            not ((days >= _INT32_MIN) & (days <= _INT32_MAX)).all():
+        return nanos
+    return days.astype(np.int32)
+
+
+def _unpack_days(values):
+    if values.dtype == np.int64:
+        return values
+    return values.astype(np.int64) * NANOSECONDS_PER_DAY
+
+
+def _pack_seconds(nanos, sessions):
+    # NaTs are stored as the smallest int32.
+    missing = nanos == NAT_NANOS
+    seconds, remainder = np.divmod(
+        np.where(missing, sessions, nanos) - sessions,
+        _NANOSECONDS_PER_SECOND,
+    )
+    if remainder.any() or \
+            not ((seconds > _INT32_MIN) & (seconds <= _INT32_MAX)).all():
+        return nanos
+    seconds[missing] = _INT32_MIN
+    return seconds.astype(np.int32)
+
+
+def _unpack_seconds(values, sessions):
+    if values.dtype == np.int64:
+        return values
+    nanos = values.astype(np.int64) * _NANOSECONDS_PER_SECOND + sessions
+    nanos[values == _INT32_MIN] = NAT_NANOS
+    return nanos
+
+
+def _pack_schedule(arrays):
+    """
+    Pack the arrays returned by ``TradingCalendar._schedule_arrays`` for
+    pickling. Breaks and early closes are left out when there are none.
+    """
+    sessions = arrays['sessions']
+    packed = {
+        'sessions': _pack_days(sessions),
+        'opens': _pack_seconds(arrays['opens'], sessions),
+        'closes': _pack_seconds(arrays['closes'], sessions),
+    }
+    if (arrays['break_starts'] != NAT_NANOS).any():
+        for name in ('break_starts', 'break_ends'):
+            packed[name] = _pack_seconds(arrays[name], sessions)
+    if len(arrays['early_closes']):
+        packed['early_closes'] = _pack_days(arrays['early_closes'])
+    return packed
+
+
+def _unpack_schedule(packed):
+    """
+    The inverse of ``_pack_schedule``.
+    """
+    sessions = _unpack_days(packed['sessions'])
+    arrays = {
+        'sessions': sessions,
+        'early_closes': _unpack_days(
+            packed.get('early_closes', np.array([], dtype=np.int64)),
+        ),
+    }
+    for name in ('opens', 'closes', 'break_starts', 'break_ends'):
+        if name in packed:
+            arrays[name] = _unpack_seconds(packed[name], sessions)
+    return arrays
+
+
+def _rebuild_calendar(calendar_type,
+                      packed,
+                      minute_to_session_label_cache_size,
+                      minute_to_session_label_session_range,
+                      rule_attributes=None):
+    """
+    Unpickle a TradingCalendar; see ``TradingCalendar.__reduce__``.
+    """
+    calendar = calendar_type._from_schedule_arrays(_unpack_schedule(packed))
+    for name, value in (rule_attributes or {}).items():
+        setattr(calendar, name, value)
+    calendar.configure_minute_to_session_label_cache(
+        size=minute_to_session_label_cache_size,
+        session_range=minute_to_session_label_session_range,
+    )
+    return calendar
+
+
 def scheduled_special_times(calendar, start, end, time, tz):
     """
     Returns a Series mapping each holiday (as a UTC midnight Timestamp)
@@ -1035,3 +2207,51 @@ def _overwrite_special_dates(midnight_utcs,
 class HolidayCalendar(AbstractHolidayCalendar):
     def __init__(self, rules):
         super(HolidayCalendar, self).__init__(rules=rules)
+
+    def holidays(self, start=None, end=None, return_name=False):
+        """
+        Returns the holidays between start and end, inclusive.
+
+        The dates of each rule are read from the process-wide holiday cache,
+        so rules shared with other calendars are only evaluated once per year.
+        The combined holidays are memoized, so later requests within the same
+        range only slice them.
+
+        Parameters
+        ----------
+        start : datetime-like, optional
+        end : datetime-like, optional
+        return_name : bool, optional
+            If True, return a Series mapping the holidays to their names.
+            Otherwise, return a DatetimeIndex.
+        """
+        if start is None:
+            start = AbstractHolidayCalendar.start_date
+        if end is None:
+            end = AbstractHolidayCalendar.end_date
+        start = pd.Timestamp(start)
+        end = pd.Timestamp(end)
+
+        cached = self._cache
+        if (cached is None or
+                cached[0].tz != start.tz or
+                start < cached[0] or
+                end > cached[1]):
+            holidays = [
+                holiday_dates(rule, start, end, return_name=True)
+                for rule in self.rules
+            ]
+            if holidays:
+                holidays = pd.concat(holidays).sort_index()
+            else:
+                holidays = pd.Series(
+                    index=pd.DatetimeIndex([], tz=start.tz),
+                    dtype=object,
+                )
+            self._cache = cached = (start, end, holidays)
+
+        holidays = cached[2][start:end]
+
+        if return_name:
+            return holidays
+        return holidays.index
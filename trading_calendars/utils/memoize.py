@@ -54,3 +54,59 @@ class lazyval(object):
 
     def __delitem__(self, instance):
         del self._cache[instance]
+
+    def __contains__(self, instance):
+        return instance in self._cache
+
+
+class classlazyval(object):
+    """Decorator that marks that an attribute of an instance should not be
+    computed until needed, and that the value should be memoized once for all
+    instances of the same class.
+
+    The value is computed from the first instance it is requested on, so it
+    must only depend on attributes shared by every instance of the class.
+
+    Example
+    -------
+
+    >>> class C(object):
+    ...     count = 0
+    ...     @classlazyval
+    ...     def val(self):
+    ...         type(self).count += 1
+    ...         return "val"
+    ...
+    >>> C().val, C.count
+    ('val', 1)
+    >>> C().val, C.count
+    ('val', 1)
+    >>> class D(C):
+    ...     pass
+    ...
+    >>> D().val, D.count
+    ('val', 2)
+    """
+    def __init__(self, get):
+        self._get = get
+        self._cache = WeakKeyDictionary()
+        self.__doc__ = get.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        cls = type(instance)
+        try:
+            return self._cache[cls]
+        except KeyError:
+            self._cache[cls] = val = self._get(instance)
+            return val
+
+    def __set__(self, instance, value):
+        raise AttributeError("Can't set read-only attribute.")
+
+    def __delitem__(self, cls):
+        del self._cache[cls]
+
+    def __contains__(self, cls):
+        return cls in self._cache
@@ -1,6 +1,12 @@
 import numpy as np
 import pandas as pd
 
+try:
+    from pandas.arrays import DatetimeArray
+except ImportError:
+    # pandas < 0.24
+    DatetimeArray = None
+
 
 def days_at_time(days, t, tz, day_offset=0):
     """
@@ -47,6 +53,89 @@ def days_at_time(days, t, tz, day_offset=0):
     return (days + delta).tz_localize(tz).tz_convert('UTC')
 
 
+def nanos_array(dts):
+    """
+    Coerce an array of datetimes to an int64 array of UTC nanoseconds.
+
+    Parameters
+    ----------
+    dts : pd.DatetimeIndex, pd.Series, np.ndarray or list
+        The datetimes to coerce. Naive datetimes are interpreted as UTC, and
+        integer arrays are assumed to already be nanoseconds since the epoch.
+
+    Returns
+    -------
+    nanos : np.ndarray[int64]
+        The nanoseconds since the epoch of each datetime in ``dts``.
+    """
+    if isinstance(dts, (pd.Series, pd.Index)):
+        # .values of tz-aware data is UTC datetime64[ns].
+        dts = dts.values
+
+    dts = np.asarray(dts)
+    if dts.dtype.kind in 'iu':
+        return dts.astype(np.int64, copy=False)
+    if dts.dtype.kind != 'M':
+        # e.g. an object array of Timestamps
+        dts = pd.DatetimeIndex(dts).values
+
+    return dts.astype('datetime64[ns]', copy=False).view(np.int64)
+
+
+def utc_index(nanos):
+    """
+    Wrap an int64 array of UTC nanoseconds in a DatetimeIndex without copying
+    it.
+
+    Parameters
+    ----------
+    nanos : np.ndarray[int64]
+        The nanoseconds since the epoch. Memory-mapped arrays stay mapped.
+
+    Returns
+    -------
+    index : pd.DatetimeIndex
+        A UTC index sharing memory with ``nanos``. Before pandas 0.24, which
+        has no public way to wrap tz-aware values, the index is a copy.
+    """
+    if DatetimeArray is None:
+        return pd.DatetimeIndex(nanos.view('datetime64[ns]'), tz='UTC')
+
+    return pd.DatetimeIndex(
+        DatetimeArray(
+            nanos.view('datetime64[ns]'),
+            dtype=pd.DatetimeTZDtype(tz='UTC'),
+            copy=False,
+        ),
+    )
+
+
+def days_array(dts):
+    """
+    Coerce an array of datetimes to a datetime64[D] array of their dates.
+
+    Parameters
+    ----------
+    dts : pd.DatetimeIndex or iterable[datetime-like]
+        The datetimes to coerce. Tz-aware datetimes are taken at their UTC
+        date, and naive datetimes at their own date.
+
+    Returns
+    -------
+    days : np.ndarray[datetime64[D]]
+        The date of each datetime in ``dts``.
+    """
+    if isinstance(dts, pd.DatetimeIndex):
+        nanos = dts.asi8
+    else:
+        # Lists of holidays may mix naive and tz-aware Timestamps.
+        nanos = np.array(
+            [pd.Timestamp(dt).value for dt in dts],
+            dtype=np.int64,
+        )
+    return nanos.view('datetime64[ns]').astype('datetime64[D]')
+
+
 def vectorized_sunday_to_monday(dtix):
     """A vectorized implementation of
     :func:`pandas.tseries.holiday.sunday_to_monday`.